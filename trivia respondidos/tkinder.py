@@ -2,8 +2,13 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import json
 import random
+import sys
 from pathlib import Path
 
+# El compilador de registros vive junto a la app principal (tu_proyecto_quiz/registros.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tu_proyecto_quiz"))
+from registros import compilar_archivo_trivia
+
 
 class QuizApp:
     def __init__(self, root):
@@ -18,7 +23,7 @@ class QuizApp:
         self.current_questions = []
         self.current_question_index = 0
         self.score = 0
-        self.selected_answer = tk.StringVar()
+        self.selected_answer = tk.IntVar(value=-1)  # Índice de la opción elegida (-1 = ninguna)
         
         # Cargar todas las categorías
         self.load_categories()
@@ -38,7 +43,8 @@ class QuizApp:
                 with open(file_path, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                     category_key = json_file.replace('.json', '')
-                    self.categories[category_key] = data
+                    # Cada pregunta queda con "indiceCorrecto" para comparar por índice
+                    self.categories[category_key] = compilar_archivo_trivia(data)
             except FileNotFoundError:
                 messagebox.showerror("Error", f"No se encontró el archivo {json_file}")
             except json.JSONDecodeError:
@@ -159,7 +165,7 @@ class QuizApp:
     def show_question(self):
         """Muestra la pregunta actual"""
         self.clear_window()
-        self.selected_answer.set("")
+        self.selected_answer.set(-1)
         
         if self.current_question_index >= len(self.current_questions):
             self.show_results()
@@ -211,7 +217,7 @@ class QuizApp:
         
         question_label = tk.Label(
             question_frame,
-            text=question_data['question'],
+            text=question_data['pregunta'],
             font=("Arial", 20, "bold"),
             fg="#ffffff",
             bg="#2d2d44",
@@ -224,12 +230,12 @@ class QuizApp:
         options_frame = tk.Frame(main_frame, bg="#1a1a2e")
         options_frame.pack(fill="both", expand=True)
         
-        for i, option in enumerate(question_data['options']):
+        for i, option in enumerate(question_data['opciones']):
             option_button = tk.Radiobutton(
                 options_frame,
                 text=option,
                 variable=self.selected_answer,
-                value=option,
+                value=i,
                 font=("Arial", 16),
                 fg="#ffffff",
                 bg="#2d2d44",
@@ -279,19 +285,19 @@ class QuizApp:
     
     def check_answer(self):
         """Verifica la respuesta seleccionada"""
-        if not self.selected_answer.get():
+        if self.selected_answer.get() < 0:
             messagebox.showwarning("Atención", "Por favor selecciona una respuesta")
             return
         
         question_data = self.current_questions[self.current_question_index]
         
-        if self.selected_answer.get() == question_data['correct']:
+        if self.selected_answer.get() == question_data['indiceCorrecto']:
             self.score += 1
             messagebox.showinfo("¡Correcto!", "¡Respuesta correcta! 🎉")
         else:
             messagebox.showinfo(
                 "Incorrecto",
-                f"Respuesta incorrecta.\nLa respuesta correcta era: {question_data['correct']}"
+                f"Respuesta incorrecta.\nLa respuesta correcta era: {question_data['respuestaCorrecta']}"
             )
         
         self.current_question_index += 1
@@ -0,0 +1,271 @@
+"""
+RESPONDIDOS - ANALÍTICA DEL CONTENIDO DE LOS BANCOS (CON NUMPY)
+Pasa todas las preguntas a columnas (arreglos de NumPy, una fila por pregunta) y calcula:
+- distribución del largo de las preguntas y de las opciones (percentiles e histograma)
+- balance de la posición de la respuesta correcta (cuántas veces está en la opción 0, 1, 2 o 3)
+- sesgo de largo: si la respuesta correcta suele ser la opción más larga (una pista involuntaria)
+- histogramas y balance por categoría
+Todo el análisis son operaciones sobre arreglos: un millón de preguntas se analiza en una fracción de segundo
+(leer los JSON y armar las columnas es lo que más tarda, ver benchmarks/bench_analitica.py).
+
+Uso: python analitica.py [--json informe.json] [archivos o carpetas...]
+Sin argumentos analiza tu_proyecto_quiz/ y trivia respondidos/. Necesita numpy (pip install numpy).
+"""
+
+# IMPORTACIONES
+import argparse  # Para las opciones de la línea de comandos
+import json  # Para exportar el informe
+import os  # Para rutas de archivos
+import sys  # Para el código de salida
+from bancos import CARPETA_BANCOS, MAPA_ARCHIVOS
+from duplicados import CARPETAS_POR_DEFECTO, archivos_de_banco, leer_apariciones
+from registros import CLAVE_INDICE
+from validacion import CANTIDAD_OPCIONES
+
+try:
+    import numpy as np  # Dependencia opcional: solo la usa esta herramienta
+except ImportError:
+    np = None
+
+# TRAMOS DE LOS HISTOGRAMAS DE LARGO (caracteres): [0, 20), [20, 40), ..., [200, ∞)
+ANCHO_TRAMO = 20
+CANTIDAD_TRAMOS = 11
+BORDES_LARGO = tuple(range(0, ANCHO_TRAMO * CANTIDAD_TRAMOS, ANCHO_TRAMO))
+
+# CHI CUADRADO CRÍTICO con 3 grados de libertad al 5%: por encima, las posiciones no están equilibradas
+CHI2_CRITICO = 7.815
+
+PERCENTILES = (10, 25, 50, 75, 90, 99)
+
+
+# FUNCIÓN: largo de un texto (0 si falta o no es texto)
+def largo(texto):
+    return len(texto) if isinstance(texto, str) else 0
+
+
+# FUNCIÓN: pasa las preguntas de cada categoría a columnas
+def extraer_columnas(preguntas_por_categoria):
+    """
+    preguntas_por_categoria: {categoría: [registros compilados]}.
+    Devuelve {"categorias": [nombres], "categoria", "largo_pregunta", "indice_correcto",
+    "cantidad_opciones", "largo_opciones", "inicio_opciones"}: arreglos de una fila por pregunta,
+    salvo largo_opciones, que tiene todas las opciones seguidas (la pregunta i empieza en inicio_opciones[i]).
+    """
+    categorias = list(preguntas_por_categoria)
+    partes = {"categoria": [], "largo_pregunta": [], "indice_correcto": [], "cantidad_opciones": [],
+              "largo_opciones": []}
+    for numero, preguntas in enumerate(preguntas_por_categoria.values()):
+        n = len(preguntas)
+        partes["categoria"].append(np.full(n, numero, dtype=np.int32))
+        partes["largo_pregunta"].append(np.fromiter((largo(p.get("pregunta")) for p in preguntas), np.int32, n))
+        partes["indice_correcto"].append(np.fromiter((p.get(CLAVE_INDICE, -1) for p in preguntas), np.int32, n))
+        opciones = [p.get("opciones") or () for p in preguntas]
+        partes["cantidad_opciones"].append(np.fromiter(map(len, opciones), np.int32, n))
+        partes["largo_opciones"].append(np.fromiter((largo(o) for lista in opciones for o in lista), np.int32))
+
+    columnas = {clave: np.concatenate(lista) if lista else np.zeros(0, np.int32) for clave, lista in partes.items()}
+    columnas["inicio_opciones"] = np.concatenate(([0], np.cumsum(columnas["cantidad_opciones"])[:-1])).astype(np.int64)
+    columnas["categorias"] = categorias
+    return columnas
+
+
+# FUNCIÓN: número de tramo de BORDES_LARGO de cada valor (el último tramo junta todo lo más largo)
+def tramos(valores):
+    return np.minimum(valores // ANCHO_TRAMO, CANTIDAD_TRAMOS - 1)
+
+
+# FUNCIÓN: resumen de una distribución de largos
+def distribucion(valores):
+    """
+    Los largos son enteros chicos: se cuentan una vez con bincount y todo (promedio, desvío,
+    percentiles, histograma) sale de esos conteos, sin ordenar el arreglo.
+    Los percentiles son el menor largo que alcanza ese porcentaje de las preguntas.
+    """
+    if valores.size == 0:
+        return {"cantidad": 0}
+    conteo = np.bincount(valores)
+    largos = np.arange(conteo.size)
+    total = int(valores.size)
+    promedio = float(conteo @ largos) / total
+    acumulado = np.cumsum(conteo)
+    posiciones = np.searchsorted(acumulado, np.ceil(np.array(PERCENTILES) / 100 * total), side="left")
+    return {
+        "cantidad": total,
+        "minimo": int(np.flatnonzero(conteo)[0]),
+        "maximo": int(conteo.size - 1),
+        "promedio": round(promedio, 2),
+        "desvio": round(float(np.sqrt(conteo @ (largos - promedio) ** 2 / total)), 2),
+        "percentiles": {f"p{p}": int(v) for p, v in zip(PERCENTILES, posiciones)},
+        "histograma": np.bincount(tramos(largos), weights=conteo, minlength=CANTIDAD_TRAMOS).astype(np.int64).tolist(),
+    }
+
+
+# FUNCIÓN: balance de posiciones de la respuesta correcta a partir de sus conteos
+def balance_posiciones(conteos):
+    total = int(conteos.sum())
+    if not total:
+        return {"conteos": conteos.tolist(), "proporciones": [], "chi2": None, "equilibrado": None}
+    esperado = total / len(conteos)
+    chi2 = float(((conteos - esperado) ** 2 / esperado).sum())
+    return {
+        "conteos": conteos.tolist(),
+        "proporciones": [round(float(c) / total, 4) for c in conteos],
+        "chi2": round(chi2, 2),
+        "equilibrado": chi2 < CHI2_CRITICO,
+    }
+
+
+# FUNCIÓN: calcula el informe completo sobre las columnas
+def analizar_columnas(columnas):
+    """
+    Devuelve un diccionario serializable a JSON. El balance de posiciones y el sesgo de largo
+    solo consideran las preguntas con exactamente 4 opciones y respuesta entre las opciones.
+    """
+    categorias = columnas["categorias"]
+    cantidad_categorias = len(categorias)
+    categoria = columnas["categoria"]
+    largo_pregunta = columnas["largo_pregunta"]
+    indice = columnas["indice_correcto"]
+
+    # Preguntas "completas": 4 opciones y respuesta correcta entre ellas
+    completas = (columnas["cantidad_opciones"] == CANTIDAD_OPCIONES) & (indice >= 0)
+    filas = np.flatnonzero(completas)
+    posicion = indice[filas]
+    inicio = columnas["inicio_opciones"][filas]
+    # Una columna por opción (con 4 columnas sueltas las operaciones son más rápidas que por filas de 4)
+    opciones = [columnas["largo_opciones"][inicio + j] for j in range(CANTIDAD_OPCIONES)]
+    largo_correcta = columnas["largo_opciones"][inicio + posicion]
+    maximo = np.maximum.reduce(opciones) if filas.size else np.zeros(0, np.int32)
+    minimo = np.minimum.reduce(opciones) if filas.size else np.zeros(0, np.int32)
+    es_mas_larga = largo_correcta == maximo
+    unica_mas_larga = es_mas_larga & (sum(o == maximo for o in opciones) == 1)
+    es_mas_corta = largo_correcta == minimo
+    promedio_opciones = sum(opciones) / CANTIDAD_OPCIONES
+    razon = np.divide(largo_correcta, promedio_opciones, out=np.ones(filas.size), where=promedio_opciones > 0)
+
+    # Conteos por categoría con un solo bincount (categoría * ancho + valor)
+    cat_completas = categoria[filas]
+    por_posicion = np.bincount(cat_completas * CANTIDAD_OPCIONES + posicion,
+                               minlength=cantidad_categorias * CANTIDAD_OPCIONES)
+    por_posicion = por_posicion.reshape(cantidad_categorias, CANTIDAD_OPCIONES)
+    por_tramo = np.bincount(categoria * CANTIDAD_TRAMOS + tramos(largo_pregunta),
+                            minlength=cantidad_categorias * CANTIDAD_TRAMOS)
+    por_tramo = por_tramo.reshape(cantidad_categorias, CANTIDAD_TRAMOS)
+    cantidad_por_categoria = np.bincount(categoria, minlength=cantidad_categorias)
+    suma_largos = np.bincount(categoria, weights=largo_pregunta, minlength=cantidad_categorias)
+    completas_por_categoria = np.bincount(cat_completas, minlength=cantidad_categorias)
+    mas_larga_por_categoria = np.bincount(cat_completas, weights=unica_mas_larga, minlength=cantidad_categorias)
+
+    por_categoria = {}
+    for i, nombre in enumerate(categorias):
+        cantidad = int(cantidad_por_categoria[i])
+        por_categoria[nombre] = {
+            "cantidad": cantidad,
+            "largo_promedio": round(float(suma_largos[i]) / cantidad, 2) if cantidad else 0,
+            "histograma_largo": por_tramo[i].tolist(),
+            "posicion_respuesta": balance_posiciones(por_posicion[i]),
+            "correcta_unica_mas_larga": (round(float(mas_larga_por_categoria[i]) / int(completas_por_categoria[i]), 4)
+                                         if completas_por_categoria[i] else None),
+        }
+
+    def proporcion(mascara):
+        return round(float(mascara.mean()), 4) if mascara.size else None
+
+    return {
+        "total_preguntas": int(largo_pregunta.size),
+        "preguntas_completas": int(filas.size),
+        "bordes_histograma": list(BORDES_LARGO),
+        "largo_preguntas": distribucion(largo_pregunta),
+        "largo_opciones": distribucion(columnas["largo_opciones"]),
+        "posicion_respuesta": balance_posiciones(np.bincount(posicion, minlength=CANTIDAD_OPCIONES)),
+        "sesgo_largo": {
+            "correcta_es_la_mas_larga": proporcion(es_mas_larga),  # Incluye empates
+            "correcta_unica_mas_larga": proporcion(unica_mas_larga),  # Al azar sería cerca de 0.25
+            "correcta_es_la_mas_corta": proporcion(es_mas_corta),
+            "razon_largo_promedio": round(float(razon.mean()), 4) if razon.size else None,  # Correcta / promedio de las 4
+        },
+        "por_categoria": por_categoria,
+    }
+
+
+# FUNCIÓN: lee los bancos de archivos o carpetas, agrupando las preguntas por categoría
+def leer_bancos(entradas):
+    """
+    La categoría de cada archivo es su nombre en MAPA_ARCHIVOS (bancos de quiz-app.py),
+    el "name" del envoltorio (bancos de trivia) o el nombre del archivo.
+    Incluye las preguntas del diario. Los archivos sin preguntas no se listan.
+    """
+    nombres = {os.path.join(CARPETA_BANCOS, archivo): categoria for categoria, archivo in MAPA_ARCHIVOS.items()}
+    preguntas_por_categoria = {}
+    for entrada in entradas:
+        for ruta in archivos_de_banco(entrada) if os.path.isdir(entrada) else [entrada]:
+            registros = [registro for _, registro in leer_apariciones(ruta)]
+            if not registros:
+                continue
+            categoria = (nombres.get(os.path.abspath(ruta)) or registros[0].get("categoria")
+                         or os.path.splitext(os.path.basename(ruta))[0])
+            preguntas_por_categoria.setdefault(categoria, []).extend(registros)
+    return preguntas_por_categoria
+
+
+# FUNCIÓN: barra de texto para los histogramas de la consola
+def barra(valor, maximo, ancho=30):
+    return "█" * round(ancho * valor / maximo) if maximo else ""
+
+
+# FUNCIÓN: imprime el informe en la consola
+def imprimir_informe(informe):
+    print(f"{informe['total_preguntas']} preguntas ({informe['preguntas_completas']} con 4 opciones y respuesta válida)")
+    for titulo, clave in (("Largo de las preguntas", "largo_preguntas"), ("Largo de las opciones", "largo_opciones")):
+        d = informe[clave]
+        if not d["cantidad"]:
+            continue
+        p = d["percentiles"]
+        print(f"\n{titulo}: promedio {d['promedio']}, desvío {d['desvio']}, mínimo {d['minimo']}, máximo {d['maximo']}")
+        print("  " + "  ".join(f"{k}={v:g}" for k, v in p.items()))
+        maximo = max(d["histograma"])
+        for borde, cantidad in zip(informe["bordes_histograma"], d["histograma"]):
+            print(f"  {borde:>4}+ {cantidad:>8} {barra(cantidad, maximo)}")
+
+    balance = informe["posicion_respuesta"]
+    print("\nPosición de la respuesta correcta: " +
+          "  ".join(f"{i}: {c} ({p:.1%})" for i, (c, p) in enumerate(zip(balance["conteos"], balance["proporciones"]))))
+    if balance["chi2"] is not None:
+        print(f"  chi² = {balance['chi2']} ({'equilibrado' if balance['equilibrado'] else 'DESEQUILIBRADO'} al 5%)")
+
+    sesgo = informe["sesgo_largo"]
+    if sesgo["correcta_unica_mas_larga"] is not None:
+        print(f"\nLa correcta es la opción más larga: {sesgo['correcta_es_la_mas_larga']:.1%} "
+              f"(única más larga: {sesgo['correcta_unica_mas_larga']:.1%}, al azar ~25%)")
+        print(f"La correcta es la opción más corta: {sesgo['correcta_es_la_mas_corta']:.1%}")
+        print(f"Largo de la correcta / promedio de las opciones: {sesgo['razon_largo_promedio']}")
+
+    print(f"\n{'Categoría':<22}{'Preguntas':>10}{'Largo':>8}  {'Posiciones 0/1/2/3':<24}{'Más larga':>10}")
+    for nombre, c in informe["por_categoria"].items():
+        posiciones = "/".join(str(x) for x in c["posicion_respuesta"]["conteos"])
+        if c["posicion_respuesta"]["equilibrado"] is False:
+            posiciones += " !"
+        mas_larga = f"{c['correcta_unica_mas_larga']:.0%}" if c["correcta_unica_mas_larga"] is not None else "-"
+        print(f"{nombre[:21]:<22}{c['cantidad']:>10}{c['largo_promedio']:>8}  {posiciones:<24}{mas_larga:>10}")
+
+
+# === EJECUCIÓN DESDE LA LÍNEA DE COMANDOS ===
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Analiza el contenido de los bancos de preguntas (requiere numpy).")
+    parser.add_argument("entradas", nargs="*", default=list(CARPETAS_POR_DEFECTO))
+    parser.add_argument("--json", metavar="ARCHIVO", help="guarda el informe en JSON ('-' para la salida estándar)")
+    argumentos = parser.parse_args()
+
+    if np is None:
+        print("Esta herramienta necesita numpy: pip install numpy")
+        sys.exit(2)
+
+    informe = analizar_columnas(extraer_columnas(leer_bancos(argumentos.entradas)))
+    if argumentos.json == "-":
+        json.dump(informe, sys.stdout, ensure_ascii=False, indent=2)
+    else:
+        imprimir_informe(informe)
+        if argumentos.json:
+            with open(argumentos.json, "w", encoding="utf-8") as f:
+                json.dump(informe, f, ensure_ascii=False, indent=2)
@@ -0,0 +1,179 @@
+"""
+RESPONDIDOS - BANCO DE PREGUNTAS EN FORMATO BINARIO CON ACCESO ALEATORIO (mmap)
+Para sacar 10 preguntas no hace falta tener el banco entero en memoria:
+el archivo se abre con mmap y solo se decodifican las preguntas elegidas.
+
+Formato del archivo "<Categoria>.banco":
+    cabecera    "<4sHHQI": b"RSPB", versión, reservado, cantidad de preguntas, largo de la firma
+    firma       JSON con la firma del banco de origen al convertirlo (mtime y tamaño del JSON y de sus diarios)
+    tabla       (cantidad + 1) desplazamientos uint64 little-endian (ancho fijo)
+    datos       cada pregunta como JSON compacto en UTF-8, una detrás de otra
+La pregunta i ocupa datos[tabla[i]:tabla[i + 1]].
+Si el JSON o su diario cambiaron después de convertir (pregunta nueva, importación, compactación),
+la firma ya no coincide y abrir_bancos_mmap deja esa categoría en el JSON hasta volver a convertirla.
+
+Uso: python banco_mmap.py convertir [Archivo.json ...]   (sin archivos: todos los de MAPA_ARCHIVOS)
+"""
+
+# IMPORTACIONES
+import json  # Cada registro es un JSON compacto
+import mmap  # Para mapear el archivo sin leerlo entero
+import os  # Para rutas de archivos
+import random  # Para elegir las posiciones al azar
+import shutil  # Para copiar los datos detrás de la tabla
+import struct  # Para la cabecera y la tabla de desplazamientos
+import sys  # Para leer los argumentos de la línea de comandos
+import tempfile  # Archivo temporal para los datos mientras se convierte
+from array import array  # Desplazamientos en memoria (8 bytes cada uno)
+from bancos import CARPETA_BANCOS, MAPA_ARCHIVOS, bloqueo_banco, compresor_de, firma_diarios, leer_categoria
+from registros import a_formato_json, normalizar_pregunta
+
+MAGICO = b"RSPB"  # Identifica el formato ("Respondidos Banco")
+VERSION_MMAP = 2  # 2: firma del banco de origen en la cabecera
+CABECERA = struct.Struct("<4sHHQI")
+EXTENSION_MMAP = ".banco"
+
+
+# FUNCIÓN: ruta del archivo binario que corresponde a un JSON
+def ruta_mmap(ruta_json):
+    if compresor_de(ruta_json):
+        ruta_json = os.path.splitext(ruta_json)[0]  # "Ciencia.json.gz" -> "Ciencia.json"
+    return os.path.splitext(ruta_json)[0] + EXTENSION_MMAP  # "Ciencia.json" -> "Ciencia.banco"
+
+
+# FUNCIÓN: firma del banco JSON y sus diarios (cambia con cada pregunta nueva, importación o compactación)
+def firma_origen(ruta_json):
+    try:
+        info = os.stat(ruta_json)
+        firma = [info.st_mtime_ns, info.st_size]
+    except OSError:  # Sin JSON
+        firma = None
+    return [firma, firma_diarios(ruta_json)]  # Listas: se comparan igual después de pasar por JSON
+
+
+# FUNCIÓN: escribe un banco binario a partir de cualquier iterable de preguntas
+def escribir_banco_mmap(ruta, preguntas, firma=None):
+    """
+    Recorre las preguntas una sola vez (sirve para generadores enormes): los datos van
+    a un temporal, y al final se escriben cabecera + firma + tabla + datos y se renombra.
+    firma: la de firma_origen del JSON convertido (None si no sale de un JSON).
+    Devuelve la cantidad de preguntas escritas.
+    """
+    desplazamientos = array("Q", [0])
+    carpeta = os.path.dirname(os.path.abspath(ruta))
+    with tempfile.TemporaryFile(dir=carpeta) as datos:
+        posicion = 0
+        for pregunta in preguntas:
+            registro = json.dumps(a_formato_json(pregunta), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            datos.write(registro)
+            posicion += len(registro)
+            desplazamientos.append(posicion)
+        if sys.byteorder != "little":
+            desplazamientos.byteswap()  # La tabla siempre se guarda en little-endian
+
+        cantidad = len(desplazamientos) - 1
+        firma = json.dumps(firma, separators=(",", ":")).encode("utf-8")
+        temporal = ruta + ".tmp"
+        with open(temporal, "wb") as salida:
+            salida.write(CABECERA.pack(MAGICO, VERSION_MMAP, 0, cantidad, len(firma)))
+            salida.write(firma)
+            desplazamientos.tofile(salida)
+            datos.seek(0)
+            shutil.copyfileobj(datos, salida, 1024 * 1024)
+            salida.flush()
+            os.fsync(salida.fileno())
+        os.replace(temporal, ruta)  # Los lectores nunca ven un archivo a medias
+    return cantidad
+
+
+# FUNCIÓN: convierte un banco JSON (con su diario) al formato binario
+def convertir_json(ruta_json, ruta_salida=None):
+    ruta_salida = ruta_salida or ruta_mmap(ruta_json)
+    with bloqueo_banco(ruta_json, exclusivo=False):  # Nadie agrega ni compacta entre la lectura y la firma
+        preguntas = leer_categoria(ruta_json)
+        firma = firma_origen(ruta_json)  # Después de leer: leer_categoria crea el JSON si faltaba
+    return escribir_banco_mmap(ruta_salida, preguntas, firma)
+
+
+# CLASE: banco binario abierto con mmap (se comporta como una lista de solo lectura)
+class BancoMmap:
+    """
+    Solo quedan en memoria las páginas del archivo que se tocan: la cabecera,
+    las entradas de la tabla consultadas y los registros decodificados.
+    """
+
+    def __init__(self, ruta):
+        self.ruta = ruta
+        with open(ruta, "rb") as f:
+            self._mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magico, version, _, self.cantidad, largo_firma = CABECERA.unpack_from(self._mapa, 0)
+        if magico != MAGICO or version != VERSION_MMAP:
+            self._mapa.close()
+            raise ValueError(f"{os.path.basename(ruta)} no es un banco binario válido (vuelva a convertirlo)")
+        self.firma = json.loads(self._mapa[CABECERA.size:CABECERA.size + largo_firma])  # La del JSON al convertir
+        self._inicio_tabla = CABECERA.size + largo_firma
+        self._inicio_datos = self._inicio_tabla + 8 * (self.cantidad + 1)
+
+    def __len__(self):
+        return self.cantidad
+
+    def registro_bytes(self, indice):
+        """Bytes UTF-8 de la pregunta número indice (sin decodificar)."""
+        if not 0 <= indice < self.cantidad:
+            raise IndexError(indice)
+        inicio, fin = struct.unpack_from("<QQ", self._mapa, self._inicio_tabla + 8 * indice)
+        return self._mapa[self._inicio_datos + inicio:self._inicio_datos + fin]
+
+    def __getitem__(self, indice):
+        if indice < 0:
+            indice += self.cantidad
+        return normalizar_pregunta(json.loads(self.registro_bytes(indice)))  # Registro compilado
+
+    def muestrear(self, n):
+        """n preguntas distintas al azar; solo se decodifican esas n."""
+        return [self[i] for i in random.sample(range(self.cantidad), min(n, self.cantidad))]
+
+    def cerrar(self):
+        self._mapa.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+
+# FUNCIÓN: abre los bancos binarios que existan para un mapa de categorías
+def abrir_bancos_mmap(mapa_archivos=MAPA_ARCHIVOS, base=CARPETA_BANCOS):
+    """
+    Devuelve {categoría: BancoMmap} solo para las categorías convertidas y al día:
+    si el JSON o su diario cambiaron desde la conversión, esa categoría sigue con el JSON.
+    """
+    abiertos = {}
+    for categoria, nombre_archivo in mapa_archivos.items():
+        ruta_json = os.path.join(base, nombre_archivo)
+        ruta = ruta_mmap(ruta_json)
+        try:
+            banco = BancoMmap(ruta)
+            if banco.firma != firma_origen(ruta_json):
+                banco.cerrar()
+                print(f"{os.path.basename(ruta)} está desactualizado: se usa {nombre_archivo} "
+                      f"(python banco_mmap.py convertir para rehacerlo)")
+                continue
+            abiertos[categoria] = banco
+        except FileNotFoundError:
+            pass  # Sin convertir: esa categoría sigue usando el JSON
+        except (OSError, ValueError) as e:
+            print(f"No se pudo abrir {os.path.basename(ruta)}: {e}")
+    return abiertos
+
+
+# === EJECUCIÓN DESDE LA LÍNEA DE COMANDOS ===
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2 or sys.argv[1] != "convertir":
+        print("Uso: python banco_mmap.py convertir [Archivo.json ...]")
+        sys.exit(2)
+    rutas = sys.argv[2:] or [os.path.join(CARPETA_BANCOS, n) for n in MAPA_ARCHIVOS.values()]
+    for ruta in rutas:
+        print(f"{ruta_mmap(ruta)}: {convertir_json(ruta)} preguntas")
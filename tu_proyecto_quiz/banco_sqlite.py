@@ -0,0 +1,188 @@
+"""
+RESPONDIDOS - BANCO DE PREGUNTAS EN SQLITE
+Alternativa a los JSON por categoría para bancos de decenas de miles de preguntas o más.
+Contar, muestrear e insertar usan índices y no dependen del tamaño del banco.
+
+Uso: python banco_sqlite.py importar [ruta.sqlite3]
+"""
+
+# IMPORTACIONES
+import json  # Las opciones se guardan como lista JSON
+import os  # Para rutas de archivos
+import random  # Para elegir las posiciones al azar
+import sqlite3  # Motor de base de datos de la librería estándar
+import sys  # Para leer los argumentos de la línea de comandos
+from bancos import CARPETA_BANCOS, MAPA_ARCHIVOS, leer_categoria
+from registros import normalizar_pregunta
+from estadisticas import CAMPOS_ESTADISTICAS, LIMITE_CORTA, LIMITE_LARGA, estadisticas_vacias
+
+# RUTA POR DEFECTO de la base de datos (junto a los JSON)
+RUTA_SQLITE = os.path.join(CARPETA_BANCOS, "bancos.sqlite3")
+
+# ESQUEMA: "orden" es la posición de la pregunta dentro de su categoría (0, 1, 2, ...).
+# Con el índice único (categoria, orden) se cuenta con MAX(orden) y se muestrea
+# eligiendo posiciones al azar, sin recorrer la categoría entera.
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS preguntas (
+    id INTEGER PRIMARY KEY,
+    categoria TEXT NOT NULL,
+    orden INTEGER NOT NULL,
+    id_original INTEGER,
+    pregunta TEXT NOT NULL,
+    opciones TEXT NOT NULL,
+    respuesta_correcta TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_preguntas_categoria_orden ON preguntas (categoria, orden);
+CREATE INDEX IF NOT EXISTS idx_preguntas_id_original ON preguntas (id_original);
+"""
+
+# SENTENCIA para insertar una fila con su posición ya calculada
+INSERTAR_FILA = ("INSERT INTO preguntas (categoria, orden, id_original, pregunta, opciones, respuesta_correcta) "
+                 "VALUES (?, ?, ?, ?, ?, ?)")
+
+
+# FUNCIÓN: abre (o crea) la base de datos
+def abrir_base(ruta=RUTA_SQLITE):
+    """
+    Devuelve una conexión en modo WAL (los lectores no bloquean al que escribe).
+    """
+    conexion = sqlite3.connect(ruta)
+    conexion.execute("PRAGMA journal_mode=WAL")  # Lecturas y escrituras concurrentes
+    conexion.execute("PRAGMA synchronous=NORMAL")  # Seguro con WAL y mucho más rápido que FULL
+    conexion.executescript(ESQUEMA)
+    return conexion
+
+
+# FUNCIÓN: convierte una fila de la tabla al diccionario que usa quiz-app.py
+def fila_a_pregunta(fila):
+    id_original, categoria, pregunta, opciones, respuesta_correcta = fila
+    q = {"categoria": categoria, "pregunta": pregunta, "opciones": json.loads(opciones),
+         "respuestaCorrecta": respuesta_correcta}
+    if id_original is not None:
+        q["id"] = id_original
+    return normalizar_pregunta(q)  # Agrega el índice de la respuesta correcta
+
+
+# FUNCIÓN: convierte un diccionario de pregunta a los valores de una fila
+def pregunta_a_valores(categoria, pregunta):
+    return (categoria, pregunta.get("id"), pregunta.get("pregunta", ""),
+            json.dumps(pregunta.get("opciones", []), ensure_ascii=False), pregunta.get("respuestaCorrecta", ""))
+
+
+# FUNCIÓN: cuenta las preguntas de una categoría
+def contar(conexion, categoria):
+    """
+    O(log n): como "orden" no tiene huecos, la cantidad es MAX(orden) + 1.
+    """
+    (maximo,) = conexion.execute("SELECT MAX(orden) FROM preguntas WHERE categoria = ?", (categoria,)).fetchone()
+    return 0 if maximo is None else maximo + 1
+
+
+# FUNCIÓN: cantidad de preguntas de cada categoría, con la forma del manifiesto de bancos
+def manifiesto_sqlite(conexion, mapa_archivos=MAPA_ARCHIVOS):
+    """
+    Cantidad y estadísticas de cada categoría (las mismas que guarda el manifiesto de los JSON),
+    calculadas por la base en una sola consulta.
+    """
+    filas = conexion.execute(
+        "SELECT categoria, COUNT(*), SUM(LENGTH(pregunta)), SUM(LENGTH(pregunta) < ?), "
+        "SUM(LENGTH(pregunta) BETWEEN ? AND ?), SUM(LENGTH(pregunta) > ?) FROM preguntas GROUP BY categoria",
+        (LIMITE_CORTA, LIMITE_CORTA, LIMITE_LARGA, LIMITE_LARGA)).fetchall()
+    por_categoria = {f[0]: dict(zip(CAMPOS_ESTADISTICAS, f[1:])) for f in filas}
+    return {categoria: {"archivo": nombre_archivo, "cantidad": contar(conexion, categoria),
+                        "estadisticas": por_categoria.get(categoria, estadisticas_vacias())}
+            for categoria, nombre_archivo in mapa_archivos.items()}
+
+
+# FUNCIÓN: elige n preguntas al azar de una categoría
+def muestrear(conexion, categoria, n):
+    """
+    Elige n posiciones distintas al azar y las busca por el índice (categoria, orden).
+    Devuelve la lista de preguntas ya mezclada (menos de n si la categoría es chica).
+    """
+    total = contar(conexion, categoria)
+    posiciones = random.sample(range(total), min(n, total))
+    if not posiciones:
+        return []
+    marcas = ",".join("?" * len(posiciones))
+    filas = conexion.execute(
+        f"SELECT id_original, categoria, pregunta, opciones, respuesta_correcta FROM preguntas "
+        f"WHERE categoria = ? AND orden IN ({marcas})", (categoria, *posiciones)).fetchall()
+    preguntas = [fila_a_pregunta(f) for f in filas]
+    random.shuffle(preguntas)  # IN devuelve las filas en orden del índice
+    return preguntas
+
+
+# FUNCIÓN: muestreo con ORDER BY random() (recorre la categoría; se deja para comparar)
+def muestrear_order_by_random(conexion, categoria, n):
+    filas = conexion.execute(
+        "SELECT id_original, categoria, pregunta, opciones, respuesta_correcta FROM preguntas "
+        "WHERE categoria = ? ORDER BY random() LIMIT ?", (categoria, n)).fetchall()
+    return [fila_a_pregunta(f) for f in filas]
+
+
+# FUNCIÓN: todas las preguntas de una categoría (en el orden en que se agregaron)
+def leer_categoria_sqlite(conexion, categoria):
+    filas = conexion.execute(
+        "SELECT id_original, categoria, pregunta, opciones, respuesta_correcta FROM preguntas "
+        "WHERE categoria = ? ORDER BY orden", (categoria,)).fetchall()
+    return [fila_a_pregunta(f) for f in filas]
+
+
+# FUNCIÓN: agrega una pregunta al final de su categoría
+def insertar(conexion, categoria, pregunta):
+    """
+    Una sola transacción: calcula la próxima posición y escribe la fila.
+    """
+    categoria_fila, id_original, texto, opciones, respuesta = pregunta_a_valores(categoria, pregunta)
+    with conexion:  # BEGIN ... COMMIT (o ROLLBACK si falla)
+        conexion.execute(
+            "INSERT INTO preguntas (categoria, orden, id_original, pregunta, opciones, respuesta_correcta) "
+            "VALUES (?, (SELECT COALESCE(MAX(orden) + 1, 0) FROM preguntas WHERE categoria = ?), ?, ?, ?, ?)",
+            (categoria_fila, categoria_fila, id_original, texto, opciones, respuesta))
+
+
+# FUNCIÓN: arma las filas de varias preguntas de una categoría a partir de una posición
+def filas_para_insertar(categoria, preguntas, inicio):
+    filas = []
+    for i, pregunta in enumerate(preguntas):
+        categoria_fila, id_original, texto, opciones, respuesta = pregunta_a_valores(categoria, pregunta)
+        filas.append((categoria_fila, inicio + i, id_original, texto, opciones, respuesta))
+    return filas
+
+
+# FUNCIÓN: inserta muchas preguntas de una categoría en una sola transacción
+def insertar_muchas(conexion, categoria, preguntas):
+    with conexion:
+        filas = filas_para_insertar(categoria, preguntas, contar(conexion, categoria))
+        conexion.executemany(INSERTAR_FILA, filas)
+    return len(filas)
+
+
+# FUNCIÓN: importa los bancos JSON a la base de datos
+def importar_json(conexion, mapa_archivos=MAPA_ARCHIVOS, base=CARPETA_BANCOS):
+    """
+    Reemplaza cada categoría de la base por el contenido de su JSON (incluido el diario),
+    en una transacción por categoría. Devuelve {categoría: preguntas_importadas}.
+    """
+    resultado = {}
+    for categoria, nombre_archivo in mapa_archivos.items():
+        preguntas = leer_categoria(os.path.join(base, nombre_archivo))
+        with conexion:  # Si algo falla, la categoría queda como estaba
+            conexion.execute("DELETE FROM preguntas WHERE categoria = ?", (categoria,))
+            conexion.executemany(INSERTAR_FILA, filas_para_insertar(categoria, preguntas, 0))
+        resultado[categoria] = len(preguntas)
+    return resultado
+
+
+# === EJECUCIÓN DESDE LA LÍNEA DE COMANDOS ===
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2 or sys.argv[1] != "importar":
+        print("Uso: python banco_sqlite.py importar [ruta.sqlite3]")
+        sys.exit(2)
+    ruta = sys.argv[2] if len(sys.argv) > 2 else RUTA_SQLITE
+    conexion = abrir_base(ruta)
+    for categoria, cantidad in importar_json(conexion).items():
+        print(f"{categoria}: {cantidad} preguntas")
+    conexion.close()
@@ -0,0 +1,824 @@
+"""
+RESPONDIDOS - LECTURA DE LOS BANCOS DE PREGUNTAS
+Caché compilada por categoría para no volver a parsear el JSON en cada arranque
+y manifiesto liviano (archivo, cantidad, hash, estadísticas) para dibujar el menú sin cargar todo
+Carga de varias categorías en paralelo (hilos o procesos)
+Diario de solo-agregado para las preguntas nuevas, con compactación atómica
+Bloqueo entre procesos (fcntl) para que varias instancias compartan la carpeta de bancos
+Bancos comprimidos (.json.gz / .json.xz) según el nombre del archivo en MAPA_ARCHIVOS
+Muestreo en flujo (sin cargar el banco entero) para archivos enormes
+"""
+
+# IMPORTACIONES
+import gc  # Para pausar el recolector de basura mientras se decodifica
+import gzip  # Bancos .json.gz
+import hashlib  # Para calcular el hash del contenido del JSON
+import json  # Para leer los archivos JSON originales
+import lzma  # Bancos .json.xz
+import marshal  # Formato binario rápido para la caché compilada
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor  # Para cargar en paralelo
+import os  # Para manejo de rutas y metadatos de archivos
+import random  # Para el muestreo de reservorio
+import re  # Para saltar espacios en la lectura en flujo
+import sys  # Para atar la caché a la versión de Python
+import threading  # Para el bloqueo entre hilos del mismo proceso
+import zlib  # Para reconocer un .gz dañado (zlib.error)
+from contextlib import contextmanager  # Para usar el bloqueo con "with"
+from registros import compilar_banco, normalizar_pregunta  # Registro único con el índice de la respuesta correcta
+from estadisticas import estadisticas_de, estadisticas_vacias  # Estadísticas por categoría para el manifiesto
+
+try:
+    import fcntl  # Bloqueo consultivo entre procesos (Linux, macOS)
+except ImportError:
+    fcntl = None  # Windows: solo se bloquea entre hilos del mismo proceso
+
+# VERSIÓN DE LA CACHÉ: si cambia el formato, se sube este número y las cachés viejas se ignoran
+VERSION_CACHE = 1
+
+# CLAVE DE VERSIÓN: marshal depende del intérprete, así que la versión de Python forma parte de la clave
+CLAVE_VERSION = (VERSION_CACHE, sys.version_info[:2])
+
+# NOMBRE DE LA CARPETA donde se guardan las cachés (junto a los JSON)
+CARPETA_CACHE = ".cache_bancos"
+
+# CARPETA DE LOS BANCOS: la misma carpeta donde está el programa
+CARPETA_BANCOS = os.path.dirname(os.path.abspath(__file__))
+
+# DICCIONARIO QUE MAPEA NOMBRES DE CATEGORÍAS CON SUS ARCHIVOS JSON
+MAPA_ARCHIVOS = {
+    "Peliculas y Series": "PeliSeries.json",  # Clave: nombre que verá el usuario | Valor: archivo JSON
+    "Ciencia": "Ciencia.json",
+    "Videojuegos": "Videojuegos.json",
+    "Historia": "Historia.json",
+    "Música": "Musica.json",
+    "Futbol": "Futbol.json",
+    "Star Wars": "StarWars.json",
+    "Rainbow Six Siege": "RainbowSixSiege.json"
+}
+
+# MODOS DE CARGA de leer_categorias: en serie, con hilos, con procesos, o elegido según el tamaño
+MODOS_CARGA = ("serie", "hilos", "procesos", "auto")
+
+# En modo "auto", si algún archivo supera este tamaño se usan procesos (el parseo pesa más que la lectura)
+UMBRAL_PROCESOS = 8 * 1024 * 1024  # 8 MB
+
+
+# === BANCOS COMPRIMIDOS ===
+# La extensión del archivo decide el formato: "Ciencia.json" es JSON con sangría (se edita a mano),
+# "Ciencia.json.gz" y "Ciencia.json.xz" son JSON compacto comprimido. Para usar uno comprimido
+# alcanza con convertirlo (python bancos.py convertir gz) y cambiar el nombre en MAPA_ARCHIVOS.
+# El diario de preguntas nuevas ("Ciencia.json.gz.diario") sigue siendo texto: agregar no recomprime.
+
+COMPRESORES = {".gz": gzip, ".xz": lzma}  # Extensión final -> módulo (compress / decompress / open)
+EXTENSIONES_BANCO = (".json", ".json.gz", ".json.xz")
+ERRORES_COMPRESION = (EOFError, gzip.BadGzipFile, lzma.LZMAError, zlib.error)  # Archivo comprimido cortado o dañado
+
+
+# FUNCIÓN: módulo de compresión de un banco según su extensión (None si es JSON plano)
+def compresor_de(ruta_json):
+    return COMPRESORES.get(os.path.splitext(ruta_json)[1].lower())
+
+
+# FUNCIÓN: indica si un nombre de archivo es un banco (plano o comprimido)
+def es_archivo_banco(nombre):
+    return nombre.lower().endswith(EXTENSIONES_BANCO)
+
+
+# FUNCIÓN: bytes del JSON de un banco a partir de los bytes del archivo
+def descomprimir_banco(ruta_json, contenido):
+    """
+    Un archivo comprimido dañado se informa como json.JSONDecodeError,
+    así lo manejan igual que un JSON mal formado quienes ya lo atrapan.
+    """
+    compresor = compresor_de(ruta_json)
+    if compresor is None:
+        return contenido
+    try:
+        return compresor.decompress(contenido)
+    except ERRORES_COMPRESION as e:
+        raise json.JSONDecodeError(f"Archivo comprimido dañado ({e})", "", 0) from e
+
+
+# FUNCIÓN: bytes que se escriben para un banco (JSON con sangría, o compacto y comprimido)
+def serializar_banco(ruta_json, datos):
+    compresor = compresor_de(ruta_json)
+    if compresor is None:
+        return json.dumps(datos, ensure_ascii=False, indent=2).encode("utf-8")
+    contenido = json.dumps(datos, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if compresor is gzip:
+        return gzip.compress(contenido, compresslevel=9, mtime=0)  # mtime=0: mismo contenido, mismos bytes (y mismo hash)
+    return lzma.compress(contenido)  # Preset 6: el 9 pide ~700 MB de memoria para comprimir
+
+
+# FUNCIÓN: reemplaza un banco entero con escritura atómica (llamarla dentro de bloqueo_banco)
+def escribir_banco(ruta_json, datos):
+    escribir_atomico(ruta_json, serializar_banco(ruta_json, datos))
+
+
+# FUNCIÓN: abre un banco como texto, descomprimiendo al vuelo si hace falta (para la lectura en flujo)
+def abrir_texto_banco(ruta_json):
+    compresor = compresor_de(ruta_json)
+    if compresor is None:
+        return open(ruta_json, encoding="utf-8")
+    return compresor.open(ruta_json, "rt", encoding="utf-8")
+
+
+# FUNCIÓN: devuelve la ruta del archivo de caché que corresponde a un JSON
+def ruta_cache(ruta_json):
+    """
+    La caché de "Ciencia.json" se guarda en ".cache_bancos/Ciencia.json.bin".
+    """
+    carpeta, nombre = os.path.split(ruta_json)  # Separa carpeta y nombre del archivo
+    return os.path.join(carpeta, CARPETA_CACHE, nombre + ".bin")  # Ruta de la caché
+
+
+# FUNCIÓN: calcula el hash del contenido de un archivo
+def hash_contenido(contenido):
+    """
+    Devuelve el hash SHA-1 (en hexadecimal) de los bytes del archivo.
+    """
+    return hashlib.sha1(contenido).hexdigest()
+
+
+# FUNCIÓN: intenta leer la caché compilada de un JSON
+def leer_cache(ruta_json, mtime, tamano, contenido):
+    """
+    Devuelve (True, datos) si la caché existe y su firma (mtime, tamaño, hash)
+    coincide con la del JSON actual. Si no, devuelve (False, None).
+    """
+    try:
+        with open(ruta_cache(ruta_json), "rb") as f:  # Abre la caché en modo binario
+            blob = f.read()
+    except OSError:
+        return False, None  # No hay caché (o no se puede leer)
+
+    gc.disable()  # Decodificar miles de objetos es más rápido sin el recolector
+    try:
+        clave, firma, datos = marshal.loads(blob)  # Decodifica (versión, firma, datos)
+    except Exception:
+        return False, None  # Caché corrupta: se reconstruye
+    finally:
+        gc.enable()
+
+    if clave != CLAVE_VERSION:  # Formato de otra versión
+        return False, None
+    if firma[0] != mtime or firma[1] != tamano:  # Cambió la fecha o el tamaño del JSON
+        return False, None
+    if firma[2] != hash_contenido(contenido):  # Mismo tamaño y fecha pero otro contenido
+        return False, None
+    return True, datos
+
+
+# FUNCIÓN: guarda la caché compilada de un JSON
+def escribir_cache(ruta_json, mtime, tamano, contenido, datos):
+    """
+    Escribe la caché en un archivo temporal y lo renombra, así nunca queda a medias.
+    Si no se puede escribir (disco de solo lectura, etc.) simplemente no hay caché.
+    """
+    destino = ruta_cache(ruta_json)
+    temporal = nombre_temporal(destino)
+    try:
+        os.makedirs(os.path.dirname(destino), exist_ok=True)  # Crea la carpeta de cachés si no existe
+        blob = marshal.dumps((CLAVE_VERSION, (mtime, tamano, hash_contenido(contenido)), datos))
+        with open(temporal, "wb") as f:
+            f.write(blob)
+        os.replace(temporal, destino)  # Reemplazo atómico
+    except (OSError, ValueError) as e:  # ValueError: datos que marshal no puede guardar
+        print(f"No se pudo escribir la caché de {os.path.basename(ruta_json)}: {e}")
+
+
+# FUNCIÓN: lee un banco de preguntas usando la caché compilada si está al día
+def leer_banco(ruta_json):
+    """
+    Devuelve el contenido del JSON ya decodificado.
+    Si la caché coincide con el archivo (mtime, tamaño y hash) se usa la caché;
+    si no, se parsea el JSON y se reconstruye la caché.
+    Lanza FileNotFoundError y json.JSONDecodeError igual que json.load.
+    """
+    with open(ruta_json, "rb") as f:  # Lee los bytes una sola vez (sirven para el hash y para parsear)
+        info = os.fstat(f.fileno())  # mtime y tamaño del archivo abierto
+        contenido = f.read()
+    return decodificar_banco(ruta_json, info, contenido)
+
+
+# FUNCIÓN: decodifica los bytes ya leídos de un banco (caché o JSON)
+def decodificar_banco(ruta_json, info, contenido):
+    """
+    Usa la caché si coincide con info (os.stat del archivo) y contenido; si no, parsea el JSON.
+    En un banco comprimido la firma es la de los bytes comprimidos: con la caché al día ni se descomprime.
+    """
+    encontrada, datos = leer_cache(ruta_json, info.st_mtime_ns, info.st_size, contenido)
+    if encontrada:
+        return datos  # Caché al día: no hace falta parsear el JSON
+
+    datos = json.loads(descomprimir_banco(ruta_json, contenido).decode("utf-8"))  # Parsea el JSON original
+    escribir_cache(ruta_json, info.st_mtime_ns, info.st_size, contenido, datos)  # Reconstruye la caché
+    return datos
+
+
+# FUNCIÓN: lee el archivo de una categoría con el manejo de errores de siempre (lo crea si falta)
+def leer_categoria(ruta_json):
+    """
+    Devuelve la lista de preguntas del archivo más las que estén en su diario,
+    ya compiladas con registros.compilar_banco (acepta los dos formatos de banco).
+    Si el archivo no existe lo crea vacío; si está mal formado devuelve una lista vacía.
+    """
+    nombre_archivo = os.path.basename(ruta_json)
+    try:
+        with bloqueo_banco(ruta_json, exclusivo=False):  # Banco y diario del mismo momento (no a mitad de una compactación)
+            datos = leer_banco(ruta_json)  # Convierte el JSON a una lista de Python (usa la caché si está al día)
+            diario = leer_diarios(ruta_json)  # Preguntas agregadas desde la última compactación
+        return compilar_banco(datos) + compilar_banco(diario)  # Lista (o envoltorio de trivia) -> registros compilados
+    except FileNotFoundError:  # Si el archivo no existe
+        try:
+            with open(ruta_json, "xb") as f:  # Crea el archivo vacío ("x": sin pisar uno que otra instancia acaba de crear)
+                f.write(serializar_banco(ruta_json, []))  # Escribe una lista vacía (comprimida si corresponde)
+        except FileExistsError:
+            return leer_categoria(ruta_json)  # Otra instancia lo creó mientras tanto
+        except Exception as e:  # Si hay error al crear el archivo
+            print(f"No se pudo crear {nombre_archivo}: {e}")  # Imprime el error
+        return compilar_banco(leer_diarios(ruta_json))  # Categoría vacía (salvo lo que haya en el diario)
+    except json.JSONDecodeError:  # Si el JSON está mal formado
+        print(f"JSON inválido en {nombre_archivo}.")  # Imprime el error
+        return []  # Categoría vacía
+    except Exception as e:  # Cualquier otro error
+        print(f"Error cargando {nombre_archivo}: {e}")  # Imprime el error
+        return []  # Categoría vacía
+
+
+# FUNCIÓN: elige hilos o procesos para el modo "auto"
+def elegir_modo(rutas):
+    """
+    Con pocos archivos no vale la pena paralelizar; con archivos enormes conviene usar
+    procesos (json.loads no suelta el GIL); en el resto alcanza con hilos.
+    """
+    if len(rutas) < 2:
+        return "serie"
+    for ruta in rutas:
+        try:
+            if os.path.getsize(ruta) > UMBRAL_PROCESOS:
+                return "procesos"
+        except OSError:
+            pass  # Archivo faltante: leer_categoria lo crea
+    return "hilos"
+
+
+# FUNCIÓN: lee varias categorías, en serie o en paralelo
+def leer_categorias(rutas_por_categoria, modo="serie", max_trabajadores=None):
+    """
+    rutas_por_categoria: {categoría: ruta_json}. Devuelve {categoría: lista_de_preguntas}
+    en el mismo orden. Cada archivo se maneja con leer_categoria, así que un archivo
+    faltante o inválido da una categoría vacía sin afectar a las demás.
+    """
+    if modo not in MODOS_CARGA:
+        raise ValueError(f"Modo de carga desconocido: {modo}")
+    categorias = list(rutas_por_categoria)
+    rutas = [rutas_por_categoria[c] for c in categorias]
+    if modo == "auto":
+        modo = elegir_modo(rutas)
+
+    if modo == "serie":
+        resultados = [leer_categoria(r) for r in rutas]
+    else:
+        Ejecutor = ThreadPoolExecutor if modo == "hilos" else ProcessPoolExecutor
+        with Ejecutor(max_workers=max_trabajadores) as ejecutor:
+            resultados = list(ejecutor.map(leer_categoria, rutas))  # map conserva el orden
+    return dict(zip(categorias, resultados))
+
+
+# === MANIFIESTO DE BANCOS ===
+# Guarda por categoría: archivo, cantidad de preguntas, hash del contenido y estadísticas.
+# El menú se dibuja con esto sin tener todas las preguntas en memoria.
+
+NOMBRE_MANIFIESTO = "manifiesto.json"  # Se guarda dentro de CARPETA_CACHE
+
+
+# FUNCIÓN: arma la entrada del manifiesto de un archivo de banco
+def entrada_manifiesto(ruta_json, nombre_archivo):
+    """
+    Lee el banco una vez y devuelve {"archivo", "cantidad", "hash", "mtime", "tamano", "diario",
+    "estadisticas"} (estadisticas.estadisticas_de: cantidad y longitudes de las preguntas).
+    Un archivo inexistente o con JSON inválido cuenta como 0 preguntas.
+    """
+    entrada = {"archivo": nombre_archivo, "cantidad": 0, "hash": None, "mtime": None, "tamano": None,
+               "diario": firma_diarios(ruta_json), "estadisticas": estadisticas_vacias()}
+    try:
+        with bloqueo_banco(ruta_json, exclusivo=False):  # Banco y diario del mismo momento
+            with open(ruta_json, "rb") as f:
+                info = os.fstat(f.fileno())
+                contenido = f.read()
+            diario = leer_diarios(ruta_json)
+        datos = decodificar_banco(ruta_json, info, contenido)
+    except (OSError, ValueError):  # Archivo faltante o JSON mal formado (JSONDecodeError es ValueError)
+        return entrada
+
+    entrada["estadisticas"] = estadisticas_de(compilar_banco(datos) + compilar_banco(diario))
+    entrada["cantidad"] = entrada["estadisticas"]["cantidad"]  # Las mismas preguntas que las estadísticas (también trivia)
+    entrada["hash"] = hash_contenido(contenido)
+    entrada["mtime"] = info.st_mtime_ns
+    entrada["tamano"] = info.st_size
+    return entrada
+
+
+# FUNCIÓN: carga (y actualiza si hace falta) el manifiesto de todos los bancos
+def leer_manifiesto(base, mapa_archivos):
+    """
+    Devuelve {categoría: entrada_manifiesto}. Solo se vuelven a leer los archivos
+    cuyo mtime o tamaño cambió desde la última vez; el resto sale del manifiesto guardado.
+    """
+    ruta = os.path.join(base, CARPETA_CACHE, NOMBRE_MANIFIESTO)
+    try:
+        with open(ruta, "r", encoding="utf-8") as f:
+            anterior = json.load(f)
+        if not isinstance(anterior, dict):
+            anterior = {}
+    except (OSError, ValueError):
+        anterior = {}  # Primera vez o manifiesto dañado: se arma de cero
+
+    manifiesto = {}
+    hubo_cambios = False
+    for nombre_categoria, nombre_archivo in mapa_archivos.items():
+        ruta_json = os.path.join(base, nombre_archivo)
+        entrada = anterior.get(nombre_categoria)
+        try:
+            info = os.stat(ruta_json)
+            al_dia = (isinstance(entrada, dict) and entrada.get("archivo") == nombre_archivo
+                      and entrada.get("mtime") == info.st_mtime_ns and entrada.get("tamano") == info.st_size)
+        except OSError:  # El archivo no existe: vale la entrada vacía (cantidad 0) si ya estaba así
+            al_dia = (isinstance(entrada, dict) and entrada.get("archivo") == nombre_archivo
+                      and entrada.get("mtime") is None)
+        if al_dia and entrada.get("diario") != firma_diarios(ruta_json):
+            al_dia = False  # Se agregaron preguntas al diario desde la última vez
+        if al_dia and (not isinstance(entrada.get("estadisticas"), dict)
+                       or entrada.get("cantidad") != entrada["estadisticas"].get("cantidad")):
+            al_dia = False  # Manifiesto de una versión anterior (sin estadísticas o con otra cuenta)
+
+        if not al_dia:
+            entrada = entrada_manifiesto(ruta_json, nombre_archivo)
+            hubo_cambios = True
+        manifiesto[nombre_categoria] = entrada
+
+    if hubo_cambios or set(anterior) != set(manifiesto):
+        try:
+            os.makedirs(os.path.dirname(ruta), exist_ok=True)
+            escribir_atomico(ruta, json.dumps(manifiesto, ensure_ascii=False, indent=2).encode("utf-8"))
+        except OSError as e:
+            print(f"No se pudo guardar el manifiesto: {e}")
+    return manifiesto
+
+
+# === BLOQUEO ENTRE PROCESOS ===
+# Varias instancias de quiz-app.py (o el importador) pueden compartir la carpeta de bancos.
+# Cada banco tiene un archivo "<banco>.lock" sobre el que se toma fcntl.flock:
+# exclusivo para agregar al diario, compactar o reescribir el banco; compartido para leer
+# el banco junto con sus diarios (así nunca se lee en medio de una compactación).
+# flock es por descriptor de archivo, por eso dentro de un proceso además se usa un
+# threading.RLock por banco, y un hilo que ya tiene el bloqueo puede volver a pedirlo.
+
+SUFIJO_BLOQUEO = ".lock"
+candados_hilos = {}  # {ruta del .lock: threading.RLock}
+candado_candados = threading.Lock()  # Protege candados_hilos
+bloqueos_del_hilo = threading.local()  # .rutas: bloqueos que ya tiene el hilo actual
+
+
+# FUNCIÓN: ruta del archivo de bloqueo de un banco
+def ruta_bloqueo(ruta_json):
+    return ruta_json + SUFIJO_BLOQUEO  # "Ciencia.json" -> "Ciencia.json.lock"
+
+
+# FUNCIÓN: bloqueo consultivo de un banco, entre procesos y entre hilos
+@contextmanager
+def bloqueo_banco(ruta_json, exclusivo=True):
+    """
+    with bloqueo_banco(ruta): ... Exclusivo para escribir, compartido (exclusivo=False) para leer.
+    Si no se puede crear el .lock (carpeta de solo lectura) y es para leer, se lee sin bloqueo:
+    nadie puede estar escribiendo ahí.
+    """
+    ruta = os.path.abspath(ruta_bloqueo(ruta_json))
+    tomados = bloqueos_del_hilo.__dict__.setdefault("rutas", set())
+    if ruta in tomados:  # Este hilo ya lo tiene (por ejemplo fusionar -> compactar_banco)
+        yield
+        return
+    with candado_candados:
+        candado = candados_hilos.setdefault(ruta, threading.RLock())
+    with candado:
+        try:
+            archivo = open(ruta, "a+b")  # "a": lo crea si no existe y nunca lo trunca
+        except OSError:
+            if exclusivo:
+                raise
+            archivo = None
+        try:
+            if archivo is not None and fcntl is not None:
+                fcntl.flock(archivo.fileno(), fcntl.LOCK_EX if exclusivo else fcntl.LOCK_SH)  # Espera su turno
+            tomados.add(ruta)
+            yield
+        finally:
+            tomados.discard(ruta)
+            if archivo is not None:
+                archivo.close()  # Cerrar el descriptor libera el flock
+
+
+# === DIARIO DE PREGUNTAS NUEVAS ===
+# Cada pregunta agregada se escribe como una línea JSON al final de "<banco>.diario".
+# Agregar es O(1) y nunca se reescribe el banco; un corte a mitad de escritura
+# solo puede dañar la última línea, que se ignora al leer.
+# compactar_banco pasa el diario al archivo principal de forma atómica:
+#   1. renombra "<banco>.diario" a "<banco>.diario.<hash del banco>.compactando"
+#      (las preguntas nuevas van a un diario nuevo);
+#   2. escribe banco + diario en un temporal, fsync y os.replace sobre el banco;
+#   3. borra el ".compactando".
+# Si se corta entre 2 y 3, el hash del nombre ya no coincide con el banco y
+# el ".compactando" se ignora (sus preguntas ya están en el banco).
+# Agregar y compactar toman el bloqueo exclusivo del banco: entre procesos nunca se
+# agrega una línea a un diario que otro ya renombró para compactarlo.
+
+SUFIJO_DIARIO = ".diario"
+SUFIJO_COMPACTANDO = ".compactando"
+UMBRAL_COMPACTACION = 100  # Preguntas en el diario a partir de las cuales conviene compactar
+
+
+# FUNCIÓN: ruta del diario de un banco
+def ruta_diario(ruta_json):
+    return ruta_json + SUFIJO_DIARIO  # "Ciencia.json" -> "Ciencia.json.diario"
+
+
+# FUNCIÓN: diarios que quedaron de una compactación a medio hacer
+def diarios_compactando(ruta_json):
+    """
+    Devuelve [(ruta, hash_del_banco_al_empezar)] de los ".compactando" de este banco.
+    """
+    carpeta, nombre = os.path.split(ruta_json)
+    prefijo = nombre + SUFIJO_DIARIO + "."
+    try:
+        nombres = os.listdir(carpeta or ".")
+    except OSError:
+        return []
+    return [(os.path.join(carpeta, n), n[len(prefijo):-len(SUFIJO_COMPACTANDO)])
+            for n in sorted(nombres) if n.startswith(prefijo) and n.endswith(SUFIJO_COMPACTANDO)]
+
+
+# FUNCIÓN: tamaños de los diarios de un banco (para saber si el manifiesto está al día)
+def firma_diarios(ruta_json):
+    firma = []
+    for ruta in [ruta_diario(ruta_json)] + [r for r, _ in diarios_compactando(ruta_json)]:
+        try:
+            firma.append([os.path.basename(ruta), os.path.getsize(ruta)])
+        except OSError:
+            pass  # No hay diario
+    return firma
+
+
+# FUNCIÓN: lee las preguntas de un archivo de diario (una por línea)
+def leer_lineas_diario(ruta):
+    """
+    Devuelve la lista de preguntas del diario. Las líneas dañadas se ignoran.
+    """
+    preguntas = []
+    try:
+        with open(ruta, "r", encoding="utf-8") as f:
+            for numero, linea in enumerate(f, start=1):
+                if not linea.strip():
+                    continue  # Línea vacía
+                try:
+                    preguntas.append(json.loads(linea))
+                except json.JSONDecodeError:  # Línea cortada por un corte de luz, etc.
+                    print(f"Línea {numero} inválida en {os.path.basename(ruta)}: se ignora.")
+    except FileNotFoundError:
+        pass  # No hay diario: nada que agregar
+    return preguntas
+
+
+# FUNCIÓN: preguntas de todos los diarios de un banco que todavía no están en el banco
+def leer_diarios(ruta_json):
+    """
+    Junta el ".compactando" pendiente (si el banco no cambió desde que empezó la
+    compactación) y el diario actual, en orden de llegada.
+    """
+    preguntas = []
+    pendientes = diarios_compactando(ruta_json)
+    if pendientes:
+        try:
+            with open(ruta_json, "rb") as f:
+                hash_banco = hash_contenido(f.read())
+        except OSError:
+            hash_banco = None
+        for ruta, hash_inicial in pendientes:
+            if hash_inicial == hash_banco:  # La compactación no llegó a reemplazar el banco
+                preguntas.extend(leer_lineas_diario(ruta))
+    preguntas.extend(leer_lineas_diario(ruta_diario(ruta_json)))
+    return preguntas
+
+
+# FUNCIÓN: agrega una pregunta al diario del banco
+def agregar_al_diario(ruta_json, pregunta):
+    """
+    Escribe la pregunta como una línea JSON al final del diario y hace fsync.
+    No lee ni reescribe el banco, así que el costo no depende de su tamaño.
+    Devuelve los bytes agregados al diario (para que quien escribió actualice su firma_diarios).
+    """
+    linea = (json.dumps(pregunta, ensure_ascii=False) + "\n").encode("utf-8")  # Una pregunta por línea
+    with bloqueo_banco(ruta_json), open(ruta_diario(ruta_json), "a+b") as f:
+        if f.seek(0, os.SEEK_END) > 0:  # Si la última línea quedó cortada, la nueva empieza en otra línea
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                linea = b"\n" + linea
+        f.write(linea)  # En modo "a" siempre se escribe al final
+        f.flush()
+        os.fsync(f.fileno())  # Asegura que llegó al disco
+    return len(linea)
+
+
+# FUNCIÓN: nombre de archivo temporal único por proceso e hilo (dos escritores nunca comparten uno)
+def nombre_temporal(ruta):
+    return f"{ruta}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+
+# FUNCIÓN: escribe un archivo de forma atómica (temporal + fsync + os.replace)
+def escribir_atomico(ruta, contenido):
+    """
+    Quien lea el archivo ve la versión vieja o la nueva, nunca una a medias.
+    No bloquea: para reescribir un banco, llamarla dentro de bloqueo_banco.
+    """
+    temporal = nombre_temporal(ruta)
+    try:
+        with open(temporal, "wb") as f:
+            f.write(contenido)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporal, ruta)
+    except BaseException:
+        try:
+            os.remove(temporal)  # No deja temporales tirados
+        except OSError:
+            pass
+        raise
+    try:  # Persiste el renombre en el directorio (no disponible en todos los sistemas)
+        fd = os.open(os.path.dirname(ruta) or ".", os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+# FUNCIÓN: pasa el diario de un banco (y otras preguntas nuevas) al archivo principal
+def compactar_banco(ruta_json, nuevas=()):
+    """
+    nuevas: preguntas que se agregan al final en la misma escritura (importación masiva).
+    Devuelve la cantidad de preguntas que se agregaron al banco (diario + nuevas).
+    Si el banco tiene JSON inválido no se toca nada.
+    """
+    with bloqueo_banco(ruta_json):  # Nadie agrega al diario ni compacta mientras tanto
+        try:
+            with open(ruta_json, "rb") as f:
+                contenido = f.read()
+        except FileNotFoundError:
+            contenido = serializar_banco(ruta_json, [])
+            escribir_atomico(ruta_json, contenido)  # Banco vacío para poder compactar sobre él
+        datos = json.loads(descomprimir_banco(ruta_json, contenido).decode("utf-8"))  # JSONDecodeError: se aborta sin tocar nada
+        if not isinstance(datos, list):
+            datos = []
+        hash_banco = hash_contenido(contenido)
+
+        pendientes = [r for r, h in diarios_compactando(ruta_json) if h == hash_banco]
+        obsoletos = [r for r, h in diarios_compactando(ruta_json) if h != hash_banco]
+        for ruta in obsoletos:
+            os.remove(ruta)  # Restos de una compactación que sí llegó a reemplazar el banco
+
+        if os.path.exists(ruta_diario(ruta_json)):
+            nuevo = f"{ruta_diario(ruta_json)}.{hash_banco}{SUFIJO_COMPACTANDO}"
+            if nuevo in pendientes:  # Mismo banco que una compactación cortada: se juntan
+                with open(ruta_diario(ruta_json), "rb") as origen, open(nuevo, "ab") as destino:
+                    destino.write(origen.read())
+                os.remove(ruta_diario(ruta_json))
+            else:
+                os.replace(ruta_diario(ruta_json), nuevo)  # Las preguntas nuevas van a un diario nuevo
+                pendientes.append(nuevo)
+        if not pendientes and not nuevas:
+            return 0  # Nada que compactar
+
+        agregadas = []
+        for ruta in pendientes:
+            agregadas.extend(leer_lineas_diario(ruta))
+        agregadas.extend(nuevas)
+        datos.extend(agregadas)
+        escribir_banco(ruta_json, datos)
+        for ruta in pendientes:
+            os.remove(ruta)  # Ya están en el banco
+        return len(agregadas)
+
+
+# FUNCIÓN: compacta los bancos cuyo diario creció lo suficiente
+def compactar_bancos(base, mapa_archivos, umbral=UMBRAL_COMPACTACION):
+    """
+    Recorre los bancos y compacta los que tengan al menos `umbral` preguntas en el diario
+    (umbral=1 compacta todo). Pensada para correr en un hilo aparte o desde la línea de comandos.
+    """
+    total = 0
+    for nombre_archivo in mapa_archivos.values():
+        ruta_json = os.path.join(base, nombre_archivo)
+        if len(leer_diarios(ruta_json)) < umbral:
+            continue
+        try:
+            total += compactar_banco(ruta_json)
+        except (OSError, ValueError) as e:
+            print(f"No se pudo compactar {nombre_archivo}: {e}")
+    return total
+
+
+# === LECTURA EN FLUJO CON MUESTREO DE RESERVORIO ===
+# Para bancos enormes no hace falta construir la lista entera si el quiz usa 10 preguntas:
+# el arreglo de preguntas se decodifica de a un elemento (json.JSONDecoder.raw_decode sobre
+# bloques del archivo) y se elige la muestra en una sola pasada con memoria constante.
+
+TAMANO_BLOQUE = 64 * 1024  # Caracteres leídos por vez
+PATRON_NO_ESPACIO = re.compile(r"[^ \t\n\r]")  # Próximo carácter significativo del JSON
+decodificador_json = json.JSONDecoder()
+
+
+# CLASE: lector incremental de un archivo JSON (solo lo necesario para recorrer un arreglo)
+class FlujoJSON:
+    def __init__(self, archivo, tamano_bloque=TAMANO_BLOQUE):
+        self.archivo = archivo
+        self.tamano_bloque = tamano_bloque
+        self.texto = ""  # Parte leída y todavía no consumida (desde self.posicion)
+        self.posicion = 0
+        self.fin_archivo = False
+        self.linea_contada = 1  # Número de línea en self.contado (se cuenta a medida que se avanza)
+        self.contado = 0
+
+    def leer_mas(self):
+        try:
+            bloque = self.archivo.read(self.tamano_bloque)
+        except ERRORES_COMPRESION as e:  # Banco comprimido cortado o dañado: como un JSON inválido
+            raise json.JSONDecodeError(f"Archivo comprimido dañado ({e})", self.texto, self.posicion) from e
+        self.fin_archivo = not bloque
+        self.linea()  # Cuenta las líneas de la parte que se descarta
+        self.texto = self.texto[self.posicion:] + bloque  # Descarta lo ya consumido
+        self.posicion = 0
+        self.contado = 0
+
+    def linea(self):
+        """Número de línea (desde 1) de la posición actual."""
+        self.linea_contada += self.texto.count("\n", self.contado, self.posicion)
+        self.contado = self.posicion
+        return self.linea_contada
+
+    def siguiente(self):
+        """Próximo carácter que no sea espacio, sin consumirlo ("" al final del archivo)."""
+        while True:
+            encontrado = PATRON_NO_ESPACIO.search(self.texto, self.posicion)
+            if encontrado:
+                self.posicion = encontrado.start()
+                return self.texto[self.posicion]
+            self.posicion = len(self.texto)  # Todo espacios: se descartan
+            if self.fin_archivo:
+                return ""
+            self.leer_mas()
+
+    def esperar(self, caracteres):
+        """Consume uno de los caracteres indicados y lo devuelve."""
+        caracter = self.siguiente()
+        if not caracter or caracter not in caracteres:
+            raise json.JSONDecodeError(f"Se esperaba uno de {caracteres!r}", self.texto, self.posicion)
+        self.posicion += 1
+        return caracter
+
+    def valor(self):
+        """Decodifica el próximo valor JSON completo, leyendo más bloques si quedó cortado."""
+        self.siguiente()
+        while True:
+            try:
+                valor, fin = decodificador_json.raw_decode(self.texto, self.posicion)
+                if fin < len(self.texto) or self.fin_archivo:  # Un número al borde del bloque podría seguir
+                    self.posicion = fin
+                    return valor
+            except json.JSONDecodeError:
+                if self.fin_archivo:
+                    raise
+            self.leer_mas()
+
+
+# FUNCIÓN: genera las preguntas de un banco JSON de a una, sin cargar el archivo entero
+def iterar_preguntas_json(ruta_json, info=None, tamano_bloque=TAMANO_BLOQUE, con_lineas=False):
+    """
+    Acepta la lista de quiz-app.py y el envoltorio de trivia {"category", ..., "questions": [...]}.
+    En el envoltorio, los campos que aparecen antes de "questions" se copian en info
+    (si se pasa un diccionario) para saber el nombre de la categoría.
+    Con con_lineas=True genera (línea donde empieza, pregunta).
+    Lanza json.JSONDecodeError si el archivo está mal formado.
+    """
+    with abrir_texto_banco(ruta_json) as archivo:  # Los .json.gz / .json.xz se descomprimen de a bloques
+        flujo = FlujoJSON(archivo, tamano_bloque)
+        if flujo.esperar("[{") == "{":  # Envoltorio: avanza hasta el arreglo de "questions"
+            if flujo.siguiente() == "}":
+                return
+            while True:
+                clave = flujo.valor()
+                flujo.esperar(":")
+                if clave == "questions":
+                    flujo.esperar("[")
+                    break
+                valor = flujo.valor()  # Campos chicos: nombre, ícono, color...
+                if info is not None:
+                    info[clave] = valor
+                if flujo.esperar(",}") == "}":
+                    return  # Envoltorio sin preguntas
+        if flujo.siguiente() == "]":
+            return  # Arreglo vacío
+        while True:
+            if con_lineas:
+                flujo.siguiente()  # Se para en el comienzo de la pregunta
+                yield flujo.linea(), flujo.valor()
+            else:
+                yield flujo.valor()
+            if flujo.esperar(",]") == "]":
+                return
+
+
+# FUNCIÓN: elige n preguntas al azar de un banco JSON en una sola pasada (muestreo de reservorio)
+def muestrear_categoria_flujo(ruta_json, n, rng=random):
+    """
+    Recorre el banco y su diario con memoria proporcional a n (no al tamaño del banco).
+    Cada pregunta termina en la muestra con la misma probabilidad. Devuelve los registros
+    compilados en orden aleatorio; con un archivo faltante o inválido, lo que haya en el diario.
+    """
+    nombre_archivo = os.path.basename(ruta_json)
+    info = {}
+    muestra = []
+    vistas = 0
+
+    def considerar(pregunta):
+        nonlocal vistas
+        if not isinstance(pregunta, dict):
+            return
+        if len(muestra) < n:
+            muestra.append(pregunta)  # Las primeras n entran directo
+        else:
+            j = rng.randrange(vistas + 1)  # La pregunta número vistas reemplaza a otra con prob. n/(vistas+1)
+            if j < n:
+                muestra[j] = pregunta
+        vistas += 1
+
+    try:
+        for pregunta in iterar_preguntas_json(ruta_json, info):
+            considerar(pregunta)
+    except FileNotFoundError:
+        pass  # Sin archivo: solo cuenta el diario
+    except json.JSONDecodeError:
+        print(f"JSON inválido en {nombre_archivo}.")
+        muestra.clear()
+        vistas = 0  # Igual que leer_categoria: el banco inválido cuenta como vacío
+    categoria = info.get("name") or info.get("category")
+    muestra = [normalizar_pregunta(q, categoria) for q in muestra]
+    for pregunta in leer_diarios(ruta_json):
+        if isinstance(pregunta, dict):
+            considerar(normalizar_pregunta(pregunta))
+    rng.shuffle(muestra)  # El reservorio guarda las primeras n en el orden del archivo
+    return muestra
+
+
+# FUNCIÓN: convierte un banco a otro formato ("json", "gz" o "xz")
+def convertir_banco(ruta_json, formato):
+    """
+    Compacta el diario del banco y escribe todas sus preguntas en "<nombre>.json" o "<nombre>.json.<formato>".
+    Devuelve la ruta nueva. El archivo original no se borra: la app sigue usando el que diga MAPA_ARCHIVOS.
+    """
+    if formato != "json" and "." + formato not in COMPRESORES:
+        raise ValueError(f"Formato desconocido: {formato} (json, {', '.join(e[1:] for e in COMPRESORES)})")
+    sin_compresion = ruta_json[:-3] if compresor_de(ruta_json) else ruta_json  # "Ciencia.json.gz" -> "Ciencia.json"
+    destino = sin_compresion if formato == "json" else f"{sin_compresion}.{formato}"
+    if destino == ruta_json:
+        return destino
+    with bloqueo_banco(ruta_json):
+        compactar_banco(ruta_json)  # Las preguntas del diario también pasan al banco nuevo
+        with open(ruta_json, "rb") as f:
+            datos = json.loads(descomprimir_banco(ruta_json, f.read()).decode("utf-8"))
+        with bloqueo_banco(destino):
+            escribir_banco(destino, datos)
+    return destino
+
+
+# === EJECUCIÓN DESDE LA LÍNEA DE COMANDOS ===
+# python bancos.py compactar Ciencia.json Futbol.json ...
+# python bancos.py convertir gz [Ciencia.json ...]   (sin archivos: todos los de MAPA_ARCHIVOS)
+
+if __name__ == "__main__":
+    if len(sys.argv) >= 3 and sys.argv[1] == "compactar":
+        for ruta in sys.argv[2:]:
+            print(f"{ruta}: {compactar_banco(ruta)} preguntas pasadas del diario al banco")
+    elif len(sys.argv) >= 3 and sys.argv[1] == "convertir":
+        rutas = sys.argv[3:] or [os.path.join(CARPETA_BANCOS, nombre) for nombre in MAPA_ARCHIVOS.values()]
+        for ruta in rutas:
+            if not os.path.exists(ruta):
+                print(f"{ruta}: no existe")
+                continue
+            destino = convertir_banco(ruta, sys.argv[2])
+            print(f"{ruta} ({os.path.getsize(ruta)} bytes) -> {destino} ({os.path.getsize(destino)} bytes)")
+        print("Para usarlos, cambiá los nombres en MAPA_ARCHIVOS (bancos.py).")
+    else:
+        print("Uso: python bancos.py compactar ARCHIVO.json [ARCHIVO.json ...]")
+        print("     python bancos.py convertir json|gz|xz [ARCHIVO ...]")
+        sys.exit(2)
@@ -0,0 +1,46 @@
+"""
+BENCHMARK: analítica con NumPy sobre un corpus sintético grande
+Mide por separado leer los JSON, pasar las preguntas a columnas y el análisis vectorizado.
+Uso: python benchmarks/bench_analitica.py [total_preguntas]
+"""
+
+import sys
+import tempfile
+import time
+
+from generar_bancos import escribir_bancos, tamano_bancos
+import analitica
+
+TOTAL_PREGUNTAS = 1_000_000
+
+
+def main():
+    if analitica.np is None:
+        print("Este benchmark necesita numpy: pip install numpy")
+        sys.exit(2)
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else TOTAL_PREGUNTAS
+    with tempfile.TemporaryDirectory() as carpeta:
+        mapa = escribir_bancos(carpeta, total)
+        print(f"{total} preguntas, {tamano_bancos(carpeta, mapa) / 1e6:.1f} MB")
+
+        inicio = time.perf_counter()
+        preguntas = analitica.leer_bancos([carpeta])
+        lectura = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        columnas = analitica.extraer_columnas(preguntas)
+        extraccion = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        informe = analitica.analizar_columnas(columnas)
+        analisis = time.perf_counter() - inicio
+
+    print(f"  leer JSON          {lectura:>7.3f} s")
+    print(f"  armar columnas     {extraccion:>7.3f} s")
+    print(f"  análisis (NumPy)   {analisis:>7.3f} s")
+    print(f"  posiciones {informe['posicion_respuesta']['conteos']}, "
+          f"única más larga {informe['sesgo_largo']['correcta_unica_mas_larga']:.1%}")
+
+
+if __name__ == "__main__":
+    main()
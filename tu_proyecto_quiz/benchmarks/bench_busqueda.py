@@ -0,0 +1,90 @@
+"""
+BENCHMARK: índice invertido de búsqueda sobre un corpus sintético grande
+Las palabras siguen una distribución de Zipf (pocas muy frecuentes, muchas raras), como en un texto real.
+Mide armar el índice, agregar una pregunta y el tiempo de varias consultas.
+Uso: python benchmarks/bench_busqueda.py [total_preguntas]
+"""
+
+import random
+import sys
+import time
+
+import generar_bancos  # noqa: F401 (agrega tu_proyecto_quiz al path)
+from busqueda import IndiceBusqueda
+
+TOTAL_PREGUNTAS = 1_000_000
+VOCABULARIO = 50_000
+REPETICIONES = 20
+AGREGADAS = 1000  # Preguntas que se agregan de a una después de armar el índice
+
+
+# FUNCIÓN: palabra sintética número i ("tema" + letras), para tener prefijos compartidos
+def palabra(i):
+    letras = "abcdefghijklmnopqrstuvwxyz"
+    sufijo = ""
+    while True:
+        i, resto = divmod(i, 26)
+        sufijo += letras[resto]
+        if not i:
+            return "tema" + sufijo
+
+
+# FUNCIÓN: genera las preguntas con palabras elegidas según Zipf
+def generar_corpus(total, rng):
+    palabras = [palabra(i) for i in range(VOCABULARIO)]
+    pesos = [1 / (rango + 1) for rango in range(VOCABULARIO)]
+    acumulados = []
+    suma = 0
+    for peso in pesos:
+        suma += peso
+        acumulados.append(suma)
+    for numero in range(total):
+        texto = rng.choices(palabras, cum_weights=acumulados, k=rng.randint(4, 10))
+        opciones = [" ".join(rng.choices(palabras, cum_weights=acumulados, k=2)) for _ in range(4)]
+        yield {"pregunta": "¿" + " ".join(texto) + "?", "opciones": opciones, "respuestaCorrecta": opciones[0]}
+
+
+# FUNCIÓN: tiempo promedio de una consulta (en milisegundos) y cantidad de resultados
+def medir(indice, consulta):
+    inicio = time.perf_counter()
+    for _ in range(REPETICIONES):
+        resultados = indice.buscar(consulta)
+    return (time.perf_counter() - inicio) / REPETICIONES * 1000, len(resultados)
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else TOTAL_PREGUNTAS
+    rng = random.Random(1234)
+    corpus = list(generar_corpus(total, rng))
+
+    inicio = time.perf_counter()
+    indice = IndiceBusqueda()
+    indice.agregar_banco("Sintética", corpus)
+    armado = time.perf_counter() - inicio
+    entradas = sum(len(lista) for lista in indice.listas.values())
+    print(f"{total} preguntas, {len(indice.listas)} palabras, {entradas} entradas "
+          f"({entradas * 4 / 1e6:.0f} MB en las listas)")
+    print(f"  armar el índice      {armado:>8.2f} s")
+
+    nuevas = list(generar_corpus(AGREGADAS, rng))
+    inicio = time.perf_counter()
+    for registro in nuevas:
+        indice.agregar("Sintética", registro)
+    print(f"  agregar una pregunta {(time.perf_counter() - inicio) / AGREGADAS * 1e6:>8.1f} µs")
+
+    consultas = {
+        "palabra rara": palabra(40_000) + " ",
+        "palabra media": palabra(500) + " ",
+        "palabra frecuente": palabra(3) + " ",
+        "rara + frecuente": f"{palabra(3)} {palabra(40_000)} ",
+        "dos medias": f"{palabra(200)} {palabra(300)} ",
+        "tres palabras": f"{palabra(5)} {palabra(50)} {palabra(500)} ",
+        "prefijo (mientras se escribe)": f"{palabra(200)} {palabra(1000)[:-1]}",
+    }
+    for nombre, consulta in consultas.items():
+        milisegundos, cantidad = medir(indice, consulta)
+        print(f"  {nombre:<30} {milisegundos:>8.2f} ms  ({cantidad} resultados)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+BENCHMARK: arranque con y sin la caché compilada de bancos
+Uso: python benchmarks/bench_cache_bancos.py [tamaños...]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+from generar_bancos import escribir_bancos, tamano_bancos
+import bancos
+
+TAMANOS = (1_000, 10_000, 100_000)  # Cantidad total de preguntas de cada prueba
+REPETICIONES = 5
+
+
+# FUNCIÓN: carga todos los bancos con json.load (comportamiento anterior)
+def cargar_sin_cache(carpeta, mapa):
+    datos = {}
+    for categoria, nombre in mapa.items():
+        with open(os.path.join(carpeta, nombre), "r", encoding="utf-8") as f:
+            datos[categoria] = json.load(f)
+    return datos
+
+
+# FUNCIÓN: carga todos los bancos con bancos.leer_banco (usa la caché si está al día)
+def cargar_con_cache(carpeta, mapa):
+    return {categoria: bancos.leer_banco(os.path.join(carpeta, nombre)) for categoria, nombre in mapa.items()}
+
+
+# FUNCIÓN: mejor tiempo de varias repeticiones
+def medir(funcion, *args):
+    mejor = float("inf")
+    for _ in range(REPETICIONES):
+        inicio = time.perf_counter()
+        funcion(*args)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def main():
+    tamanos = [int(t) for t in sys.argv[1:]] or TAMANOS
+    print(f"{'preguntas':>10} {'MB':>7} {'json.load':>11} {'1ª carga':>11} {'caché':>11} {'mejora':>8}")
+    for total in tamanos:
+        with tempfile.TemporaryDirectory() as carpeta:
+            mapa = escribir_bancos(carpeta, total)
+            megas = tamano_bancos(carpeta, mapa) / 1e6
+
+            t_json = medir(cargar_sin_cache, carpeta, mapa)
+
+            inicio = time.perf_counter()  # Primera carga: parsea y escribe la caché
+            cargar_con_cache(carpeta, mapa)
+            t_primera = time.perf_counter() - inicio
+
+            t_cache = medir(cargar_con_cache, carpeta, mapa)  # Arranques siguientes: caché al día
+            assert cargar_con_cache(carpeta, mapa) == cargar_sin_cache(carpeta, mapa)
+
+            print(f"{total:>10} {megas:>7.2f} {t_json * 1000:>9.1f}ms {t_primera * 1000:>9.1f}ms "
+                  f"{t_cache * 1000:>9.1f}ms {t_json / t_cache:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
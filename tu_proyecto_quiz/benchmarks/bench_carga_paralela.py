@@ -0,0 +1,52 @@
+"""
+BENCHMARK: carga de bancos en serie, con hilos y con procesos
+Uso: python benchmarks/bench_carga_paralela.py [archivos] [preguntas_por_archivo]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from generar_bancos import escribir_bancos, tamano_bancos
+import bancos
+
+ARCHIVOS = 64  # Cantidad de archivos de categoría
+PREGUNTAS_POR_ARCHIVO = 2_000
+REPETICIONES = 3
+
+
+# FUNCIÓN: mejor tiempo de varias cargas completas con un modo dado
+def medir(rutas, modo, carpeta_cache=None):
+    mejor = float("inf")
+    for _ in range(REPETICIONES):
+        if carpeta_cache:
+            shutil.rmtree(carpeta_cache, ignore_errors=True)  # Fuerza el parseo del JSON
+        inicio = time.perf_counter()
+        bancos.leer_categorias(rutas, modo)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def main():
+    archivos = int(sys.argv[1]) if len(sys.argv) > 1 else ARCHIVOS
+    por_archivo = int(sys.argv[2]) if len(sys.argv) > 2 else PREGUNTAS_POR_ARCHIVO
+    with tempfile.TemporaryDirectory() as carpeta:
+        mapa = escribir_bancos(carpeta, archivos * por_archivo, cantidad_archivos=archivos)
+        rutas = {c: os.path.join(carpeta, n) for c, n in mapa.items()}
+        carpeta_cache = os.path.join(carpeta, bancos.CARPETA_CACHE)
+        print(f"{archivos} archivos, {archivos * por_archivo} preguntas, "
+              f"{tamano_bancos(carpeta, mapa) / 1e6:.1f} MB, {os.cpu_count()} CPU")
+
+        assert bancos.leer_categorias(rutas, "serie") == bancos.leer_categorias(rutas, "procesos")
+        for caso, limpiar in (("sin caché (parseo JSON)", carpeta_cache), ("con caché al día", None)):
+            bancos.leer_categorias(rutas, "serie")  # Deja la caché al día para el segundo caso
+            tiempos = {modo: medir(rutas, modo, limpiar) for modo in ("serie", "hilos", "procesos")}
+            print(f"  {caso}:")
+            for modo, t in tiempos.items():
+                print(f"    {modo:<9} {t * 1000:>9.1f} ms  {tiempos['serie'] / t:>5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+BENCHMARK: bancos JSON con sangría, compactos y comprimidos (.json.gz / .json.xz)
+Para cada formato mide los bytes que hay que leer del disco, la carga sin caché (leer + descomprimir
++ parsear), la carga con la caché compilada al día, y estima la carga en un disco lento
+(bytes / velocidad + CPU), que es lo que pasa en los kioscos con tarjetas SD.
+Uso: python benchmarks/bench_compresion.py [total_preguntas] [MB/s del disco lento]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+from generar_bancos import escribir_bancos
+import bancos
+
+TOTAL_PREGUNTAS = 100_000
+VELOCIDAD_DISCO = 20  # MB/s: una tarjeta SD o un disco USB barato
+REPETICIONES = 5
+
+# Formato -> (extensión, función que escribe los bytes a partir de los datos)
+FORMATOS = {
+    "con sangría": (".json", lambda ruta, datos: bancos.serializar_banco(ruta, datos)),
+    "compacto": (".json", lambda ruta, datos: json.dumps(datos, ensure_ascii=False, separators=(",", ":")).encode("utf-8")),
+    "gzip": (".json.gz", lambda ruta, datos: bancos.serializar_banco(ruta, datos)),
+    "xz": (".json.xz", lambda ruta, datos: bancos.serializar_banco(ruta, datos)),
+}
+
+
+# FUNCIÓN: carga sin caché (lo que hace leer_banco la primera vez)
+def cargar_sin_cache(rutas):
+    leidos = 0
+    for ruta in rutas:
+        with open(ruta, "rb") as f:
+            contenido = f.read()
+        leidos += len(contenido)
+        json.loads(bancos.descomprimir_banco(ruta, contenido).decode("utf-8"))
+    return leidos
+
+
+# FUNCIÓN: carga con la caché compilada al día
+def cargar_con_cache(rutas):
+    for ruta in rutas:
+        bancos.leer_banco(ruta)
+
+
+# FUNCIÓN: mejor tiempo de varias repeticiones
+def medir(funcion, *args):
+    mejor = float("inf")
+    for _ in range(REPETICIONES):
+        inicio = time.perf_counter()
+        funcion(*args)
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else TOTAL_PREGUNTAS
+    velocidad = float(sys.argv[2]) if len(sys.argv) > 2 else VELOCIDAD_DISCO
+    with tempfile.TemporaryDirectory() as carpeta:
+        mapa = escribir_bancos(os.path.join(carpeta, "original"), total)
+        datos = {}
+        for nombre in mapa.values():
+            with open(os.path.join(carpeta, "original", nombre), encoding="utf-8") as f:
+                datos[nombre] = json.load(f)
+
+        print(f"{total} preguntas en {len(mapa)} archivos; disco lento: {velocidad:g} MB/s")
+        print(f"{'formato':<12} {'MB':>7} {'escribir':>9} {'sin caché':>10} {'con caché':>10} {'disco lento':>12}")
+        for formato, (extension, serializar) in FORMATOS.items():
+            rutas = []
+            inicio = time.perf_counter()
+            for nombre, preguntas in datos.items():
+                ruta = os.path.join(carpeta, formato.replace(" ", "_"), nombre[:-len(".json")] + extension)
+                os.makedirs(os.path.dirname(ruta), exist_ok=True)
+                with open(ruta, "wb") as f:
+                    f.write(serializar(ruta, preguntas))
+                rutas.append(ruta)
+            escritura = time.perf_counter() - inicio
+
+            leidos = cargar_sin_cache(rutas)
+            t_sin_cache = medir(cargar_sin_cache, rutas)
+            cargar_con_cache(rutas)  # Primera carga: escribe la caché
+            t_con_cache = medir(cargar_con_cache, rutas)
+            assert [bancos.leer_banco(r) for r in rutas] == list(datos.values())
+            lento = leidos / (velocidad * 1e6) + t_sin_cache  # El archivo entero pasa por el disco lento
+
+            print(f"{formato:<12} {leidos / 1e6:>7.2f} {escritura * 1000:>7.0f}ms {t_sin_cache * 1000:>8.0f}ms "
+                  f"{t_con_cache * 1000:>8.0f}ms {lento * 1000:>10.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+BENCHMARK: sacar 10 preguntas de un banco JSON enorme, cargándolo entero vs en flujo (reservorio)
+Mide tiempo y pico de memoria (tracemalloc) de cada camino, para los dos formatos de banco.
+Uso: python benchmarks/bench_flujo.py [tamaños...]
+"""
+
+import gc
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from generar_bancos import generar_pregunta
+import bancos
+
+TAMANOS = (10_000, 100_000, 1_000_000)
+NUMERO_PREGUNTAS = 10
+
+
+# FUNCIÓN: escribe un banco de n preguntas en formato lista o envoltorio de trivia
+def escribir_banco(ruta, n, envoltorio):
+    rng = random.Random(11)
+    with open(ruta, "w", encoding="utf-8") as f:
+        f.write('{"category": "bench", "name": "Bench", "questions": [\n' if envoltorio else "[\n")
+        for i in range(n):
+            q = generar_pregunta(i, "Bench", rng)
+            if envoltorio:  # Mismas preguntas con las claves de trivia
+                q = {"id": q["id"], "question": q["pregunta"], "options": q["opciones"],
+                     "correct": q["opciones"].index(q["respuestaCorrecta"])}
+            f.write((",\n" if i else "") + json.dumps(q, ensure_ascii=False, indent=2))
+        f.write("\n]}" if envoltorio else "\n]")
+
+
+# FUNCIÓN: lo que hacía iniciar_quiz con el banco JSON: cargar, mezclar y tomar 10
+def cargar_entero(ruta):
+    preguntas = list(bancos.leer_categoria(ruta))
+    random.shuffle(preguntas)
+    return preguntas[:NUMERO_PREGUNTAS]
+
+
+# FUNCIÓN: segundos y pico de memoria (bytes) de una llamada
+def medir(funcion, ruta):
+    gc.collect()
+    inicio = time.perf_counter()
+    funcion(ruta)
+    transcurrido = time.perf_counter() - inicio  # Sin tracemalloc, que frena mucho la lectura
+    tracemalloc.start()
+    muestra = funcion(ruta)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(muestra) == NUMERO_PREGUNTAS
+    return transcurrido, pico
+
+
+def main():
+    tamanos = [int(t) for t in sys.argv[1:]] or TAMANOS
+    print(f"{'preguntas':>10} {'formato':>10} {'entero':>10} {'pico':>10} {'flujo':>10} {'pico':>10}")
+    for n in tamanos:
+        for envoltorio in (False, True):
+            with tempfile.TemporaryDirectory() as carpeta:
+                ruta = os.path.join(carpeta, "Bench.json")
+                escribir_banco(ruta, n, envoltorio)
+                t_entero, m_entero = medir(cargar_entero, ruta)  # Primera lectura sin caché compilada
+                t_flujo, m_flujo = medir(lambda r: bancos.muestrear_categoria_flujo(r, NUMERO_PREGUNTAS), ruta)
+            formato = "trivia" if envoltorio else "lista"
+            print(f"{n:>10} {formato:>10} {t_entero:>9.2f}s {m_entero / 1e6:>8.1f}MB "
+                  f"{t_flujo:>9.2f}s {m_flujo / 1e6:>8.2f}MB")
+
+
+if __name__ == "__main__":
+    main()
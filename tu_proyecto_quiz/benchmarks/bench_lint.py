@@ -0,0 +1,37 @@
+"""
+BENCHMARK: lint de todos los bancos, en un proceso vs con el pool de procesos
+Uso: python benchmarks/bench_lint.py [total_preguntas] [archivos]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from generar_bancos import escribir_bancos, tamano_bancos
+import lint_bancos
+
+TOTAL_PREGUNTAS = 1_000_000
+ARCHIVOS = 8
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else TOTAL_PREGUNTAS
+    archivos = int(sys.argv[2]) if len(sys.argv) > 2 else ARCHIVOS
+    with tempfile.TemporaryDirectory() as carpeta:
+        mapa = escribir_bancos(carpeta, total, cantidad_archivos=archivos)
+        rutas = [os.path.join(carpeta, n) for n in mapa.values()]
+        print(f"{archivos} archivos, {total} preguntas, {tamano_bancos(carpeta, mapa) / 1e6:.1f} MB, "
+              f"{os.cpu_count()} CPU")
+        for nombre, procesos in (("un proceso", 1), ("pool", None)):
+            inicio = time.perf_counter()
+            informes = lint_bancos.revisar_bancos(rutas, procesos)
+            transcurrido = time.perf_counter() - inicio
+            revisadas = sum(i["preguntas"] for i in informes)
+            problemas = sum(len(i["problemas"]) for i in informes)
+            print(f"  {nombre:<11} {transcurrido:>7.2f} s  {revisadas / transcurrido:>10.0f} preguntas/s  "
+                  f"({problemas} problemas)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+BENCHMARK: memoria de las preguntas en diccionarios vs Preguntas compactas (tracemalloc)
+Uso: python benchmarks/bench_memoria_registros.py [tamaños...]
+"""
+
+import gc
+import json
+import random
+import sys
+import tracemalloc
+
+from generar_bancos import generar_pregunta
+from registros import compilar_banco, registros_compactos
+
+TAMANOS = (10_000, 100_000, 1_000_000)
+
+# Opciones muy repetidas, como en los bancos reales (años, países, jugadores...)
+OPCIONES_COMUNES = [str(anio) for anio in range(1950, 2025)] + ["Brasil", "Argentina", "Messi", "Pelé", "Maradona"]
+
+
+# FUNCIÓN: genera n preguntas con el mismo camino que la carga real (JSON -> dicts compilados)
+def preguntas_como_json(n):
+    rng = random.Random(5)
+    preguntas = []
+    for i in range(n):
+        q = generar_pregunta(i, "Futbol", rng)
+        q["opciones"][1:3] = rng.sample(OPCIONES_COMUNES, 2)  # Mitad de las opciones se repiten
+        preguntas.append(q)
+    return json.dumps(preguntas, ensure_ascii=False)  # Texto a decodificar dentro de la medición
+
+
+# FUNCIÓN: bytes retenidos por la estructura que devuelve construir(texto_json)
+def medir(construir, texto_json):
+    gc.collect()
+    tracemalloc.start()
+    datos = construir(texto_json)
+    gc.collect()
+    actual, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del datos
+    return actual
+
+
+def main():
+    tamanos = [int(t) for t in sys.argv[1:]] or TAMANOS
+    print(f"{'preguntas':>10} {'dict+list':>12} {'Pregunta':>12} {'B/preg dict':>12} {'B/preg slots':>13} {'ahorro':>7}")
+    for n in tamanos:
+        texto = preguntas_como_json(n)
+        m_dict = medir(lambda t: compilar_banco(json.loads(t)), texto)
+        m_slots = medir(lambda t: registros_compactos(compilar_banco(json.loads(t))), texto)
+        print(f"{n:>10} {m_dict / 1e6:>10.1f}MB {m_slots / 1e6:>10.1f}MB {m_dict / n:>12.0f} {m_slots / n:>13.0f} "
+              f"{1 - m_slots / m_dict:>6.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+BENCHMARK: tiempo hasta la primera pregunta y memoria residente, JSON vs banco mmap
+Cada medición corre en un proceso aparte para que la memoria de una no ensucie la otra.
+Uso: python benchmarks/bench_mmap.py [tamaños...]
+"""
+
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+from generar_bancos import generar_pregunta
+import banco_mmap
+import bancos
+
+TAMANOS = (10_000, 1_000_000, 10_000_000)
+LIMITE_JSON = 1_000_000  # Más allá, el camino JSON necesitaría varios GB de RAM: no se mide
+NUMERO_PREGUNTAS = 10
+
+
+# FUNCIÓN: preguntas sintéticas de una categoría, de a una (sin tenerlas todas en memoria)
+def generar(n):
+    rng = random.Random(3)
+    for i in range(n):
+        yield generar_pregunta(i, "Bench", rng)
+
+
+# FUNCIÓN: escribe el JSON de una categoría de a una pregunta
+def escribir_json(ruta, n):
+    with open(ruta, "w", encoding="utf-8") as f:
+        f.write("[\n")
+        for i, q in enumerate(generar(n)):
+            f.write((",\n" if i else "") + json.dumps(q, ensure_ascii=False, indent=2))
+        f.write("\n]")
+
+
+# FUNCIÓN: memoria residente actual del proceso en kB
+# (no se usa ru_maxrss: el hijo hereda el pico del proceso que lo lanzó)
+def rss_kb():
+    with open("/proc/self/status") as f:
+        return int(f.read().split("VmRSS:")[1].split()[0])
+
+
+# FUNCIÓN: medición dentro del proceso hijo; imprime "segundos rss_kb"
+def medir_en_hijo(modo, ruta):
+    rss_inicial = rss_kb()
+    inicio = time.perf_counter()
+    if modo == "json":  # Lo que hace iniciar_quiz con el backend JSON
+        preguntas = list(bancos.leer_categoria(ruta))
+        random.shuffle(preguntas)
+        primera = preguntas[:NUMERO_PREGUNTAS][0]
+    else:
+        banco = banco_mmap.BancoMmap(ruta)
+        primera = banco.muestrear(NUMERO_PREGUNTAS)[0]
+    transcurrido = time.perf_counter() - inicio
+    assert primera["pregunta"]
+    rss = rss_kb() - rss_inicial  # Con las preguntas todavía vivas
+    print(f"{transcurrido} {rss}")
+
+
+# FUNCIÓN: lanza la medición en un proceso nuevo
+def medir(modo, ruta):
+    salida = subprocess.run([sys.executable, os.path.abspath(__file__), "--medir", modo, ruta],
+                            capture_output=True, text=True, check=True).stdout.split()
+    return float(salida[0]), int(salida[1])
+
+
+def main():
+    tamanos = [int(t) for t in sys.argv[1:]] or TAMANOS
+    print(f"{'preguntas':>11} {'JSON 1ª preg':>13} {'JSON RSS':>10} {'mmap 1ª preg':>13} {'mmap RSS':>10} {'.banco MB':>10}")
+    for n in tamanos:
+        with tempfile.TemporaryDirectory() as carpeta:
+            ruta_json = os.path.join(carpeta, "Bench.json")
+            ruta_banco = banco_mmap.ruta_mmap(ruta_json)
+            if n <= LIMITE_JSON:
+                escribir_json(ruta_json, n)
+                bancos.leer_categoria(ruta_json)  # Caché compilada al día, como en un arranque normal
+                t_json, rss_json = medir("json", ruta_json)
+                banco_mmap.convertir_json(ruta_json)
+                columnas_json = f"{t_json * 1000:>11.1f}ms {rss_json / 1024:>8.1f}MB"
+            else:
+                banco_mmap.escribir_banco_mmap(ruta_banco, generar(n))
+                columnas_json = f"{'-':>13} {'-':>10}"
+            t_mmap, rss_mmap = medir("mmap", ruta_banco)
+            megas = os.path.getsize(ruta_banco) / 1e6
+        print(f"{n:>11} {columnas_json} {t_mmap * 1000:>11.2f}ms {rss_mmap / 1024:>8.1f}MB {megas:>10.1f}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "--medir":
+        medir_en_hijo(sys.argv[2], sys.argv[3])
+    else:
+        main()
@@ -0,0 +1,119 @@
+"""
+BENCHMARK: protocolo binario (protocolo_binario.py) contra JSON por línea (servidor_juego.py)
+Para una sala de N jugadores y 10 preguntas compara, en mensajes por segundo y bytes:
+- la pregunta: JSON con los textos en cada ronda, contra PREGUNTA (una vez) + RONDA
+- las respuestas: el cliente codifica, el servidor separa las tramas de lo recibido y decodifica
+- los puntajes de cada ronda: lista de cambios en JSON contra PUNTAJES
+Uso: python benchmarks/bench_protocolo.py [jugadores]
+"""
+
+import json
+import random
+import sys
+import time
+
+from generar_bancos import generar_pregunta
+import protocolo_binario as binario
+from registros import compilar_banco
+from servidor_juego import mensaje
+from sesion_quiz import NUMERO_PREGUNTAS, TIEMPO_POR_PREGUNTA
+
+JUGADORES = 10_000
+SALA = "QXZT"
+
+
+# FUNCIÓN: mejor de 3 vueltas (segundos)
+def medir(funcion):
+    mejor = float("inf")
+    for _ in range(3):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def informar(titulo, cantidad, tiempo_json, bytes_json, tiempo_binario, bytes_binario):
+    print(f"  {titulo}")
+    print(f"    JSON     {cantidad / tiempo_json:>12,.0f} mensajes/s  {bytes_json:>12,} bytes")
+    print(f"    binario  {cantidad / tiempo_binario:>12,.0f} mensajes/s  {bytes_binario:>12,} bytes  "
+          f"(velocidad x{tiempo_json / tiempo_binario:.1f}, {bytes_binario / bytes_json:.0%} de los bytes)")
+
+
+# FUNCIÓN: JSON por línea: separar las líneas de lo recibido y decodificar cada una
+def separar_lineas(buffer):
+    return [json.loads(linea) for linea in buffer.split(b"\n") if linea]
+
+
+def main():
+    jugadores = int(sys.argv[1]) if len(sys.argv) > 1 else JUGADORES
+    rng = random.Random(1234)
+    preguntas = compilar_banco([generar_pregunta(n, "Sintética", rng) for n in range(NUMERO_PREGUNTAS)])
+    print(f"Sala de {jugadores} jugadores, {NUMERO_PREGUNTAS} preguntas")
+
+    # --- Preguntas: el servidor codifica una vez por ronda, cada jugador decodifica la suya ---
+    def preguntas_json():
+        for numero, q in enumerate(preguntas):
+            datos = mensaje(tipo="pregunta", numero=numero, total=NUMERO_PREGUNTAS, pregunta=q["pregunta"],
+                            opciones=list(q["opciones"]), tiempo=TIEMPO_POR_PREGUNTA)
+            json.loads(datos)
+
+    def preguntas_binario():
+        for numero, q in enumerate(preguntas):
+            datos = binario.codificar_pregunta(q, numero) + binario.codificar_ronda(numero, numero, NUMERO_PREGUNTAS,
+                                                                                    TIEMPO_POR_PREGUNTA)
+            for tipo, cuerpo in binario.separar_tramas(datos)[0]:
+                binario.decodificar(tipo, cuerpo)
+
+    bytes_json = sum(len(mensaje(tipo="pregunta", numero=n, total=NUMERO_PREGUNTAS, pregunta=q["pregunta"],
+                                 opciones=list(q["opciones"]), tiempo=TIEMPO_POR_PREGUNTA))
+                     for n, q in enumerate(preguntas))
+    bytes_binario = sum(len(binario.codificar_pregunta(q, n)) + len(binario.codificar_ronda(n, n, 10, 15))
+                        for n, q in enumerate(preguntas))
+    informar("preguntas (codificar + decodificar; bytes enviados a toda la sala)", NUMERO_PREGUNTAS,
+             medir(preguntas_json), bytes_json * jugadores, medir(preguntas_binario), bytes_binario * jugadores)
+
+    # --- Respuestas: todos responden las 10 preguntas ---
+    respuestas = [(jugador, numero, rng.randrange(4), rng.randrange(1 << 32))
+                  for numero in range(NUMERO_PREGUNTAS) for jugador in range(jugadores)]
+
+    def codificar_json():
+        return b"".join([json.dumps({"tipo": "responder", "sala": SALA, "jugador": jugador, "numero": numero,
+                                     "opcion": opcion, "ms": ms}, separators=(",", ":")).encode("utf-8") + b"\n"
+                         for jugador, numero, opcion, ms in respuestas])
+
+    def codificar_binario():
+        return b"".join([binario.codificar_respuesta(SALA, jugador, numero, opcion, ms)
+                         for jugador, numero, opcion, ms in respuestas])
+
+    recibido_json, recibido_binario = codificar_json(), codificar_binario()
+
+    def decodificar_binario():
+        return [binario.decodificar_respuesta(cuerpo) for _, cuerpo in binario.separar_tramas(recibido_binario)[0]]
+
+    assert len(decodificar_binario()) == len(separar_lineas(recibido_json)) == len(respuestas)
+    print()
+    informar("respuestas: codificar en el cliente", len(respuestas),
+             medir(codificar_json), len(recibido_json), medir(codificar_binario), len(recibido_binario))
+    informar("respuestas: separar y decodificar en el servidor", len(respuestas),
+             medir(lambda: separar_lineas(recibido_json)), len(recibido_json),
+             medir(decodificar_binario), len(recibido_binario))
+
+    # --- Puntajes: en cada ronda acierta alrededor de un cuarto de la sala ---
+    rondas = [[(jugador, 1) for jugador in range(jugadores) if rng.random() < 0.25] for _ in range(NUMERO_PREGUNTAS)]
+
+    def puntajes_json():
+        for numero, cambios in enumerate(rondas):
+            json.loads(mensaje(tipo="puntajes", numero=numero, cambios=cambios))
+
+    def puntajes_binario():
+        for numero, cambios in enumerate(rondas):
+            binario.decodificar_puntajes(binario.codificar_puntajes(numero, cambios)[binario.CABECERA.size:])
+
+    print()
+    informar("puntajes: lista de cambios por ronda (codificar + decodificar)", len(rondas),
+             medir(puntajes_json), sum(len(mensaje(tipo="puntajes", numero=n, cambios=c)) for n, c in enumerate(rondas)),
+             medir(puntajes_binario), sum(len(binario.codificar_puntajes(n, c)) for n, c in enumerate(rondas)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+BENCHMARK: muchas partidas independientes (SesionQuiz) sobre un mismo banco en memoria
+Mide partidas por segundo (crear + jugar las 10 preguntas con una ayuda y un tiempo agotado)
+y la memoria de cada partida abierta, comparada con elegir las preguntas como lo hacía
+quiz-app.py (copiar el banco entero, mezclarlo y quedarse con 10).
+Uso: python benchmarks/bench_sesiones.py [sesiones] [preguntas_del_banco]
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+
+from generar_bancos import generar_pregunta
+from registros import compilar_banco
+from sesion_quiz import NUMERO_PREGUNTAS, TIEMPO_POR_PREGUNTA, SesionQuiz
+
+SESIONES = 100_000
+PREGUNTAS_BANCO = 10_000
+
+
+# FUNCIÓN: juega una partida completa con respuestas al azar
+def jugar(sesion, rng):
+    sesion.usar_ayuda(rng=rng)
+    while True:
+        if sesion.indice == 3:
+            for _ in range(TIEMPO_POR_PREGUNTA):  # En una pregunta se le acaba el tiempo
+                sesion.descontar_segundo()
+        else:
+            sesion.responder(rng.randrange(4))
+        if not sesion.siguiente():
+            return sesion.resultados()
+
+
+# FUNCIÓN: elección de preguntas anterior (copia + mezcla del banco entero)
+def elegir_como_antes(banco, rng):
+    preguntas = list(banco)
+    rng.shuffle(preguntas)
+    return preguntas[:NUMERO_PREGUNTAS]
+
+
+def main():
+    sesiones = int(sys.argv[1]) if len(sys.argv) > 1 else SESIONES
+    tamano_banco = int(sys.argv[2]) if len(sys.argv) > 2 else PREGUNTAS_BANCO
+    rng = random.Random(1234)
+    banco = compilar_banco([generar_pregunta(n, "Sintética", rng) for n in range(tamano_banco)])
+    print(f"{sesiones} sesiones sobre un banco de {tamano_banco} preguntas")
+
+    inicio = time.perf_counter()
+    for _ in range(sesiones):
+        SesionQuiz("Sintética", banco, rng=rng)
+    creacion = time.perf_counter() - inicio
+    print(f"  crear una sesión           {creacion / sesiones * 1e6:>8.2f} µs")
+
+    repeticiones = max(1, min(sesiones, 2_000_000 // tamano_banco))  # La copia del banco es lenta: menos vueltas
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        elegir_como_antes(banco, rng)
+    print(f"  copiar y mezclar el banco  {(time.perf_counter() - inicio) / repeticiones * 1e6:>8.2f} µs (como antes)")
+
+    inicio = time.perf_counter()
+    puntos = 0
+    for _ in range(sesiones):
+        puntos += jugar(SesionQuiz("Sintética", banco, rng=rng), rng)[0]
+    partidas = time.perf_counter() - inicio
+    print(f"  partidas completas         {sesiones / partidas:>8.0f} por segundo "
+          f"(puntaje promedio {puntos / sesiones:.2f}/{NUMERO_PREGUNTAS})")
+
+    # Memoria: todas las sesiones abiertas a la vez (el banco ya estaba cargado y no cuenta)
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    abiertas = [SesionQuiz("Sintética", banco, rng=rng) for _ in range(sesiones)]
+    por_sesion = (tracemalloc.get_traced_memory()[0] - antes) / len(abiertas)
+    tracemalloc.stop()
+    print(f"  memoria por sesión         {por_sesion:>8.0f} bytes "
+          f"({por_sesion * len(abiertas) / 1e6:.1f} MB para {len(abiertas)} sesiones abiertas)")
+
+
+if __name__ == "__main__":
+    main()
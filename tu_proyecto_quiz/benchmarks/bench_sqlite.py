@@ -0,0 +1,61 @@
+"""
+BENCHMARK: latencia de contar, muestrear e insertar en el backend SQLite
+Uso: python benchmarks/bench_sqlite.py [tamaños...]
+"""
+
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+from generar_bancos import generar_pregunta
+import banco_sqlite
+
+TAMANOS = (1_000, 100_000, 1_000_000)  # Filas de la categoría medida
+REPETICIONES = 200
+REPETICIONES_LENTAS = 10  # Para ORDER BY random(), que recorre toda la categoría
+NUMERO_PREGUNTAS = 10
+LOTE = 50_000  # Filas por transacción al llenar la base
+
+
+# FUNCIÓN: mediana en microsegundos de varias llamadas
+def mediana_us(funcion, *args, repeticiones=REPETICIONES):
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion(*args)
+        tiempos.append(time.perf_counter() - inicio)
+    return statistics.median(tiempos) * 1e6
+
+
+# FUNCIÓN: llena la categoría "Bench" con n preguntas sintéticas
+def llenar(conexion, n):
+    rng = random.Random(7)
+    for inicio in range(0, n, LOTE):
+        lote = [generar_pregunta(i, "Bench", rng) for i in range(inicio, min(n, inicio + LOTE))]
+        banco_sqlite.insertar_muchas(conexion, "Bench", lote)
+
+
+def main():
+    tamanos = [int(t) for t in sys.argv[1:]] or TAMANOS
+    print(f"{'filas':>10} {'contar':>10} {'muestrear':>11} {'ORDER BY random()':>18} {'insertar':>10}")
+    rng = random.Random(99)
+    for n in tamanos:
+        with tempfile.TemporaryDirectory() as carpeta:
+            conexion = banco_sqlite.abrir_base(os.path.join(carpeta, "bench.sqlite3"))
+            llenar(conexion, n)
+            assert banco_sqlite.contar(conexion, "Bench") == n
+
+            t_contar = mediana_us(banco_sqlite.contar, conexion, "Bench")
+            t_muestra = mediana_us(banco_sqlite.muestrear, conexion, "Bench", NUMERO_PREGUNTAS)
+            t_random = mediana_us(banco_sqlite.muestrear_order_by_random, conexion, "Bench", NUMERO_PREGUNTAS,
+                                  repeticiones=REPETICIONES_LENTAS)
+            t_insertar = mediana_us(lambda: banco_sqlite.insertar(conexion, "Bench", generar_pregunta(0, "Bench", rng)))
+            conexion.close()
+        print(f"{n:>10} {t_contar:>8.1f}us {t_muestra:>9.1f}us {t_random:>16.1f}us {t_insertar:>8.1f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+BENCHMARK: RuedaTemporizadores contra una tarea de asyncio con sleep por sala
+1) Programar y cancelar un temporizador: rueda, loop.call_later y crear/cancelar una tarea con asyncio.sleep
+2) Cuenta regresiva de muchas salas a la vez: cada sala hace TICS tics de PASO segundos y después
+   "tiempo agotado". Con tareas, cada sala es una tarea que duerme; con la rueda, un solo bucle.
+   Informa CPU usada, cuánto tarde llegó el tiempo agotado (p50, p99, máximo) y memoria por sala.
+Uso: python benchmarks/bench_temporizadores.py [--salas 100000] [--tics 5] [--paso 0.2]
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+
+import generar_bancos  # noqa: F401 (agrega tu_proyecto_quiz al path)
+from enjambre_bots import percentil
+from rueda_temporizadores import RuedaTemporizadores
+
+SALAS = 100_000
+TICS = 5
+PASO = 0.2  # Segundos entre tics (en el servidor es 1)
+OPERACIONES = 200_000
+
+
+def nada():
+    pass
+
+
+# === 1) PROGRAMAR Y CANCELAR ===
+
+async def programar_y_cancelar(operaciones):
+    resultados = {}
+    rueda = RuedaTemporizadores()
+    inicio = time.perf_counter()
+    temporizadores = [rueda.programar(15, nada) for _ in range(operaciones)]
+    medio = time.perf_counter()
+    for temporizador in temporizadores:
+        rueda.cancelar(temporizador)
+    resultados["rueda"] = (medio - inicio, time.perf_counter() - medio)
+
+    loop = asyncio.get_running_loop()
+    inicio = time.perf_counter()
+    manejadores = [loop.call_later(15, nada) for _ in range(operaciones)]
+    medio = time.perf_counter()
+    for manejador in manejadores:
+        manejador.cancel()
+    resultados["loop.call_later"] = (medio - inicio, time.perf_counter() - medio)
+    await asyncio.sleep(0)
+
+    inicio = time.perf_counter()
+    tareas = [asyncio.create_task(asyncio.sleep(15)) for _ in range(operaciones)]
+    await asyncio.sleep(0)  # Que cada tarea llegue a su sleep (ahí queda el temporizador programado)
+    medio = time.perf_counter()
+    for tarea in tareas:
+        tarea.cancel()
+    await asyncio.gather(*tareas, return_exceptions=True)  # La cancelación termina cuando cada tarea la procesa
+    resultados["tarea con asyncio.sleep"] = (medio - inicio, time.perf_counter() - medio)
+    return resultados
+
+
+# === 2) CUENTA REGRESIVA DE MUCHAS SALAS ===
+
+async def cuenta_con_tareas(salas, tics, paso):
+    atrasos = []
+
+    async def sala():
+        vence = time.monotonic() + tics * paso
+        for _ in range(tics):
+            await asyncio.sleep(paso)
+        atrasos.append(time.monotonic() - vence)  # Tiempo agotado
+
+    tareas = [asyncio.create_task(sala()) for _ in range(salas)]
+    await asyncio.gather(*tareas)
+    return atrasos
+
+
+async def cuenta_con_rueda(salas, tics, paso):
+    rueda = RuedaTemporizadores()
+    atrasos = []
+    terminadas = asyncio.Event()
+
+    def tic(restantes, vence):
+        if restantes > 1:
+            rueda.programar(paso, tic, restantes - 1, vence)
+            return
+        atrasos.append(time.monotonic() - vence)
+        if len(atrasos) == salas:
+            terminadas.set()
+
+    reloj = asyncio.create_task(rueda.correr())
+    for _ in range(salas):
+        rueda.programar(paso, tic, tics, time.monotonic() + tics * paso)
+    await terminadas.wait()
+    reloj.cancel()
+    return atrasos
+
+
+def medir_cuenta(corrutina, salas, tics, paso):
+    cpu = time.process_time()
+    inicio = time.perf_counter()
+    atrasos = sorted(asyncio.run(corrutina(salas, tics, paso)))
+    return time.perf_counter() - inicio, time.process_time() - cpu, atrasos
+
+
+# FUNCIÓN: memoria de "salas" temporizadores esperando (tracemalloc)
+def memoria_por_sala(salas):
+    async def con_tareas():
+        tracemalloc.start()
+        antes = tracemalloc.get_traced_memory()[0]
+        tareas = [asyncio.create_task(asyncio.sleep(15)) for _ in range(salas)]
+        await asyncio.sleep(0)
+        usada = tracemalloc.get_traced_memory()[0] - antes
+        tracemalloc.stop()
+        for tarea in tareas:
+            tarea.cancel()
+        await asyncio.gather(*tareas, return_exceptions=True)
+        return usada / salas
+
+    rueda = RuedaTemporizadores()
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    temporizadores = [rueda.programar(15, nada) for _ in range(salas)]
+    usada = (tracemalloc.get_traced_memory()[0] - antes) / salas
+    tracemalloc.stop()
+    del temporizadores
+    return usada, asyncio.run(con_tareas())
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--salas", type=int, default=SALAS)
+    parser.add_argument("--tics", type=int, default=TICS)
+    parser.add_argument("--paso", type=float, default=PASO)
+    argumentos = parser.parse_args()
+
+    print(f"Programar y cancelar {OPERACIONES} temporizadores")
+    for nombre, (programar, cancelar) in asyncio.run(programar_y_cancelar(OPERACIONES)).items():
+        print(f"  {nombre:<24} programar {programar / OPERACIONES * 1e9:>7.0f} ns   "
+              f"cancelar {cancelar / OPERACIONES * 1e9:>7.0f} ns")
+
+    ideal = argumentos.tics * argumentos.paso
+    print(f"\n{argumentos.salas} salas, {argumentos.tics} tics de {argumentos.paso:g} s (ideal {ideal:g} s)")
+    for nombre, corrutina in (("una tarea por sala", cuenta_con_tareas), ("rueda", cuenta_con_rueda)):
+        duracion, cpu, atrasos = medir_cuenta(corrutina, argumentos.salas, argumentos.tics, argumentos.paso)
+        print(f"  {nombre:<20} total {duracion:>6.2f} s  CPU {cpu:>6.2f} s  "
+              f"atraso p50 {percentil(atrasos, 50) * 1000:>6.0f} ms  p99 {percentil(atrasos, 99) * 1000:>6.0f} ms  "
+              f"máx {atrasos[-1] * 1000:>6.0f} ms")
+
+    rueda, tareas = memoria_por_sala(argumentos.salas)
+    print(f"\nMemoria por sala esperando: rueda {rueda:.0f} bytes, tarea con sleep {tareas:.0f} bytes")
+
+
+if __name__ == "__main__":
+    main()
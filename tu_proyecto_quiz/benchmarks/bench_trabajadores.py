@@ -0,0 +1,132 @@
+"""
+BENCHMARK: respuestas por segundo del servidor multijugador según la cantidad de procesos trabajadores
+Para 1, 2, 4, ... trabajadores (hasta los núcleos de la máquina) levanta servidor_juego.py con
+--trabajadores N --pausa 0 y lo carga desde varios procesos cliente: cada uno crea sus salas,
+une a sus bots, espera a que todos los clientes estén listos y arranca todas las salas a la vez.
+Los bots responden apenas llega la pregunta, así que se mide lo que el servidor aguanta, no lo que piensan.
+Rendimiento = respuestas confirmadas / (último fin - primer inicio). Tiene sentido en Linux con
+varios núcleos libres: con menos núcleos que trabajadores + clientes no puede escalar.
+Uso: python benchmarks/bench_trabajadores.py [--salas 64] [--jugadores 50] [--clientes N] [--trabajadores 1,2,4]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+
+from enjambre_bots import CATEGORIA, bot, enviar, recibir
+from generar_bancos import CARPETA_PROYECTO
+
+SALAS = 64
+JUGADORES_POR_SALA = 50
+CONEXIONES_A_LA_VEZ = 200
+
+
+# FUNCIÓN: levanta el servidor con N trabajadores y devuelve (proceso, puerto)
+def levantar_servidor(trabajadores):
+    proceso = subprocess.Popen([sys.executable, os.path.join(CARPETA_PROYECTO, "servidor_juego.py"),
+                                "--host", "127.0.0.1", "--puerto", "0", "--pausa", "0",
+                                "--trabajadores", str(trabajadores)], stdout=subprocess.PIPE, text=True)
+    linea = proceso.stdout.readline()  # "Escuchando en 127.0.0.1:PUERTO"
+    if not linea:
+        raise RuntimeError("El servidor no arrancó")
+    return proceso, int(linea.rsplit(":", 1)[1])
+
+
+# FUNCIÓN: las salas de un proceso cliente: crear, unir a todos, esperar la barrera y jugar
+async def salas_de_un_cliente(numero, puerto, salas, jugadores, barrera):
+    rng = random.Random(numero)
+    anfitriones = []
+    for _ in range(salas):
+        lector, escritor = await asyncio.open_connection("127.0.0.1", puerto)
+        enviar(escritor, tipo="crear", categoria=CATEGORIA)
+        anfitriones.append((lector, escritor, (await recibir(lector))["sala"]))
+
+    unidos_total = 0
+    todos_unidos = asyncio.Event()
+
+    def unidos():
+        nonlocal unidos_total
+        unidos_total += 1
+        if unidos_total == salas * jugadores:
+            todos_unidos.set()
+
+    latencias, errores = [], []
+    entrada = asyncio.Semaphore(CONEXIONES_A_LA_VEZ)
+    tareas = [asyncio.create_task(bot(n, "127.0.0.1", puerto, sala, 0, entrada, unidos, latencias, errores, rng))
+              for _, _, sala in anfitriones for n in range(jugadores)]
+    await todos_unidos.wait()
+    await asyncio.to_thread(barrera.wait)  # Todos los clientes arrancan sus salas juntos
+
+    inicio = time.monotonic()  # Reloj del sistema: se puede comparar entre procesos
+    for _, escritor, _ in anfitriones:
+        enviar(escritor, tipo="empezar")
+    await asyncio.gather(*tareas)
+    fin = time.monotonic()
+    for _, escritor, _ in anfitriones:
+        escritor.close()
+    return inicio, fin, len(latencias), len(errores)
+
+
+def proceso_cliente(numero, puerto, salas, jugadores, barrera, resultados):
+    resultados.put(asyncio.run(salas_de_un_cliente(numero, puerto, salas, jugadores, barrera)))
+
+
+# FUNCIÓN: una medición completa con N trabajadores
+def medir(trabajadores, clientes, salas, jugadores):
+    proceso, puerto = levantar_servidor(trabajadores)
+    try:
+        contexto = multiprocessing.get_context("fork")
+        barrera = contexto.Barrier(clientes)
+        resultados = contexto.Queue()
+        reparto = [salas // clientes + (c < salas % clientes) for c in range(clientes)]
+        procesos = [contexto.Process(target=proceso_cliente, args=(c, puerto, reparto[c], jugadores, barrera, resultados))
+                    for c in range(clientes)]
+        for p in procesos:
+            p.start()
+        medidas = [resultados.get() for _ in procesos]
+        for p in procesos:
+            p.join()
+    finally:
+        proceso.terminate()
+        proceso.wait()
+    inicio = min(m[0] for m in medidas)
+    fin = max(m[1] for m in medidas)
+    return sum(m[2] for m in medidas), sum(m[3] for m in medidas), fin - inicio
+
+
+def main():
+    nucleos = os.cpu_count() or 1
+    por_defecto = [1]
+    while por_defecto[-1] * 2 <= nucleos:
+        por_defecto.append(por_defecto[-1] * 2)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--salas", type=int, default=SALAS)
+    parser.add_argument("--jugadores", type=int, default=JUGADORES_POR_SALA, help="bots por sala")
+    parser.add_argument("--clientes", type=int, default=max(2, nucleos // 2), help="procesos que generan la carga")
+    parser.add_argument("--trabajadores", default=",".join(map(str, por_defecto)), help="lista, p. ej. 1,2,4,8")
+    argumentos = parser.parse_args()
+    lista = [int(t) for t in argumentos.trabajadores.split(",")]
+    clientes = min(argumentos.clientes, argumentos.salas)
+
+    _, duro = resource.getrlimit(resource.RLIMIT_NOFILE)  # Una conexión = un descriptor de archivo
+    resource.setrlimit(resource.RLIMIT_NOFILE, (duro, duro))
+
+    print(f"{argumentos.salas} salas x {argumentos.jugadores} jugadores, 10 preguntas sin pausa, "
+          f"{clientes} procesos cliente, {nucleos} núcleos")
+    base = None
+    for trabajadores in lista:
+        respuestas, errores, duracion = medir(trabajadores, clientes, argumentos.salas, argumentos.jugadores)
+        por_segundo = respuestas / duracion
+        base = base or por_segundo
+        print(f"  {trabajadores:>3} trabajadores  {por_segundo:>10.0f} respuestas/s  "
+              f"x{por_segundo / base:.2f}  ({respuestas} confirmadas, {errores} rechazadas, {duracion:.2f} s)")
+
+
+if __name__ == "__main__":
+    main()
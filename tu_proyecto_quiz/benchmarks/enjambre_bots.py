@@ -0,0 +1,154 @@
+"""
+BENCHMARK: enjambre de bots contra el servidor multijugador (servidor_juego.py)
+Levanta el servidor en otro proceso, un anfitrión crea una sala y miles de bots se unen y juegan
+las 10 preguntas; cada bot responde una opción al azar después de "pensar" un tiempo al azar.
+Informa la latencia de confirmación de cada respuesta (enviar -> llega "recibida"): p50, p99, máximo.
+Uso: python benchmarks/enjambre_bots.py [--jugadores 10000] [--pensar 2.0] [--puerto P (servidor ya levantado)]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+
+from generar_bancos import CARPETA_PROYECTO
+
+JUGADORES = 10_000
+PENSAR = 2.0  # Segundos máximos que tarda un bot en responder (se reparten al azar)
+CONEXIONES_A_LA_VEZ = 500  # Conexiones abriéndose al mismo tiempo
+CATEGORIA = "Ciencia"
+
+
+# FUNCIÓN: percentil (0-100) de una lista ya ordenada
+def percentil(ordenados, p):
+    if not ordenados:
+        return float("nan")
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * p / 100))]
+
+
+# FUNCIÓN: envía un mensaje (una línea JSON)
+def enviar(escritor, **campos):
+    escritor.write(json.dumps(campos, separators=(",", ":")).encode("utf-8") + b"\n")
+
+
+# FUNCIÓN: lee el próximo mensaje
+async def recibir(lector):
+    linea = await lector.readline()
+    if not linea:
+        raise ConnectionError("El servidor cerró la conexión")
+    return json.loads(linea)
+
+
+# FUNCIÓN: un bot: se une, responde cada pregunta y mide cuánto tarda la confirmación
+async def bot(numero, host, puerto, sala, pensar, entrada, unidos, latencias, errores, rng):
+    async with entrada:  # No abrir las 10.000 conexiones en el mismo instante
+        lector, escritor = await asyncio.open_connection(host, puerto)
+        enviar(escritor, tipo="unirse", sala=sala, nombre=f"bot{numero}")
+        respuesta = await recibir(lector)
+    if respuesta.get("tipo") != "unido":
+        raise RuntimeError(f"bot{numero} no pudo unirse: {respuesta}")
+    unidos()
+    enviado = None
+    try:
+        while True:
+            datos = await recibir(lector)
+            tipo = datos["tipo"]
+            if tipo == "pregunta":
+                await asyncio.sleep(rng.random() * pensar)
+                enviado = time.perf_counter()
+                enviar(escritor, tipo="responder", numero=datos["numero"], opcion=rng.randrange(len(datos["opciones"])))
+            elif tipo == "recibida":
+                latencias.append(time.perf_counter() - enviado)
+            elif tipo == "error":
+                errores.append(datos["mensaje"])
+            elif tipo == "fin":
+                return datos["puntaje"]
+    finally:
+        escritor.close()
+
+
+# FUNCIÓN: levanta servidor_juego.py en otro proceso y devuelve (proceso, puerto)
+def levantar_servidor():
+    proceso = subprocess.Popen([sys.executable, os.path.join(CARPETA_PROYECTO, "servidor_juego.py"),
+                                "--host", "127.0.0.1", "--puerto", "0"], stdout=subprocess.PIPE, text=True)
+    linea = proceso.stdout.readline()  # "Escuchando en 127.0.0.1:PUERTO"
+    if not linea:
+        raise RuntimeError("El servidor no arrancó")
+    return proceso, int(linea.rsplit(":", 1)[1])
+
+
+async def jugar_partida(host, puerto, jugadores, pensar):
+    rng = random.Random(1234)
+    lector, escritor = await asyncio.open_connection(host, puerto)  # El anfitrión
+    enviar(escritor, tipo="crear", categoria=CATEGORIA)
+    sala = (await recibir(lector))["sala"]
+
+    cantidad_unidos = 0
+    todos_unidos = asyncio.Event()
+
+    def unidos():
+        nonlocal cantidad_unidos
+        cantidad_unidos += 1
+        if cantidad_unidos == jugadores:
+            todos_unidos.set()
+
+    latencias, errores = [], []
+    entrada = asyncio.Semaphore(CONEXIONES_A_LA_VEZ)
+    inicio = time.perf_counter()
+    tareas = [asyncio.create_task(bot(n, host, puerto, sala, pensar, entrada, unidos, latencias, errores, rng))
+              for n in range(jugadores)]
+    await todos_unidos.wait()
+    union = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    enviar(escritor, tipo="empezar")
+    puntajes = await asyncio.gather(*tareas)
+    while (await recibir(lector))["tipo"] != "fin":
+        pass
+    partida = time.perf_counter() - inicio
+    escritor.close()
+    return union, partida, sorted(latencias), errores, puntajes
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jugadores", type=int, default=JUGADORES)
+    parser.add_argument("--pensar", type=float, default=PENSAR, help="segundos máximos que tarda un bot en responder")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, help="usar un servidor ya levantado")
+    argumentos = parser.parse_args()
+
+    blando, duro = resource.getrlimit(resource.RLIMIT_NOFILE)  # Una conexión = un descriptor de archivo
+    resource.setrlimit(resource.RLIMIT_NOFILE, (duro, duro))
+    if argumentos.jugadores + 100 > duro:
+        print(f"Aviso: el límite de archivos abiertos es {duro}; subilo con ulimit -n")
+
+    proceso = None
+    puerto = argumentos.puerto
+    if puerto is None:
+        proceso, puerto = levantar_servidor()
+    try:
+        union, partida, latencias, errores, puntajes = asyncio.run(
+            jugar_partida(argumentos.host, puerto, argumentos.jugadores, argumentos.pensar))
+    finally:
+        if proceso:
+            proceso.terminate()
+            proceso.wait()
+
+    print(f"{argumentos.jugadores} jugadores, 10 preguntas, hasta {argumentos.pensar:g} s para responder")
+    print(f"  unirse todos            {union:>8.2f} s")
+    print(f"  partida completa        {partida:>8.2f} s (incluye las pausas de 2 s entre preguntas)")
+    print(f"  respuestas confirmadas  {len(latencias):>8} ({len(errores)} rechazadas)")
+    print(f"  confirmación p50        {percentil(latencias, 50) * 1000:>8.1f} ms")
+    print(f"  confirmación p99        {percentil(latencias, 99) * 1000:>8.1f} ms")
+    print(f"  confirmación máxima     {latencias[-1] * 1000 if latencias else float('nan'):>8.1f} ms")
+    print(f"  puntaje promedio        {sum(puntajes) / len(puntajes):>8.2f}/10")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+PRUEBA DE ESTRÉS: muchos procesos escribiendo el mismo banco a la vez
+Cada proceso agrega sus preguntas de a una: la mitad por el diario (agregar_al_diario, como quiz-app.py)
+y la otra mitad reescribiendo el banco entero (compactar_banco con nuevas, que además compacta el diario).
+Mientras tanto un lector abre el banco sin bloqueo (tiene que ser siempre JSON válido) y otro lo lee
+con leer_categoria (la cantidad nunca puede bajar).
+Al final se compacta y se revisa que cada pregunta esté exactamente una vez.
+Uso: python benchmarks/estres_escritura.py [procesos] [preguntas_por_proceso]
+"""
+
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+import generar_bancos  # noqa: F401 (agrega tu_proyecto_quiz al path)
+from bancos import agregar_al_diario, compactar_banco, leer_categoria
+
+PROCESOS = 32
+PREGUNTAS_POR_PROCESO = 25
+
+
+# FUNCIÓN: pregunta identificable por proceso y número
+def pregunta(proceso, numero):
+    opciones = [f"p{proceso}", f"n{numero}", "otra", "ninguna"]
+    return {"pregunta": f"¿Pregunta {numero} del proceso {proceso}?", "opciones": opciones,
+            "respuestaCorrecta": opciones[0]}
+
+
+# FUNCIÓN: un escritor (arranca cuando todos están listos, para que choquen de verdad)
+def escribir(ruta, proceso, cantidad, salida):
+    salida.wait()
+    for numero in range(cantidad):
+        if proceso % 2:
+            compactar_banco(ruta, [pregunta(proceso, numero)])  # Reescribe el banco completo
+        else:
+            agregar_al_diario(ruta, pregunta(proceso, numero))
+
+
+# FUNCIÓN: lector sin bloqueo: el banco nunca puede estar a medias
+def leer_crudo(ruta, salida, fin, errores):
+    salida.wait()
+    lecturas = 0
+    while not fin.is_set():
+        try:
+            with open(ruta, "rb") as f:
+                json.loads(f.read().decode("utf-8"))
+            lecturas += 1
+        except ValueError as e:
+            errores.put(f"lectura cruda: JSON inválido ({e})")
+            return
+    errores.put(("lecturas crudas", lecturas))
+
+
+# FUNCIÓN: lector con bloqueo compartido: banco + diario nunca pierden preguntas
+def leer_con_bloqueo(ruta, salida, fin, errores):
+    salida.wait()
+    anterior = lecturas = 0
+    while not fin.is_set():
+        cantidad = len(leer_categoria(ruta))
+        if cantidad < anterior:
+            errores.put(f"leer_categoria: bajó de {anterior} a {cantidad} preguntas")
+            return
+        anterior = cantidad
+        lecturas += 1
+    errores.put(("lecturas con bloqueo", lecturas))
+
+
+def main():
+    procesos = int(sys.argv[1]) if len(sys.argv) > 1 else PROCESOS
+    cantidad = int(sys.argv[2]) if len(sys.argv) > 2 else PREGUNTAS_POR_PROCESO
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, "Estres.json")
+        with open(ruta, "w", encoding="utf-8") as f:
+            json.dump([], f)
+
+        salida = multiprocessing.Event()
+        fin = multiprocessing.Event()
+        errores = multiprocessing.Queue()
+        escritores = [multiprocessing.Process(target=escribir, args=(ruta, p, cantidad, salida))
+                      for p in range(procesos)]
+        lectores = [multiprocessing.Process(target=leer_crudo, args=(ruta, salida, fin, errores)),
+                    multiprocessing.Process(target=leer_con_bloqueo, args=(ruta, salida, fin, errores))]
+        for proceso in escritores + lectores:
+            proceso.start()
+
+        inicio = time.perf_counter()
+        salida.set()
+        for proceso in escritores:
+            proceso.join()
+        duracion = time.perf_counter() - inicio
+        fin.set()
+        mensajes = [errores.get() for _ in lectores]
+        for proceso in lectores:
+            proceso.join()
+
+        compactar_banco(ruta)
+        with open(ruta, encoding="utf-8") as f:
+            banco = json.load(f)
+
+    fallas = [m for m in mensajes if isinstance(m, str)]
+    for nombre, lecturas in (m for m in mensajes if not isinstance(m, str)):
+        print(f"  {nombre:<22} {lecturas}")
+    esperadas = {pregunta(p, n)["pregunta"] for p in range(procesos) for n in range(cantidad)}
+    vistas = [registro["pregunta"] for registro in banco]
+    faltan = esperadas - set(vistas)
+    repetidas = len(vistas) - len(set(vistas))
+    if faltan:
+        fallas.append(f"faltan {len(faltan)} preguntas (por ejemplo {sorted(faltan)[0]!r})")
+    if repetidas:
+        fallas.append(f"{repetidas} preguntas repetidas")
+
+    total = procesos * cantidad
+    print(f"{procesos} procesos x {cantidad} preguntas: {len(vistas)}/{total} en el banco, "
+          f"{duracion:.2f} s ({total / duracion:.0f} escrituras/s)")
+    for falla in fallas:
+        print(f"  FALLA: {falla}")
+    sys.exit(1 if fallas else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+GENERADOR DE BANCOS SINTÉTICOS PARA LOS BENCHMARKS
+Crea archivos JSON con el mismo formato que los bancos reales (pregunta/opciones/respuestaCorrecta)
+"""
+
+import json
+import os
+import random
+import sys
+
+# Permite importar los módulos de tu_proyecto_quiz desde la carpeta benchmarks
+CARPETA_PROYECTO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if CARPETA_PROYECTO not in sys.path:
+    sys.path.insert(0, CARPETA_PROYECTO)
+
+# Palabras para armar preguntas y opciones con algo de variedad
+PALABRAS = ("planeta", "película", "jugador", "canción", "batalla", "elemento", "mapa", "equipo",
+            "director", "año", "país", "capital", "galaxia", "personaje", "estadio", "álbum")
+
+
+# FUNCIÓN: arma una pregunta sintética con el formato de los bancos de quiz-app.py
+def generar_pregunta(numero, categoria, rng):
+    """
+    Devuelve un diccionario {"id", "categoria", "pregunta", "opciones", "respuestaCorrecta"}.
+    """
+    palabras = " ".join(rng.choice(PALABRAS) for _ in range(rng.randint(3, 12)))
+    opciones = [f"{rng.choice(PALABRAS).capitalize()} {numero}-{i}" for i in range(4)]
+    return {
+        "id": numero,
+        "categoria": categoria,
+        "pregunta": f"¿Cuál es el {palabras} número {numero}?",
+        "opciones": opciones,
+        "respuestaCorrecta": rng.choice(opciones),
+    }
+
+
+# FUNCIÓN: escribe varios archivos de categoría con un total de preguntas
+def escribir_bancos(carpeta, total_preguntas, cantidad_archivos=8, semilla=1234):
+    """
+    Reparte total_preguntas entre cantidad_archivos JSON dentro de carpeta.
+    Devuelve el mapa {categoría: nombre_archivo} listo para bancos.leer_categorias.
+    """
+    rng = random.Random(semilla)
+    os.makedirs(carpeta, exist_ok=True)
+    mapa = {}
+    por_archivo = max(1, total_preguntas // cantidad_archivos)
+    numero = 1
+    for i in range(cantidad_archivos):
+        categoria = f"Categoria {i + 1}"
+        nombre = f"Categoria{i + 1}.json"
+        preguntas = []
+        for _ in range(por_archivo):
+            preguntas.append(generar_pregunta(numero, categoria, rng))
+            numero += 1
+        with open(os.path.join(carpeta, nombre), "w", encoding="utf-8") as f:
+            json.dump(preguntas, f, ensure_ascii=False, indent=2)  # Mismo formato que guardar_pregunta_en_json
+        mapa[categoria] = nombre
+    return mapa
+
+
+# FUNCIÓN: tamaño total en bytes de los archivos de un mapa
+def tamano_bancos(carpeta, mapa):
+    return sum(os.path.getsize(os.path.join(carpeta, nombre)) for nombre in mapa.values())
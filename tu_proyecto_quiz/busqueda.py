@@ -0,0 +1,212 @@
+"""
+RESPONDIDOS - ÍNDICE INVERTIDO PARA BUSCAR PREGUNTAS POR TEMA
+Cada palabra (sin mayúsculas ni tildes, con duplicados.normalizar_texto) apunta a la lista
+de preguntas que la contienen, en el texto o en las opciones. Buscar es recorrer solo las
+listas de las palabras consultadas, no todas las preguntas.
+- Las listas son array("I") ordenados: cada entrada es número_de_pregunta * 2 + 1 si la palabra
+  está en el texto de la pregunta (pesa más) o * 2 si solo está en las opciones
+- Agregar una pregunta solo suma entradas al final de sus listas (O(palabras de la pregunta))
+- La última palabra de la consulta también busca por prefijo ("mund" encuentra "mundial"),
+  para que el buscador responda mientras se escribe
+- Ranking: suma del idf de cada palabra consultada, con más peso si aparece en la pregunta
+
+Uso: python busqueda.py "texto a buscar" [--categoria NOMBRE] [--limite 10]
+"""
+
+# IMPORTACIONES
+import argparse  # Para las opciones de la línea de comandos
+import heapq  # Para quedarse con los mejores resultados sin ordenar todos
+import math  # Para el idf (logaritmo)
+import os  # Para rutas de archivos
+from array import array  # Listas de enteros compactas (4 bytes por entrada)
+from bisect import bisect_left, insort  # Búsqueda binaria en las listas y en el vocabulario
+from bancos import CARPETA_BANCOS, MAPA_ARCHIVOS, leer_categoria
+from duplicados import normalizar_texto
+
+# PALABRAS VACÍAS (ya normalizadas): aparecen en casi todas las preguntas y no sirven para buscar
+PALABRAS_VACIAS = frozenset("""
+a al algo como con cual cuales cuando cuanto cuanta cuantos cuantas de del donde e el ella ellos en entre era
+es esa ese eso esta este esto estos estas fue fueron ha han hay la las le les lo los mas mi no ni o para
+por que quien quienes se ser si sin sobre son su sus tiene tienen un una uno unos unas u y ya
+""".split())
+
+PESO_PREGUNTA = 2.0  # La palabra está en el texto de la pregunta
+PESO_OPCIONES = 1.0  # Solo está en alguna opción
+MINIMO_PREFIJO = 3  # Letras mínimas para buscar por prefijo
+MAXIMO_EXPANSIONES = 50  # Palabras distintas que puede abarcar un prefijo
+
+
+# FUNCIÓN: palabras indexables de un texto
+def palabras(texto):
+    return [p for p in normalizar_texto(texto).split() if len(p) > 1 and p not in PALABRAS_VACIAS]
+
+
+# CLASE: índice invertido de preguntas (se actualiza de a una pregunta)
+class IndiceBusqueda:
+    """
+    Los números de pregunta son la posición en la que se agregó (0, 1, 2, ...),
+    por eso cada lista queda ordenada sin tener que ordenarla.
+    """
+
+    def __init__(self):
+        self.listas = {}  # {palabra: array("I") de códigos número * 2 + en_pregunta}
+        self.vocabulario = []  # Palabras ordenadas, para buscar por prefijo
+        self.registros = []  # Pregunta de cada número (el mismo objeto que está en memoria, no una copia)
+        self.categorias = []  # Nombres de categoría
+        self.categoria_de = array("H")  # Índice en self.categorias de cada pregunta
+
+    def __len__(self):
+        return len(self.registros)
+
+    def agregar(self, categoria, registro):
+        """Indexa una pregunta (texto y opciones). Devuelve su número."""
+        numero = len(self.registros)
+        if categoria not in self.categorias:
+            self.categorias.append(categoria)
+        self.registros.append(registro)
+        self.categoria_de.append(self.categorias.index(categoria))
+
+        en_pregunta = set(palabras(registro.get("pregunta")))
+        opciones = [o for o in registro.get("opciones") or () if isinstance(o, str)]
+        en_opciones = set(palabras(" ".join(opciones)))  # Una sola normalización para las 4 opciones
+        for palabra in en_pregunta | en_opciones:
+            lista = self.listas.get(palabra)
+            if lista is None:
+                lista = self.listas[palabra] = array("I")
+                insort(self.vocabulario, palabra)
+            lista.append(numero * 2 + (palabra in en_pregunta))
+        return numero
+
+    def agregar_banco(self, categoria, preguntas):
+        for registro in preguntas:
+            self.agregar(categoria, registro)
+
+    def listas_de(self, palabra, prefijo=False):
+        """Listas de la palabra exacta y, con prefijo=True, de las que empiezan con ella."""
+        if not prefijo or len(palabra) < MINIMO_PREFIJO:
+            return [self.listas[palabra]] if palabra in self.listas else []
+        desde = bisect_left(self.vocabulario, palabra)
+        encontradas = []
+        for posicion in range(desde, min(desde + MAXIMO_EXPANSIONES, len(self.vocabulario))):
+            if not self.vocabulario[posicion].startswith(palabra):
+                break
+            encontradas.append(self.listas[self.vocabulario[posicion]])
+        return encontradas
+
+    def idf(self, cantidad):
+        return math.log(1 + len(self.registros) / max(1, cantidad))
+
+    def buscar(self, consulta, limite=10, categoria=None, prefijo=True):
+        """
+        Devuelve hasta limite resultados [{"categoria", "puntaje", "registro"}], del más al menos relevante
+        (a igual puntaje, la pregunta más antigua primero).
+        Solo aparecen las preguntas que tienen TODAS las palabras de la consulta (en el texto o las opciones).
+        prefijo=True: la última palabra también busca por prefijo, salvo que la consulta termine en espacio.
+        """
+        terminos = palabras(consulta)
+        if not terminos or limite <= 0:
+            return []
+        filtro = self.categorias.index(categoria) if categoria in self.categorias else None
+        if categoria is not None and filtro is None:
+            return []
+        usar_prefijo = prefijo and not consulta[-1:].isspace()
+        consultas = []
+        for posicion, termino in enumerate(terminos):
+            listas = self.listas_de(termino, usar_prefijo and posicion == len(terminos) - 1)
+            if not listas:
+                return []  # Una palabra que no está en ninguna pregunta: no hay resultados
+            consultas.append((self.idf(sum(len(l) for l in listas)), listas))
+        consultas.sort(key=lambda c: -c[0])  # Primero la palabra más rara (mayor idf): menos candidatos
+        maximo = sum(idf * PESO_PREGUNTA for idf, _ in consultas)  # Puntaje si todas están en el texto
+
+        # Se recorren los candidatos (las preguntas de la palabra más rara) en orden de número;
+        # el resto de las palabras se busca en sus listas con búsqueda binaria. Un prefijo con muchas
+        # palabras se pasa antes a un diccionario {número: peso} si eso es más barato que buscar en cada lista.
+        idf_principal, listas_principales = consultas[0]
+        candidatos = sum(len(l) for l in listas_principales)
+        resto = []
+        for idf, listas in consultas[1:]:
+            if len(listas) > 1 and sum(len(l) for l in listas) < candidatos * len(listas):
+                resto.append((idf, dict(recorrer(listas)).get))
+            else:
+                resto.append((idf, lambda numero, listas=listas: peso_en(listas, numero)))
+
+        mejores = []  # Montículo de (puntaje, -número) con los mejores hasta ahora
+        for numero, peso in recorrer(listas_principales):
+            if filtro is not None and self.categoria_de[numero] != filtro:
+                continue
+            puntaje = idf_principal * peso
+            for idf, peso_de in resto:
+                peso = peso_de(numero)
+                if not peso:
+                    break  # No tiene esta palabra
+                puntaje += idf * peso
+            else:
+                if len(mejores) < limite:
+                    heapq.heappush(mejores, (puntaje, -numero))
+                elif puntaje > mejores[0][0]:  # A igual puntaje se queda la más antigua (ya está)
+                    heapq.heapreplace(mejores, (puntaje, -numero))
+                if len(mejores) == limite and mejores[0][0] >= maximo - 1e-9:
+                    break  # Ya hay limite resultados con el puntaje máximo: ninguna posterior los supera
+
+        return [{"categoria": self.categorias[self.categoria_de[-menos_numero]], "puntaje": round(puntaje, 3),
+                 "registro": self.registros[-menos_numero]} for puntaje, menos_numero in sorted(mejores, reverse=True)]
+
+
+# FUNCIÓN: recorre varias listas como una sola, en orden de número y sin repetir
+def recorrer(listas):
+    """
+    Devuelve (número, peso). Si varias listas (palabras del mismo prefijo) tienen la misma pregunta,
+    queda el mayor peso.
+    """
+    anterior, peso_anterior = -1, 0
+    for codigo in listas[0] if len(listas) == 1 else heapq.merge(*listas):
+        numero = codigo >> 1
+        peso = PESO_PREGUNTA if codigo & 1 else PESO_OPCIONES
+        if numero != anterior:
+            if anterior >= 0:
+                yield anterior, peso_anterior
+            anterior, peso_anterior = numero, peso
+        elif peso > peso_anterior:
+            peso_anterior = peso
+    if anterior >= 0:
+        yield anterior, peso_anterior
+
+
+# FUNCIÓN: peso de una pregunta en las listas de una palabra (0 si no la tiene)
+def peso_en(listas, numero):
+    peso = 0
+    for lista in listas:
+        posicion = bisect_left(lista, numero * 2)
+        if posicion < len(lista) and lista[posicion] >> 1 == numero:
+            peso = max(peso, PESO_PREGUNTA if lista[posicion] & 1 else PESO_OPCIONES)
+    return peso
+
+
+# FUNCIÓN: arma el índice de varias categorías
+def construir_indice(preguntas_por_categoria):
+    """preguntas_por_categoria: {categoría: [registros]} (por ejemplo datos_todas_preguntas)."""
+    indice = IndiceBusqueda()
+    for categoria, preguntas in preguntas_por_categoria.items():
+        indice.agregar_banco(categoria, preguntas)
+    return indice
+
+
+# === EJECUCIÓN DESDE LA LÍNEA DE COMANDOS ===
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Busca preguntas por palabras en todos los bancos.")
+    parser.add_argument("consulta")
+    parser.add_argument("--categoria", help="buscar solo en esta categoría")
+    parser.add_argument("--limite", type=int, default=10)
+    argumentos = parser.parse_args()
+
+    indice = construir_indice({categoria: leer_categoria(os.path.join(CARPETA_BANCOS, archivo))
+                               for categoria, archivo in MAPA_ARCHIVOS.items()})
+    resultados = indice.buscar(argumentos.consulta, argumentos.limite, argumentos.categoria)
+    for resultado in resultados:
+        registro = resultado["registro"]
+        print(f"[{resultado['categoria']}] {registro.get('pregunta')} → {registro.get('respuestaCorrecta')} "
+              f"({resultado['puntaje']})")
+    if not resultados:
+        print("Sin resultados")
@@ -0,0 +1,321 @@
+"""
+RESPONDIDOS - DETECTOR DE PREGUNTAS DUPLICADAS EN TODOS LOS BANCOS
+- Duplicados exactos: el texto normalizado (sin mayúsculas, tildes, signos ni espacios de más) es igual
+- Casi duplicados: MinHash sobre fragmentos de 4 caracteres + LSH por bandas, y los candidatos
+  se confirman con la similitud de Jaccard real, la misma respuesta correcta y los mismos
+  números (así "¿Quién ganó el Balón de Oro 2009?" y "... 2012?" no se juntan). Todo en tiempo ~lineal en la cantidad de preguntas.
+Recorre los .json de tu_proyecto_quiz/ (con sus diarios) y de trivia respondidos/.
+
+Uso: python duplicados.py [--json informe.json] [--umbral 0.8] [--fusionar [--similares]] [carpetas...]
+--fusionar borra, dentro de cada archivo, las repeticiones con la misma respuesta correcta
+(se queda la primera). Los duplicados entre archivos distintos solo se informan.
+"""
+
+# IMPORTACIONES
+import argparse  # Para las opciones de la línea de comandos
+import json  # Para leer los bancos y escribir el informe
+import os  # Para rutas de archivos
+import random  # Para los coeficientes (fijos) de MinHash
+import re  # Para quitar signos de puntuación
+import unicodedata  # Para quitar tildes
+import zlib  # crc32: hash estable de cada fragmento
+from collections import defaultdict  # Para agrupar por clave
+from bancos import CARPETA_BANCOS, bloqueo_banco, compactar_banco, diarios_compactando, escribir_banco, leer_diarios
+from bancos import descomprimir_banco, es_archivo_banco
+from bancos import ruta_diario
+from registros import normalizar_pregunta
+
+# CARPETAS que se revisan por defecto
+CARPETA_TRIVIA = os.path.join(os.path.dirname(CARPETA_BANCOS), "trivia respondidos")
+CARPETAS_POR_DEFECTO = (CARPETA_BANCOS, CARPETA_TRIVIA)
+
+# PARÁMETROS DE MinHash / LSH
+TAMANO_FRAGMENTO = 4  # Caracteres por fragmento ("shingle")
+NUM_PERMUTACIONES = 64
+FILAS_POR_BANDA = 4  # 16 bandas de 4 filas: los pares con similitud ~0.5 o más suelen caer juntos en alguna
+UMBRAL_SIMILITUD = 0.8  # Jaccard mínimo para considerar dos preguntas casi iguales
+PRIMO_MINHASH = (1 << 61) - 1
+_rng_minhash = random.Random(1978)  # Semilla fija: el informe sale igual en cada corrida
+COEFICIENTES_MINHASH = [(_rng_minhash.randrange(1, PRIMO_MINHASH), _rng_minhash.randrange(PRIMO_MINHASH))
+                        for _ in range(NUM_PERMUTACIONES)]
+
+SIGNOS = re.compile(r"[^\w\s]")  # Todo lo que no sea letra, número o espacio
+NUMEROS = re.compile(r"\d+")
+MARCAS = re.compile("[\u0300-\u036f]")  # Tildes, diéresis, etc. separadas por NFKD
+
+
+# FUNCIÓN: texto normalizado para comparar preguntas
+def normalizar_texto(texto):
+    """
+    "¿Quién   ganó el Mundial?" -> "quien gano el mundial"
+    """
+    if not isinstance(texto, str):
+        return ""
+    texto = MARCAS.sub("", unicodedata.normalize("NFKD", texto))  # Separa y quita tildes y diéresis
+    texto = SIGNOS.sub(" ", texto.casefold()).replace("_", " ")
+    return " ".join(texto.split())  # Un solo espacio entre palabras
+
+
+# FUNCIÓN: conjunto de fragmentos de un texto normalizado
+def fragmentos(texto, tamano=TAMANO_FRAGMENTO):
+    if len(texto) <= tamano:
+        return {texto}
+    return {texto[i:i + tamano] for i in range(len(texto) - tamano + 1)}
+
+
+# FUNCIÓN: firma MinHash de un conjunto de fragmentos
+def firma_minhash(conjunto):
+    """
+    Para cada permutación (a*x + b) mod p guarda el mínimo: la probabilidad de que dos
+    firmas coincidan en una posición es la similitud de Jaccard de los conjuntos.
+    """
+    valores = [zlib.crc32(f.encode("utf-8")) for f in conjunto]
+    return tuple(min((a * v + b) % PRIMO_MINHASH for v in valores) for a, b in COEFICIENTES_MINHASH)
+
+
+# FUNCIÓN: similitud de Jaccard entre dos conjuntos
+def jaccard(a, b):
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+# FUNCIÓN: lista los archivos de banco de una carpeta (.json, .json.gz y .json.xz)
+def archivos_de_banco(carpeta):
+    try:
+        nombres = sorted(os.listdir(carpeta))
+    except OSError:
+        return []
+    return [os.path.join(carpeta, n) for n in nombres if es_archivo_banco(n)]
+
+
+# FUNCIÓN: lee las preguntas de un archivo con su posición
+def leer_apariciones(ruta_json):
+    """
+    Devuelve [(posición, registro compilado)]. La posición es el índice en la lista del
+    archivo (o en "questions"); las preguntas del diario siguen numerando después del archivo.
+    """
+    try:
+        with open(ruta_json, "rb") as f:
+            datos = json.loads(descomprimir_banco(ruta_json, f.read()).decode("utf-8"))
+    except (OSError, ValueError) as e:  # ValueError: JSON mal formado, comprimido dañado o bytes que no son UTF-8
+        print(f"Se omite {os.path.basename(ruta_json)}: {e}")
+        return []
+    categoria = None
+    if isinstance(datos, dict):  # Envoltorio de trivia (package.json no tiene "questions")
+        categoria = datos.get("name") or datos.get("category")
+        datos = datos.get("questions", [])
+    if not isinstance(datos, list):
+        return []
+    elementos = datos + leer_diarios(ruta_json)
+    return [(i, normalizar_pregunta(q, categoria)) for i, q in enumerate(elementos) if isinstance(q, dict)]
+
+
+# CLASE: unión de conjuntos disjuntos (para juntar pares en grupos)
+class Grupos:
+    def __init__(self, cantidad):
+        self.padre = list(range(cantidad))
+
+    def raiz(self, x):
+        while self.padre[x] != x:
+            self.padre[x] = self.padre[self.padre[x]]  # Acorta el camino
+            x = self.padre[x]
+        return x
+
+    def unir(self, x, y):
+        rx, ry = self.raiz(x), self.raiz(y)
+        if rx != ry:
+            self.padre[max(rx, ry)] = min(rx, ry)
+
+
+# FUNCIÓN: busca duplicados exactos y casi duplicados
+def buscar_duplicados(apariciones, umbral=UMBRAL_SIMILITUD):
+    """
+    apariciones: lista de diccionarios con "pregunta" y "respuestaCorrecta".
+    Devuelve una lista de grupos {"tipo", "similitud", "indices"} (índices en apariciones),
+    ordenada por la primera aparición. Solo grupos de 2 o más.
+    """
+    # 1) Exactos: un diccionario por texto normalizado
+    por_texto = defaultdict(list)
+    for indice, aparicion in enumerate(apariciones):
+        por_texto[normalizar_texto(aparicion["pregunta"])].append(indice)
+    textos = list(por_texto)
+    respuestas = [{normalizar_texto(apariciones[k]["respuestaCorrecta"]) for k in por_texto[t]} for t in textos]
+    numeros = [set(NUMEROS.findall(t)) for t in textos]
+
+    # 2) Casi iguales: MinHash + LSH solo sobre los textos distintos
+    conjuntos = [fragmentos(t) for t in textos]
+    cubetas = defaultdict(list)
+    for i, conjunto in enumerate(conjuntos):
+        firma = firma_minhash(conjunto)
+        for banda in range(0, NUM_PERMUTACIONES, FILAS_POR_BANDA):
+            cubetas[(banda, firma[banda:banda + FILAS_POR_BANDA])].append(i)
+
+    grupos = Grupos(len(textos))
+    similitud_minima = {}
+    revisados = set()
+    for miembros in cubetas.values():
+        for posicion, i in enumerate(miembros):
+            for j in miembros[posicion + 1:]:
+                if (i, j) in revisados:
+                    continue
+                revisados.add((i, j))
+                if numeros[i] != numeros[j] or not respuestas[i] & respuestas[j]:
+                    continue  # Misma plantilla, otra pregunta (otro año, otro país...)
+                similitud = jaccard(conjuntos[i], conjuntos[j])  # Se confirma con la similitud real
+                if similitud >= umbral:
+                    grupos.unir(i, j)
+                    similitud_minima[(i, j)] = similitud
+
+    # 3) Arma los grupos de apariciones
+    por_raiz = defaultdict(list)
+    for i in range(len(textos)):
+        por_raiz[grupos.raiz(i)].append(i)
+    minima_por_raiz = {}
+    for (i, _), similitud in similitud_minima.items():
+        raiz = grupos.raiz(i)
+        minima_por_raiz[raiz] = min(similitud, minima_por_raiz.get(raiz, 1.0))
+
+    resultado = []
+    for raiz, indices_texto in por_raiz.items():
+        indices = sorted(k for i in indices_texto for k in por_texto[textos[i]])
+        if len(indices) < 2:
+            continue
+        resultado.append({
+            "tipo": "exacto" if len(indices_texto) == 1 else "similar",
+            "similitud": round(minima_por_raiz.get(raiz, 1.0), 3),
+            "indices": indices,
+        })
+    resultado.sort(key=lambda g: g["indices"][0])
+    return resultado
+
+
+# FUNCIÓN: revisa carpetas enteras y arma el informe
+def analizar_carpetas(carpetas=CARPETAS_POR_DEFECTO, umbral=UMBRAL_SIMILITUD):
+    """
+    Devuelve {"total_preguntas", "archivos", "grupos": [...]}. Cada grupo lista sus
+    apariciones (archivo, posición, id, pregunta, respuesta) e indica si las respuestas
+    correctas difieren (en ese caso no se fusiona).
+    """
+    raiz_proyecto = os.path.dirname(CARPETA_BANCOS)
+    apariciones = []
+    archivos = []
+    for carpeta in carpetas:
+        for ruta in archivos_de_banco(carpeta):
+            leidas = leer_apariciones(ruta)
+            if not leidas:
+                continue
+            archivos.append(ruta)
+            for posicion, registro in leidas:
+                apariciones.append({
+                    "archivo": os.path.relpath(ruta, raiz_proyecto),
+                    "ruta": ruta,
+                    "posicion": posicion,
+                    "id": registro.get("id"),
+                    "pregunta": registro.get("pregunta", ""),
+                    "respuestaCorrecta": registro.get("respuestaCorrecta"),
+                })
+
+    grupos = []
+    for grupo in buscar_duplicados(apariciones, umbral):
+        miembros = [apariciones[i] for i in grupo["indices"]]
+        respuestas = {normalizar_texto(m["respuestaCorrecta"]) for m in miembros}
+        grupos.append({
+            "tipo": grupo["tipo"],
+            "similitud": grupo["similitud"],
+            "respuestas_distintas": len(respuestas) > 1,
+            "apariciones": miembros,
+        })
+    return {"total_preguntas": len(apariciones), "archivos": [os.path.relpath(r, raiz_proyecto) for r in archivos],
+            "grupos": grupos}
+
+
+# FUNCIÓN: posiciones que se pueden borrar de cada archivo sin perder información
+def repeticiones_a_borrar(informe, incluir_similares=False):
+    """
+    Devuelve {ruta: {posiciones}}: dentro de cada archivo, de cada grupo se queda la
+    primera aparición y se borran las demás que tengan la misma respuesta correcta.
+    """
+    borrar = defaultdict(set)
+    for grupo in informe["grupos"]:
+        primeras = {}  # (ruta, respuesta, [texto]) -> primera aparición
+        for aparicion in grupo["apariciones"]:
+            clave = (aparicion["ruta"], normalizar_texto(aparicion["respuestaCorrecta"]))
+            if not incluir_similares:  # Solo se juntan textos iguales (aunque el grupo sea "similar")
+                clave += (normalizar_texto(aparicion["pregunta"]),)
+            if clave in primeras:
+                borrar[aparicion["ruta"]].add(aparicion["posicion"])
+            else:
+                primeras[clave] = aparicion
+    return borrar
+
+
+# FUNCIÓN: borra posiciones de un banco (lista o envoltorio) con escritura atómica
+def borrar_posiciones(ruta_json, posiciones):
+    """
+    Con el bloqueo exclusivo del banco. Las posiciones siguen valiendo aunque otra instancia
+    haya compactado después del análisis: compactar solo agrega al final.
+    """
+    with bloqueo_banco(ruta_json):
+        with open(ruta_json, "rb") as f:
+            datos = json.loads(descomprimir_banco(ruta_json, f.read()).decode("utf-8"))
+        preguntas = datos.get("questions", []) if isinstance(datos, dict) else datos
+        restantes = [q for i, q in enumerate(preguntas) if i not in posiciones]
+        if isinstance(datos, dict):
+            datos["questions"] = restantes
+        else:
+            datos = restantes
+        escribir_banco(ruta_json, datos)  # Con el mismo formato (plano o comprimido) que tenía
+    return len(preguntas) - len(restantes)
+
+
+# FUNCIÓN: fusiona los duplicados de cada archivo
+def fusionar(carpetas=CARPETAS_POR_DEFECTO, umbral=UMBRAL_SIMILITUD, incluir_similares=False):
+    """
+    Primero pasa los diarios a sus bancos (así todas las posiciones están en el archivo),
+    después borra las repeticiones. Devuelve {archivo: preguntas borradas}.
+    """
+    for carpeta in carpetas:
+        for ruta in archivos_de_banco(carpeta):
+            if os.path.exists(ruta_diario(ruta)) or diarios_compactando(ruta):
+                compactar_banco(ruta)
+    informe = analizar_carpetas(carpetas, umbral)
+    return {ruta: borrar_posiciones(ruta, posiciones)
+            for ruta, posiciones in repeticiones_a_borrar(informe, incluir_similares).items()}
+
+
+# FUNCIÓN: muestra el informe en la consola
+def imprimir_informe(informe):
+    grupos = informe["grupos"]
+    exactos = sum(1 for g in grupos if g["tipo"] == "exacto")
+    print(f"{informe['total_preguntas']} preguntas en {len(informe['archivos'])} archivos: "
+          f"{exactos} grupos de duplicados exactos y {len(grupos) - exactos} de casi duplicados")
+    for numero, grupo in enumerate(grupos, 1):
+        detalle = grupo["tipo"] if grupo["tipo"] == "exacto" else f"similar, Jaccard >= {grupo['similitud']}"
+        aviso = " - ¡respuestas distintas!" if grupo["respuestas_distintas"] else ""
+        print(f"\nGrupo {numero} ({detalle}){aviso}")
+        for a in grupo["apariciones"]:
+            print(f"  {a['archivo']} #{a['posicion']} (id {a['id']}): {a['pregunta']} -> {a['respuestaCorrecta']}")
+
+
+# === EJECUCIÓN DESDE LA LÍNEA DE COMANDOS ===
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Busca preguntas duplicadas en los bancos.")
+    parser.add_argument("carpetas", nargs="*", default=list(CARPETAS_POR_DEFECTO))
+    parser.add_argument("--json", metavar="ARCHIVO", help="guarda el informe en JSON")
+    parser.add_argument("--umbral", type=float, default=UMBRAL_SIMILITUD, help="Jaccard mínimo (0 a 1)")
+    parser.add_argument("--fusionar", action="store_true", help="borra las repeticiones dentro de cada archivo")
+    parser.add_argument("--similares", action="store_true", help="con --fusionar, también los casi duplicados")
+    argumentos = parser.parse_args()
+
+    informe = analizar_carpetas(argumentos.carpetas, argumentos.umbral)
+    imprimir_informe(informe)
+    if argumentos.json:
+        for grupo in informe["grupos"]:
+            for aparicion in grupo["apariciones"]:
+                del aparicion["ruta"]  # Ruta absoluta: en el informe alcanza con la relativa
+        with open(argumentos.json, "w", encoding="utf-8") as f:
+            json.dump(informe, f, ensure_ascii=False, indent=2)
+    if argumentos.fusionar:
+        borradas = fusionar(argumentos.carpetas, argumentos.umbral, argumentos.similares)
+        for ruta, cantidad in borradas.items():
+            print(f"{os.path.basename(ruta)}: {cantidad} repeticiones borradas")
@@ -0,0 +1,71 @@
+"""
+RESPONDIDOS - ESTADÍSTICAS DE LOS BANCOS, ACUMULADAS POR CATEGORÍA
+Cada categoría guarda un diccionario chico (se puede guardar en el manifiesto tal cual):
+{"cantidad", "suma_longitudes", "cortas", "medias", "largas"}
+- Se arma en una sola pasada por las preguntas (sin listas intermedias)
+- Cada pregunta nueva lo actualiza en O(1)
+- Las de varias categorías se combinan sumando campo por campo, solo cuando se piden
+"""
+
+# LÍMITES DE LONGITUD (caracteres del texto de la pregunta)
+LIMITE_CORTA = 30  # Menos de 30: corta
+LIMITE_LARGA = 80  # Más de 80: larga (de 30 a 80: media)
+
+CAMPOS_ESTADISTICAS = ("cantidad", "suma_longitudes", "cortas", "medias", "largas")
+
+
+# FUNCIÓN: estadísticas de una categoría sin preguntas
+def estadisticas_vacias():
+    return dict.fromkeys(CAMPOS_ESTADISTICAS, 0)
+
+
+# FUNCIÓN: suma una pregunta a las estadísticas (O(1), modifica el diccionario)
+def sumar_pregunta(estadisticas, pregunta):
+    """
+    pregunta: registro (diccionario o Pregunta) o directamente su texto.
+    """
+    texto = pregunta if isinstance(pregunta, str) else pregunta.get("pregunta", "")
+    longitud = len(texto) if isinstance(texto, str) else 0
+    estadisticas["cantidad"] += 1
+    estadisticas["suma_longitudes"] += longitud
+    if longitud < LIMITE_CORTA:
+        estadisticas["cortas"] += 1
+    elif longitud <= LIMITE_LARGA:
+        estadisticas["medias"] += 1
+    else:
+        estadisticas["largas"] += 1
+    return estadisticas
+
+
+# FUNCIÓN: estadísticas de una lista de preguntas, en una sola pasada
+def estadisticas_de(preguntas):
+    estadisticas = estadisticas_vacias()
+    for pregunta in preguntas:
+        sumar_pregunta(estadisticas, pregunta)
+    return estadisticas
+
+
+# FUNCIÓN: combina las estadísticas de varias categorías
+def combinar_estadisticas(lista_estadisticas):
+    total = estadisticas_vacias()
+    for estadisticas in lista_estadisticas:
+        for campo in CAMPOS_ESTADISTICAS:
+            total[campo] += estadisticas.get(campo, 0)
+    return total
+
+
+# FUNCIÓN: resumen para mostrar (mismas claves que el viejo analizar_preguntas)
+def resumen_estadisticas(por_categoria):
+    """
+    por_categoria: {categoría: estadísticas}. Devuelve {"total_preguntas", "longitud_promedio",
+    "preguntas_cortas", "preguntas_medias", "preguntas_largas", "categorias_activas"}.
+    """
+    total = combinar_estadisticas(por_categoria.values())
+    return {
+        "total_preguntas": total["cantidad"],
+        "longitud_promedio": round(total["suma_longitudes"] / total["cantidad"], 2) if total["cantidad"] else 0,
+        "preguntas_cortas": total["cortas"],
+        "preguntas_medias": total["medias"],
+        "preguntas_largas": total["largas"],
+        "categorias_activas": sum(1 for e in por_categoria.values() if e.get("cantidad", 0) > 0),
+    }
@@ -0,0 +1,167 @@
+"""
+RESPONDIDOS - IMPORTACIÓN MASIVA DE PREGUNTAS DESDE CSV O JSONL
+Lee el archivo fila por fila, valida cada pregunta con las mismas reglas que el formulario
+(validacion.py) y rechaza las repetidas; al final escribe cada categoría afectada UNA sola vez,
+con reemplazo atómico (bancos.compactar_banco, que de paso incorpora el diario).
+
+Uso: python importar.py ARCHIVO.csv|ARCHIVO.jsonl [--categoria NOMBRE] [--simular]
+
+CSV con encabezado (separado por coma, punto y coma o tabulación):
+    categoria,pregunta,opcion1,opcion2,opcion3,opcion4,correcta
+JSONL, un objeto por línea:
+    {"categoria": "...", "pregunta": "...", "opciones": ["...", "...", "...", "..."], "respuestaCorrecta": "..."}
+La respuesta correcta puede ser el texto de una opción o su número (1 a 4).
+Sale con código 1 si hubo filas rechazadas.
+"""
+
+# IMPORTACIONES
+import argparse  # Para las opciones de la línea de comandos
+import csv  # Para leer planillas exportadas
+import json  # Para leer JSONL
+import os  # Para rutas de archivos
+import sys  # Para el código de salida
+from collections import defaultdict  # Preguntas aceptadas por categoría
+from bancos import CARPETA_BANCOS, MAPA_ARCHIVOS, compactar_banco, descomprimir_banco, leer_diarios
+from duplicados import normalizar_texto
+from registros import compilar_banco
+from validacion import CANTIDAD_OPCIONES, validar_nueva_pregunta
+
+COLUMNAS_OPCIONES = [f"opcion{i}" for i in range(1, CANTIDAD_OPCIONES + 1)]  # opcion1 ... opcion4
+
+
+# FUNCIÓN: filas de un CSV como diccionarios, con el número de línea donde empieza cada una
+def filas_csv(archivo):
+    muestra = archivo.read(4096)
+    archivo.seek(0)
+    try:
+        dialecto = csv.Sniffer().sniff(muestra, delimiters=",;\t")  # Excel en español suele usar ";"
+    except csv.Error:
+        dialecto = csv.excel
+    lector = csv.DictReader(archivo, dialect=dialecto)
+    ultima_linea = 1  # El encabezado
+    for fila in lector:
+        yield ultima_linea + 1, {
+            "categoria": fila.get("categoria"),
+            "pregunta": fila.get("pregunta"),
+            "opciones": [fila.get(c) or "" for c in COLUMNAS_OPCIONES],
+            "correcta": fila.get("correcta"),
+        }, None
+        ultima_linea = lector.line_num  # Una celda con saltos de línea ocupa varias líneas
+
+
+# FUNCIÓN: filas de un JSONL (un objeto JSON por línea)
+def filas_jsonl(archivo):
+    for numero, linea in enumerate(archivo, 1):
+        if not linea.strip():
+            continue  # Línea en blanco
+        try:
+            fila = json.loads(linea)
+        except json.JSONDecodeError as e:
+            yield numero, None, f"JSON inválido ({e.msg})"
+            continue
+        if not isinstance(fila, dict):
+            yield numero, None, "Se esperaba un objeto JSON"
+            continue
+        fila.setdefault("correcta", fila.get("respuestaCorrecta"))
+        yield numero, fila, None
+
+
+# FUNCIÓN: índice de la respuesta correcta a partir de su texto o su número (1 a 4)
+def indice_respuesta(correcta, opciones):
+    if correcta is None:
+        return -1
+    texto = str(correcta).strip()
+    if texto in opciones:  # Primero el texto: una opción puede ser "1990" o "2"
+        return opciones.index(texto)
+    if texto.isdigit() and 1 <= int(texto) <= len(opciones):
+        return int(texto) - 1
+    return -1
+
+
+# FUNCIÓN: preguntas de un banco, sin tocar el disco y sin tragarse los errores
+def leer_existentes(ruta_json):
+    """
+    Como leer_categoria pero no crea el archivo si falta ni reconstruye la caché,
+    y un banco mal formado lanza ValueError en vez de contar como vacío: así la
+    importación se cancela antes de escribir cualquier categoría.
+    Un banco que falta cuenta como vacío (salvo lo que haya en el diario).
+    """
+    try:
+        with open(ruta_json, "rb") as f:
+            datos = json.loads(descomprimir_banco(ruta_json, f.read()).decode("utf-8"))
+    except FileNotFoundError:
+        datos = []
+    except ValueError as e:  # JSON mal formado (o datos comprimidos dañados)
+        raise ValueError(f"JSON inválido en {os.path.basename(ruta_json)} ({e})") from e
+    return compilar_banco(datos) + compilar_banco(leer_diarios(ruta_json))
+
+
+# FUNCIÓN: valida e importa todas las filas de un archivo
+def importar(ruta, categoria_por_defecto=None, simular=False, base=CARPETA_BANCOS):
+    """
+    Devuelve (aceptadas, rechazos): {categoría: [preguntas]} y [(línea, motivo)].
+    Las repetidas se rechazan tanto contra el banco como dentro del mismo archivo.
+    Con simular=True solo valida: no escribe nada.
+    Si algún banco afectado no se puede leer lanza ValueError sin haber escrito ninguno.
+    """
+    aceptadas = defaultdict(list)
+    rechazos = []
+    indices = {}  # {categoría: textos normalizados ya presentes}, se arma al ver la categoría por primera vez
+
+    with open(ruta, encoding="utf-8-sig", newline="") as archivo:  # utf-8-sig: planillas con BOM
+        filas = filas_csv(archivo) if ruta.lower().endswith(".csv") else filas_jsonl(archivo)
+        for numero, fila, error in filas:
+            if error:
+                rechazos.append((numero, error))
+                continue
+            categoria = str(fila.get("categoria") or categoria_por_defecto or "").strip()
+            pregunta = str(fila.get("pregunta") or "").strip()
+            opciones = fila.get("opciones")
+            opciones = [str(o).strip() for o in opciones] if isinstance(opciones, list) else []
+            indice = indice_respuesta(fila.get("correcta"), opciones)
+
+            es_valida, mensaje_error = validar_nueva_pregunta(categoria, pregunta, opciones, indice, MAPA_ARCHIVOS)
+            if not es_valida:
+                rechazos.append((numero, mensaje_error))
+                continue
+
+            if categoria not in indices:
+                ruta_banco = os.path.join(base, MAPA_ARCHIVOS[categoria])
+                existentes = leer_existentes(ruta_banco)  # Todos los bancos se leen antes de escribir ninguno
+                indices[categoria] = {normalizar_texto(q.get("pregunta")) for q in existentes}
+            clave = normalizar_texto(pregunta)
+            if clave in indices[categoria]:
+                rechazos.append((numero, f"Esa pregunta ya existe en '{categoria}'."))
+                continue
+            indices[categoria].add(clave)
+            aceptadas[categoria].append({"pregunta": pregunta, "opciones": opciones,
+                                         "respuestaCorrecta": opciones[indice]})
+
+    if not simular:
+        for categoria, nuevas in aceptadas.items():
+            compactar_banco(os.path.join(base, MAPA_ARCHIVOS[categoria]), nuevas)  # Una escritura atómica por categoría
+    return aceptadas, rechazos
+
+
+# === EJECUCIÓN DESDE LA LÍNEA DE COMANDOS ===
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Importa preguntas desde un CSV o JSONL.")
+    parser.add_argument("archivo")
+    parser.add_argument("--categoria", help="categoría para las filas que no la indiquen")
+    parser.add_argument("--simular", action="store_true", help="solo valida, no escribe los bancos")
+    argumentos = parser.parse_args()
+
+    try:
+        aceptadas, rechazos = importar(argumentos.archivo, argumentos.categoria, argumentos.simular)
+    except (OSError, ValueError) as e:  # Archivo ilegible o banco con JSON inválido
+        print(f"No se pudo importar: {e}")
+        sys.exit(2)
+
+    for numero, motivo in rechazos:
+        print(f"línea {numero}: {motivo}")
+    verbo = "se agregarían" if argumentos.simular else "agregadas"
+    for categoria, nuevas in aceptadas.items():
+        print(f"{categoria}: {len(nuevas)} preguntas {verbo}")
+    print(f"Total: {sum(len(n) for n in aceptadas.values())} aceptadas, {len(rechazos)} rechazadas")
+    sys.exit(1 if rechazos else 0)
@@ -0,0 +1,125 @@
+"""
+RESPONDIDOS - LINT DE TODOS LOS BANCOS DE PREGUNTAS
+Las preguntas que entraron directo en los JSON nunca pasaron por validar_formato_pregunta.
+Este lint les aplica las mismas reglas de formato (validacion.problemas_formato, con las
+expresiones regulares precompiladas) más las reglas de estructura:
+texto no vacío, exactamente 4 opciones no vacías y sin repetir, respuesta correcta entre las opciones.
+Cada archivo se revisa en un proceso aparte, leyéndolo en flujo para saber la línea de cada pregunta.
+
+Uso: python lint_bancos.py [--json informe.json] [--procesos N] [archivos o carpetas...]
+Sin argumentos revisa tu_proyecto_quiz/ y trivia respondidos/. Sale con código 1 si hay problemas.
+"""
+
+# IMPORTACIONES
+import argparse  # Para las opciones de la línea de comandos
+import json  # Para el informe
+import os  # Para rutas de archivos
+import sys  # Para el código de salida
+from concurrent.futures import ProcessPoolExecutor  # Un archivo por proceso
+from bancos import CARPETA_BANCOS, iterar_preguntas_json
+from duplicados import CARPETAS_POR_DEFECTO, archivos_de_banco
+from registros import normalizar_pregunta
+from validacion import CANTIDAD_OPCIONES, problemas_formato
+
+
+# FUNCIÓN: problemas de una pregunta (ya compilada), como lista de (regla, mensaje)
+def revisar_pregunta(registro):
+    problemas = []
+    texto = registro.get("pregunta")
+    if not isinstance(texto, str) or not texto.strip():
+        problemas.append(("pregunta_vacia", "La pregunta no tiene texto"))
+    else:
+        problemas.extend(problemas_formato(texto))
+
+    opciones = registro.get("opciones")
+    if not isinstance(opciones, list):
+        return problemas + [("sin_opciones", "Falta la lista de opciones")]
+    if len(opciones) != CANTIDAD_OPCIONES:
+        problemas.append(("cantidad_opciones", f"Tiene {len(opciones)} opciones (deben ser {CANTIDAD_OPCIONES})"))
+    if any(not isinstance(o, str) or not o.strip() for o in opciones):
+        problemas.append(("opcion_vacia", "Hay opciones vacías o que no son texto"))
+    elif len(set(opciones)) != len(opciones):
+        problemas.append(("opciones_repetidas", "Las opciones no pueden repetirse"))
+    if registro.get("indiceCorrecto", -1) < 0:
+        problemas.append(("respuesta_fuera_de_opciones",
+                          f"La respuesta correcta {registro.get('respuestaCorrecta')!r} no está entre las opciones"))
+    return problemas
+
+
+# FUNCIÓN: revisa un archivo entero (corre dentro de un proceso del pool)
+def revisar_archivo(ruta):
+    """
+    Devuelve {"archivo", "preguntas", "problemas": [{"linea", "posicion", "id", "regla", "mensaje"}]}.
+    Un JSON mal formado se informa como un único problema "json_invalido".
+    """
+    informe = {"archivo": ruta, "preguntas": 0, "problemas": []}
+    info = {}
+    try:
+        for posicion, (linea, datos) in enumerate(iterar_preguntas_json(ruta, info, con_lineas=True)):
+            informe["preguntas"] += 1
+            if not isinstance(datos, dict):
+                informe["problemas"].append({"linea": linea, "posicion": posicion, "id": None,
+                                             "regla": "no_es_objeto", "mensaje": "La pregunta no es un objeto JSON"})
+                continue
+            registro = normalizar_pregunta(datos, info.get("name"))  # Los dos formatos, con indiceCorrecto
+            for regla, mensaje in revisar_pregunta(registro):
+                informe["problemas"].append({"linea": linea, "posicion": posicion, "id": registro.get("id"),
+                                             "regla": regla, "mensaje": mensaje})
+    except json.JSONDecodeError as e:
+        informe["problemas"].append({"linea": e.lineno, "posicion": None, "id": None,
+                                     "regla": "json_invalido", "mensaje": e.msg})
+    except OSError as e:
+        informe["problemas"].append({"linea": None, "posicion": None, "id": None,
+                                     "regla": "no_se_pudo_leer", "mensaje": str(e)})
+    return informe
+
+
+# FUNCIÓN: expande carpetas a sus archivos .json
+def rutas_a_revisar(entradas):
+    rutas = []
+    for entrada in entradas:
+        rutas.extend(archivos_de_banco(entrada) if os.path.isdir(entrada) else [entrada])
+    return rutas
+
+
+# FUNCIÓN: revisa varios archivos en paralelo
+def revisar_bancos(rutas, procesos=None):
+    """
+    Devuelve la lista de informes por archivo, en el mismo orden que rutas.
+    procesos=1 revisa todo en este proceso (sin pool).
+    """
+    if procesos == 1 or len(rutas) < 2:
+        return [revisar_archivo(r) for r in rutas]
+    with ProcessPoolExecutor(max_workers=procesos) as ejecutor:
+        return list(ejecutor.map(revisar_archivo, rutas))
+
+
+# === EJECUCIÓN DESDE LA LÍNEA DE COMANDOS ===
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Revisa el formato y la estructura de los bancos de preguntas.")
+    parser.add_argument("entradas", nargs="*", default=list(CARPETAS_POR_DEFECTO))
+    parser.add_argument("--json", metavar="ARCHIVO", help="guarda el informe en JSON ('-' para la salida estándar)")
+    parser.add_argument("--procesos", type=int, default=None, help="cantidad de procesos (por defecto, uno por CPU)")
+    argumentos = parser.parse_args()
+
+    informes = revisar_bancos(rutas_a_revisar(argumentos.entradas), argumentos.procesos)
+    informes = [i for i in informes if i["preguntas"] or i["problemas"]]  # package.json y similares no cuentan
+    raiz_proyecto = os.path.dirname(CARPETA_BANCOS)
+    for informe in informes:
+        informe["archivo"] = os.path.relpath(informe["archivo"], raiz_proyecto)  # "tu_proyecto_quiz/Ciencia.json"
+    total_problemas = sum(len(i["problemas"]) for i in informes)
+    resumen = {"total_archivos": len(informes), "total_preguntas": sum(i["preguntas"] for i in informes),
+               "total_problemas": total_problemas, "archivos": informes}
+
+    if argumentos.json == "-":
+        json.dump(resumen, sys.stdout, ensure_ascii=False, indent=2)
+    else:
+        for informe in informes:  # Formato archivo:línea: regla: mensaje (como un compilador)
+            for p in informe["problemas"]:
+                print(f"{informe['archivo']}:{p['linea']}: {p['regla']}: {p['mensaje']}")
+        print(f"{resumen['total_preguntas']} preguntas en {len(informes)} archivos, {total_problemas} problemas")
+        if argumentos.json:
+            with open(argumentos.json, "w", encoding="utf-8") as f:
+                json.dump(resumen, f, ensure_ascii=False, indent=2)
+    sys.exit(1 if total_problemas else 0)
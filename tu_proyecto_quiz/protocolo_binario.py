@@ -0,0 +1,272 @@
+"""
+RESPONDIDOS - PROTOCOLO BINARIO COMPACTO PARA EL JUEGO EN RED
+Alternativa al JSON por línea de servidor_juego.py para salas con miles de jugadores: los mensajes
+frecuentes tienen tamaño fijo y se codifican/decodifican con struct, sin armar ni parsear JSON.
+- Una pregunta se manda una sola vez (id + textos UTF-8); después las rondas y las respuestas solo
+  llevan su id
+- Una respuesta es un registro fijo de 17 bytes
+- Los puntajes viajan como lista de cambios (jugador, delta), solo de los que cambiaron
+
+Trama: cabecera "!BI" (tipo, largo del cuerpo) y el cuerpo. Todo en orden de red (big-endian).
+    PREGUNTA  1   "!IBbB" id, marcas, indiceCorrecto (-1: no se manda), cantidad de opciones;
+                  después textos "!H" largo + UTF-8: id (si MARCA_ID_TEXTO), categoria (si MARCA_CATEGORIA), pregunta,
+                  cada opción, respuestaCorrecta (si MARCA_RESPUESTA)
+    RONDA     2   "!IBBB" id de la pregunta, número en la partida, total, segundos para responder
+    RESPUESTA 3   "!4sIIBI" sala, jugador, id de la pregunta, opción, ms del reloj del cliente (mód. 2^32)
+    RECIBIDA  4   "!I" id de la pregunta cuya respuesta se aceptó
+    PUNTAJES  5   "!II" id de la pregunta, cantidad; después cantidad x "!Ih" (jugador, delta)
+Los decodificadores devuelven diccionarios con "tipo" y los mismos nombres de campo que el
+protocolo JSON, salvo decodificar_pregunta, que devuelve el registro compilado (el de registros.py):
+decodificar_pregunta(codificar_pregunta(q, con_respuesta=True)) es igual a q.
+Un cuerpo mal formado lanza ValueError.
+"""
+
+# IMPORTACIONES
+import struct  # Para empaquetar los campos de tamaño fijo
+from registros import CLAVE_INDICE
+
+# CABECERA DE TRAMA Y TIPOS
+CABECERA = struct.Struct("!BI")
+PREGUNTA = 1
+RONDA = 2
+RESPUESTA = 3
+RECIBIDA = 4
+PUNTAJES = 5
+LIMITE_CUERPO = 1 << 20  # Bytes máximos de un cuerpo (una lista de puntajes de 10.000 jugadores ocupa 60 KB)
+
+# CUERPOS
+CUERPO_PREGUNTA = struct.Struct("!IBbB")
+CUERPO_RONDA = struct.Struct("!IBBB")
+CUERPO_RESPUESTA = struct.Struct("!4sIIBI")
+CUERPO_RECIBIDA = struct.Struct("!I")
+CUERPO_PUNTAJES = struct.Struct("!II")
+CAMBIO = struct.Struct("!Ih")
+LARGO_TEXTO = struct.Struct("!H")
+
+# MARCAS DE LA PREGUNTA
+MARCA_ID = 1  # El registro tiene "id" (si no, el id de la trama vale 0 y no se usa)
+MARCA_CATEGORIA = 2
+MARCA_RESPUESTA = 4  # Se mandan indiceCorrecto y respuestaCorrecta (al anfitrión, o al guardar)
+MARCA_SIN_RESPUESTA_CORRECTA = 8  # respuestaCorrecta era None
+MARCA_ID_TEXTO = 16  # El "id" del registro no es un entero de 32 bits: va como texto (y el id de la trama vale 0)
+
+
+# FUNCIÓN: arma una trama (cabecera + cuerpo)
+def trama(tipo, cuerpo):
+    return CABECERA.pack(tipo, len(cuerpo)) + cuerpo
+
+
+# FUNCIÓN: texto -> "!H" largo + UTF-8
+def empaquetar_texto(texto):
+    datos = str(texto).encode("utf-8")
+    if len(datos) > 0xFFFF:
+        raise ValueError(f"Texto demasiado largo para el protocolo ({len(datos)} bytes)")
+    return LARGO_TEXTO.pack(len(datos)) + datos
+
+
+# FUNCIÓN: lee un texto empaquetado; devuelve (texto, posición siguiente)
+def desempaquetar_texto(cuerpo, posicion):
+    largo, = LARGO_TEXTO.unpack_from(cuerpo, posicion)
+    inicio = posicion + LARGO_TEXTO.size
+    if inicio + largo > len(cuerpo):
+        raise ValueError("Texto cortado")
+    return str(cuerpo[inicio:inicio + largo], "utf-8"), inicio + largo
+
+
+# === PREGUNTA ===
+
+# FUNCIÓN: codifica un registro de pregunta (diccionario o Pregunta compacta)
+def codificar_pregunta(registro, id_pregunta=None, con_respuesta=False):
+    """
+    id_pregunta: reemplaza el "id" del registro (p. ej. el número de la pregunta en la partida);
+    es el que usarán la ronda y las respuestas.
+    con_respuesta=False es lo que se manda a los jugadores: sin índice ni texto de la correcta.
+    """
+    marcas = 0
+    partes = [b""]  # El lugar de la parte fija se llena al final
+    if id_pregunta is None:
+        id_pregunta = registro.get("id")
+    if type(id_pregunta) is int and 0 <= id_pregunta <= 0xFFFFFFFF:
+        marcas |= MARCA_ID
+    elif id_pregunta is not None:  # Algunos bancos tienen ids de texto ("v12")
+        marcas |= MARCA_ID_TEXTO
+        partes.append(empaquetar_texto(id_pregunta))
+        id_pregunta = 0
+    else:
+        id_pregunta = 0
+    opciones = registro.get("opciones") or ()
+    if len(opciones) > 255:
+        raise ValueError(f"Demasiadas opciones para el protocolo ({len(opciones)})")
+    categoria = registro.get("categoria")
+    if categoria is not None:
+        marcas |= MARCA_CATEGORIA
+        partes.append(empaquetar_texto(categoria))
+    partes.append(empaquetar_texto(registro.get("pregunta", "")))
+    partes.extend(empaquetar_texto(opcion) for opcion in opciones)
+    indice = -1
+    if con_respuesta:
+        marcas |= MARCA_RESPUESTA
+        indice = registro.get(CLAVE_INDICE, -1)
+        respuesta = registro.get("respuestaCorrecta")
+        if respuesta is None:
+            marcas |= MARCA_SIN_RESPUESTA_CORRECTA
+        else:
+            partes.append(empaquetar_texto(respuesta))
+    try:
+        partes[0] = CUERPO_PREGUNTA.pack(id_pregunta, marcas, indice, len(opciones))
+    except struct.error as e:  # Índice fuera de -128..127
+        raise ValueError(f"Pregunta que no entra en el protocolo: {e}") from e
+    return trama(PREGUNTA, b"".join(partes))
+
+
+# FUNCIÓN: cuerpo de PREGUNTA -> registro compilado
+def decodificar_pregunta(cuerpo):
+    """
+    Con MARCA_RESPUESTA devuelve las mismas claves que registros.normalizar_pregunta;
+    sin ella, indiceCorrecto es -1 y no hay respuestaCorrecta.
+    """
+    try:
+        id_pregunta, marcas, indice, cantidad = CUERPO_PREGUNTA.unpack_from(cuerpo)
+        posicion = CUERPO_PREGUNTA.size
+        registro = {}
+        if marcas & MARCA_ID:
+            registro["id"] = id_pregunta
+        elif marcas & MARCA_ID_TEXTO:
+            registro["id"], posicion = desempaquetar_texto(cuerpo, posicion)
+        if marcas & MARCA_CATEGORIA:
+            registro["categoria"], posicion = desempaquetar_texto(cuerpo, posicion)
+        registro["pregunta"], posicion = desempaquetar_texto(cuerpo, posicion)
+        opciones = []
+        for _ in range(cantidad):
+            opcion, posicion = desempaquetar_texto(cuerpo, posicion)
+            opciones.append(opcion)
+        registro["opciones"] = opciones
+        if marcas & MARCA_RESPUESTA and not marcas & MARCA_SIN_RESPUESTA_CORRECTA:
+            registro["respuestaCorrecta"], posicion = desempaquetar_texto(cuerpo, posicion)
+        elif marcas & MARCA_RESPUESTA:
+            registro["respuestaCorrecta"] = None
+    except struct.error as e:
+        raise ValueError(f"Pregunta mal formada: {e}") from e
+    if posicion != len(cuerpo):
+        raise ValueError("Pregunta con bytes de más")
+    registro[CLAVE_INDICE] = indice
+    return registro
+
+
+# === MENSAJES DE TAMAÑO FIJO ===
+
+def codificar_ronda(id_pregunta, numero, total, tiempo):
+    return trama(RONDA, CUERPO_RONDA.pack(id_pregunta, numero, total, tiempo))
+
+
+def decodificar_ronda(cuerpo):
+    id_pregunta, numero, total, tiempo = desempaquetar(CUERPO_RONDA, cuerpo)
+    return {"tipo": "ronda", "id_pregunta": id_pregunta, "numero": numero, "total": total, "tiempo": tiempo}
+
+
+def codificar_respuesta(sala, jugador, id_pregunta, opcion, ms):
+    """sala: código de 4 letras. ms se guarda módulo 2^32 (alcanza para medir latencias)."""
+    return trama(RESPUESTA, CUERPO_RESPUESTA.pack(sala.encode("ascii"), jugador, id_pregunta, opcion,
+                                                  ms & 0xFFFFFFFF))
+
+
+def decodificar_respuesta(cuerpo):
+    sala, jugador, id_pregunta, opcion, ms = desempaquetar(CUERPO_RESPUESTA, cuerpo)
+    return {"tipo": "responder", "sala": sala.decode("ascii"), "jugador": jugador,
+            "id_pregunta": id_pregunta, "opcion": opcion, "ms": ms}
+
+
+def codificar_recibida(id_pregunta):
+    return trama(RECIBIDA, CUERPO_RECIBIDA.pack(id_pregunta))
+
+
+def decodificar_recibida(cuerpo):
+    id_pregunta, = desempaquetar(CUERPO_RECIBIDA, cuerpo)
+    return {"tipo": "recibida", "id_pregunta": id_pregunta}
+
+
+# FUNCIÓN: desempaqueta un cuerpo de tamaño fijo (ValueError si el tamaño no coincide)
+def desempaquetar(formato, cuerpo):
+    if len(cuerpo) != formato.size:
+        raise ValueError(f"Cuerpo de {len(cuerpo)} bytes; se esperaban {formato.size}")
+    return formato.unpack(cuerpo)
+
+
+# === PUNTAJES ===
+
+# FUNCIÓN: cambios de puntaje entre dos {jugador: puntaje} (solo los que cambiaron)
+def diferencias(anteriores, actuales):
+    return [(jugador, puntaje - anteriores.get(jugador, 0))
+            for jugador, puntaje in actuales.items() if puntaje != anteriores.get(jugador, 0)]
+
+
+def codificar_puntajes(id_pregunta, cambios):
+    """cambios: lista de (jugador, delta); delta entre -32768 y 32767."""
+    try:
+        return trama(PUNTAJES, CUERPO_PUNTAJES.pack(id_pregunta, len(cambios))
+                     + b"".join([CAMBIO.pack(jugador, delta) for jugador, delta in cambios]))
+    except struct.error as e:
+        raise ValueError(f"Cambio de puntaje que no entra en el protocolo: {e}") from e
+
+
+def decodificar_puntajes(cuerpo):
+    try:
+        id_pregunta, cantidad = CUERPO_PUNTAJES.unpack_from(cuerpo)
+    except struct.error as e:
+        raise ValueError(f"Puntajes mal formados: {e}") from e
+    if len(cuerpo) != CUERPO_PUNTAJES.size + cantidad * CAMBIO.size:
+        raise ValueError("La cantidad de cambios no coincide con el largo")
+    return {"tipo": "puntajes", "id_pregunta": id_pregunta,
+            "cambios": list(CAMBIO.iter_unpack(memoryview(cuerpo)[CUERPO_PUNTAJES.size:]))}
+
+
+# === LECTURA DE TRAMAS ===
+
+DECODIFICADORES = {
+    PREGUNTA: decodificar_pregunta,
+    RONDA: decodificar_ronda,
+    RESPUESTA: decodificar_respuesta,
+    RECIBIDA: decodificar_recibida,
+    PUNTAJES: decodificar_puntajes,
+}
+
+
+# FUNCIÓN: decodifica el cuerpo de una trama según su tipo
+def decodificar(tipo, cuerpo):
+    decodificador = DECODIFICADORES.get(tipo)
+    if decodificador is None:
+        raise ValueError(f"Tipo de trama desconocido: {tipo}")
+    return decodificador(cuerpo)
+
+
+# FUNCIÓN: separa las tramas completas de un buffer de bytes recibidos
+def separar_tramas(buffer):
+    """
+    Devuelve ([(tipo, cuerpo), ...], resto): resto es la trama incompleta del final (se completa
+    con lo próximo que llegue). Cortar cada cuerpo como bytes es más rápido que un memoryview
+    por trama: los mensajes frecuentes miden menos de 20 bytes.
+    """
+    tramas = []
+    agregar = tramas.append
+    desempaquetar_cabecera = CABECERA.unpack_from
+    largo_cabecera = CABECERA.size
+    posicion = 0
+    total = len(buffer)
+    while total - posicion >= largo_cabecera:
+        tipo, largo = desempaquetar_cabecera(buffer, posicion)
+        if largo > LIMITE_CUERPO:
+            raise ValueError(f"Trama demasiado grande ({largo} bytes)")
+        inicio = posicion + largo_cabecera
+        if inicio + largo > total:
+            break
+        agregar((tipo, buffer[inicio:inicio + largo]))
+        posicion = inicio + largo
+    return tramas, buffer[posicion:]
+
+
+# FUNCIÓN: lee la próxima trama de un asyncio.StreamReader; devuelve (tipo, cuerpo)
+async def leer_trama(lector):
+    tipo, largo = CABECERA.unpack(await lector.readexactly(CABECERA.size))
+    if largo > LIMITE_CUERPO:
+        raise ValueError(f"Trama demasiado grande ({largo} bytes)")
+    return tipo, await lector.readexactly(largo)
@@ -11,6 +11,9 @@ from tkinter import *  # Importa todos los widgets de tkinter para interfaz grá
 from tkinter import messagebox  # Para mostrar ventanas emergentes de mensajes
 from tkinter import ttk  # Para widgets más modernos (Combobox, Button mejorados)
 import os  # Para manejo de rutas de archivos y directorios
+from bancos import bloqueo_banco, escribir_banco  # Bloqueo entre instancias y reemplazo atómico del archivo
+from bancos import descomprimir_banco  # Bancos .json, .json.gz o .json.xz según el nombre
+from bancos import leer_categoria  # Banco más su diario, con el mismo manejo de errores que quiz-app.py
 
 # === SECCIÓN 1: CONFIGURACIÓN Y CARGA DE DATOS ===
 
@@ -71,41 +74,22 @@ def directorio_script():
 # FUNCIÓN: carga todas las preguntas desde los archivos JSON al iniciar
 def cargar_preguntas(mapa_archivos):
     """
-    Lee los archivos JSON de cada categoría y carga todas las preguntas en memoria.
+    Lee los archivos JSON de cada categoría y carga todas las preguntas en memoria,
+    junto con las que quiz-app.py dejó en el diario de cada banco ("<archivo>.diario")
+    y que todavía no se compactaron: las dos apps ven el mismo banco.
     Devuelve un diccionario: {"Cine": [pregunta1, pregunta2...], "Música": [...], etc}
     """
-    todos_datos = {}  # Diccionario vacío donde guardaremos todas las preguntas
     base = directorio_script()  # Obtiene la ruta base donde está el programa
-    
-    for nombre_categoria, nombre_archivo in mapa_archivos.items():  # Recorre cada categoría y su archivo
-        ruta = os.path.join(base, nombre_archivo)  # Construye la ruta completa del archivo JSON
-        try:
-            with open(ruta, "r", encoding="utf-8") as f:  # Abre el archivo en modo lectura
-                datos = json.load(f)  # Convierte el JSON a una lista de Python
-                if isinstance(datos, list) and datos:  # Verifica que sea una lista no vacía
-                    todos_datos[nombre_categoria] = datos  # Guarda las preguntas en el diccionario
-                else:
-                    todos_datos[nombre_categoria] = datos if isinstance(datos, list) else []  # Si no es lista, vacío
-        except FileNotFoundError:  # Si el archivo no existe
-            try:
-                with open(ruta, "w", encoding="utf-8") as f:  # Crea el archivo vacío
-                    json.dump([], f, ensure_ascii=False, indent=2)  # Escribe una lista vacía
-                todos_datos[nombre_categoria] = []  # Añade categoría vacía al diccionario
-            except Exception as e:  # Si hay error al crear el archivo
-                print(f"No se pudo crear {nombre_archivo}: {e}")  # Imprime el error
-        except json.JSONDecodeError:  # Si el JSON está mal formado
-            print(f"JSON inválido en {nombre_archivo}.")  # Imprime el error
-            todos_datos[nombre_categoria] = []  # Añade categoría vacía
-        except Exception as e:  # Cualquier otro error
-            print(f"Error cargando {nombre_archivo}: {e}")  # Imprime el error
-            todos_datos[nombre_categoria] = []  # Añade categoría vacía
-    return todos_datos  # Devuelve el diccionario completo de todas las preguntas
+    return {nombre_categoria: leer_categoria(os.path.join(base, nombre_archivo))  # Banco + diario (lo crea si falta)
+            for nombre_categoria, nombre_archivo in mapa_archivos.items()}
 
 # FUNCIÓN: guarda una nueva pregunta en el archivo JSON de la categoría
 def guardar_pregunta_en_json(categoria, nueva_pregunta):
     """
     Añade una pregunta nueva al final del archivo JSON de una categoría.
     La pregunta tiene: pregunta, opciones, respuestaCorrecta
+    Leer, agregar y escribir se hace con el bloqueo exclusivo del banco (otra instancia que guarde
+    al mismo tiempo espera su turno) y el archivo se reemplaza de forma atómica.
     """
     base = directorio_script()  # Obtiene la ruta base
     if categoria not in MAPA_ARCHIVOS:  # Verifica que la categoría exista en MAPA_ARCHIVOS
@@ -113,19 +97,21 @@ def guardar_pregunta_en_json(categoria, nueva_pregunta):
     
     ruta = os.path.join(base, MAPA_ARCHIVOS[categoria])  # Construye la ruta del archivo
     try:
-        with open(ruta, "r", encoding="utf-8") as f:  # Abre el archivo para leer
-            existentes = json.load(f)  # Carga las preguntas existentes
-            if not isinstance(existentes, list):  # Si no es una lista
-                existentes = []  # Inicia como lista vacía
-    except Exception:
-        existentes = []  # Si hay error, crea lista vacía
-    
-    existentes.append(nueva_pregunta)  # Añade la nueva pregunta a la lista
-    try:
-        with open(ruta, "w", encoding="utf-8") as f:  # Abre el archivo para escribir (sobrescribe)
-            json.dump(existentes, f, ensure_ascii=False, indent=2)  # Convierte lista a JSON y guarda
+        with bloqueo_banco(ruta):  # Nadie más escribe este banco hasta terminar
+            try:
+                with open(ruta, "rb") as f:  # Abre el archivo para leer
+                    existentes = json.loads(descomprimir_banco(ruta, f.read()).decode("utf-8"))  # Carga las preguntas existentes
+                    if not isinstance(existentes, list):  # Si no es una lista
+                        existentes = []  # Inicia como lista vacía
+            except FileNotFoundError:
+                existentes = []  # Si no existe, crea lista vacía
+            # Un JSON inválido no se pisa con una lista vacía: el error llega al except de abajo
+
+            existentes.append(nueva_pregunta)  # Añade la nueva pregunta a la lista
+            escribir_banco(ruta, existentes)  # JSON (comprimido si corresponde), temporal + fsync + os.replace
+
         return True, None  # Devuelve éxito
-    except Exception as e:  # Si hay error al guardar
+    except Exception as e:  # Si hay error al leer o al guardar
         return False, str(e)  # Devuelve el error
 
 # === SECCIÓN 2: LÓGICA DEL QUIZ ===
@@ -5,42 +5,49 @@ Con temporizador, barra de tiempo y sistema de ayudas
 """
 
 # IMPORTACIONES: traen librerías necesarias para el programa
-import json  # Para leer/escribir archivos JSON
 import random  # Para mezclar preguntas aleatoriamente
 from tkinter import *  # Importa todos los widgets de tkinter para interfaz gráfica
 from tkinter import messagebox  # Para mostrar ventanas emergentes de mensajes
 from tkinter import ttk  # Para widgets más modernos (Combobox, Button mejorados)
 import os  # Para manejo de rutas de archivos y directorios
-import re  # Para expresiones regulares
+from bancos import MAPA_ARCHIVOS  # Diccionario que mapea nombres de categorías con sus archivos JSON
+from bancos import leer_categoria, leer_manifiesto  # Lectura de bancos con caché compilada y manifiesto
+from bancos import agregar_al_diario, compactar_bancos  # Diario de preguntas nuevas y su compactación
+from bancos import muestrear_categoria_flujo  # Muestreo de reservorio sin cargar bancos enormes
+from bancos import entrada_manifiesto, firma_diarios, ruta_diario  # Para detectar y releer bancos editados con la app abierta
+import threading  # Para compactar los diarios sin frenar la interfaz
+import banco_sqlite  # Backend alternativo: todas las preguntas en una base SQLite
+import banco_mmap  # Backend alternativo: bancos binarios con acceso aleatorio por mmap
+from registros import normalizar_pregunta, compactar_registro, registros_compactos  # Registros compilados y compactos
+from validacion import validar_nueva_pregunta  # Reglas compartidas con el importador masivo
+from duplicados import normalizar_texto  # Texto sin mayúsculas, tildes ni signos para detectar preguntas repetidas
+from busqueda import construir_indice  # Índice invertido para buscar preguntas por tema
+from estadisticas import estadisticas_vacias, resumen_estadisticas, sumar_pregunta  # Estadísticas por categoría
+from sesion_quiz import SesionQuiz, NUMERO_PREGUNTAS, TIEMPO_POR_PREGUNTA  # Motor del quiz (estado de la partida, sin tkinter)
 
 # === SECCIÓN 1: CONFIGURACIÓN Y CARGA DE DATOS ===
 
-# DICCIONARIO QUE MAPEA NOMBRES DE CATEGORÍAS CON SUS ARCHIVOS JSON
-MAPA_ARCHIVOS = {
-    "Peliculas y Series": "PeliSeries.json",  # Clave: nombre que verá el usuario | Valor: archivo JSON
-    "Ciencia": "Ciencia.json",
-    "Videojuegos": "Videojuegos.json",
-    "Historia": "Historia.json",
-    "Música": "Musica.json",
-    "Futbol": "Futbol.json",
-    "Star Wars": "StarWars.json",
-    "Rainbow Six Siege": "RainbowSixSiege.json"
-}
-
 # VARIABLES GLOBALES: guardan el estado actual del juego (accesibles en toda la aplicación)
-preguntas_actuales = []  # Lista de 10 preguntas de la categoría actual
-indice_pregunta_actual = 0  # Índice de la pregunta que se está mostrando (0 = primera pregunta)
-puntaje = 0  # Puntaje del jugador (contador de respuestas correctas)
-categoria_actual = None  # Categoría seleccionada actualmente
-datos_todas_preguntas = {}  # Diccionario con todas las preguntas: {"Cine": [...], "Música": [...], etc}
+sesion_actual = None  # Partida en curso (SesionQuiz): preguntas, pregunta actual, puntaje, tiempo y ayudas
+datos_todas_preguntas = {}  # Diccionario con las preguntas ya cargadas: {"Cine": [...], "Música": [...], etc}
+indice_duplicados = {}  # {categoría: conjunto de textos normalizados} para rechazar preguntas repetidas en O(1)
+indice_busqueda = None  # Índice invertido de todas las categorías (busqueda.IndiceBusqueda), se arma al buscar por primera vez
+id_busqueda = None  # ID del after que lanza la búsqueda mientras se escribe
+firmas_bancos = {}  # {categoría: (mtime, tamaño, diario)} de los archivos tal como están en memoria
+recargas_listas = {}  # {categoría: (firma, preguntas, entrada del manifiesto)} ya releídas, esperando que no haya un quiz en curso
+categorias_releyendo = set()  # Categorías que un hilo está releyendo
+manifiesto_bancos = {}  # Manifiesto de los bancos: {"Cine": {"archivo": ..., "cantidad": ..., "hash": ...}, etc}
 botones_actuales = []  # Lista de botones de opciones para poder modificarlos después
+indices_botones = []  # Índice original (en "opciones") de la opción de cada botón, en el mismo orden que botones_actuales
 temporizador_activo = False  # Booleano: ¿está corriendo el temporizador?
-tiempo_restante = 15  # Segundos restantes para responder la pregunta
 id_temporizador = None  # ID del timer para poder detenerlo si es necesario
-ayudas_restantes = 2  # Cantidad de ayudas disponibles en el quiz actual (máximo 2)
-ayuda_usada_esta_pregunta = False  # Booleano: ¿ya usó ayuda en esta pregunta?
 
-NUMERO_PREGUNTAS = 10  # Cantidad de preguntas por quiz (constante)
+BACKEND_BANCOS = "json"  # Dónde están las preguntas: "json" (archivos por categoría), "sqlite" (banco_sqlite.RUTA_SQLITE) o "mmap" (archivos .banco)
+conexion_sqlite = None  # Conexión a la base cuando BACKEND_BANCOS es "sqlite"
+bancos_mmap = {}  # {categoría: BancoMmap} cuando BACKEND_BANCOS es "mmap" (las no convertidas usan el JSON)
+LIMITE_BUSQUEDA = 8  # Resultados que muestra el buscador de la pantalla de agregar preguntas
+INTERVALO_RECARGA_MS = 2000  # Cada cuánto se revisa si alguien editó los JSON (None: nunca)
+UMBRAL_FLUJO = 64 * 1024 * 1024  # Bancos JSON más grandes que esto se muestrean en flujo en vez de cargarse (None: nunca; en un .json.gz cuenta el tamaño comprimido)
 
 # DICCIONARIO DE COLORES: define los colores del diseño
 PALETA_COLORES = {
@@ -69,9 +76,6 @@ COLORES_CATEGORIAS = {
 # TUPLA INMUTABLE para colores Kahoot
 COLORES_KAHOOT = ("#E74C3C", "#3498DB", "#F1C40F", "#2ECC71")  # Tupla inmutable (rojo, azul, amarillo, verde)
 
-# CONJUNTO para categorías prohibidas - búsqueda rápida O(1)
-CATEGORIAS_PROHIBIDAS = {"", "Seleccionar", "Ninguna", "Test", "Prueba"}  # Conjunto para validación rápida
-
 # TUPLA para mensajes de resultado
 MENSAJES_RESULTADO = (
     "¡Excelente! 🎉",
@@ -81,71 +85,28 @@ MENSAJES_RESULTADO = (
     "Sigue practicando 📚"
 )
 
-# FUNCIÓN CON EXPRESIONES REGULARES para validación de preguntas
-def validar_formato_pregunta(texto_pregunta):
-    """
-    Valida el formato de una pregunta usando expresiones regulares.
-    Retorna (es_valido, mensaje_error)
-    """
-    texto = texto_pregunta.strip()
-    
-    # Validar longitud mínima
-    if len(texto) < 10:
-        return False, "La pregunta debe tener al menos 10 caracteres"
-    
-    # Validar que termine con signo de interrogación usando regex
-    if not re.search(r'\?$', texto):
-        return False, "La pregunta debe terminar con signo de interrogación (?)"
-    
-    # Validar que no contenga URLs usando regex
-    if re.search(r'\b(?:https?|ftp)://\S+', texto, re.IGNORECASE):
-        return False, "No se permiten enlaces URL en la pregunta"
-    
-    # Validar que tenga al menos 3 palabras usando regex
-    palabras = re.findall(r'\b\w+\b', texto)
-    if len(palabras) < 3:
-        return False, "La pregunta debe tener al menos 3 palabras"
-    
-    return True, "Pregunta válida"
-
-# FUNCIÓN que usa MAP y FILTER para análisis de preguntas
-def analizar_preguntas():
+# FUNCIÓN: estadísticas de las preguntas, combinando las guardadas por categoría
+def analizar_preguntas(estadisticas_por_categoria=None):
     """
-    Analiza todas las preguntas usando map y filter.
-    Retorna estadísticas sobre las preguntas cargadas.
+    No recorre preguntas: suma las estadísticas de cada categoría (estadisticas.py),
+    que vienen calculadas en el manifiesto y se actualizan con cada pregunta nueva.
+    estadisticas_por_categoria: {categoría: estadísticas}; por defecto, las del manifiesto.
+    Retorna el resumen (total, longitud promedio, cortas/medias/largas, categorías activas).
     """
-    if not datos_todas_preguntas:
-        return "No hay preguntas cargadas"
-    
-    # Obtener todas las preguntas en una lista plana usando filter
-    todas_preguntas = []
-    for categoria in datos_todas_preguntas.values():
-        preguntas_validas = list(filter(lambda p: isinstance(p, dict) and 'pregunta' in p, categoria))
-        todas_preguntas.extend(preguntas_validas)
-    
-    if not todas_preguntas:
-        return "No hay preguntas válidas para analizar"
-    
-    # Usar MAP para obtener longitudes de todas las preguntas
-    longitudes = list(map(lambda p: len(p.get('pregunta', '')), todas_preguntas))
-    
-    # Usar FILTER para categorizar por dificultad (basado en longitud)
-    preguntas_cortas = list(filter(lambda x: x < 30, longitudes))
-    preguntas_medias = list(filter(lambda x: 30 <= x <= 80, longitudes))
-    preguntas_largas = list(filter(lambda x: x > 80, longitudes))
-    
-    # Calcular estadísticas
-    total_preguntas = len(longitudes)
-    longitud_promedio = sum(longitudes) / total_preguntas if total_preguntas > 0 else 0
-    
-    return {
-        'total_preguntas': total_preguntas,
-        'longitud_promedio': round(longitud_promedio, 2),
-        'preguntas_cortas': len(preguntas_cortas),
-        'preguntas_medias': len(preguntas_medias),
-        'preguntas_largas': len(preguntas_largas),
-        'categorias_activas': len(list(filter(lambda cat: len(cat) > 0, datos_todas_preguntas.values())))
-    }
+    if estadisticas_por_categoria is None:
+        estadisticas_por_categoria = {cat: entrada.get("estadisticas", estadisticas_vacias())
+                                      for cat, entrada in manifiesto_bancos.items()}
+    return resumen_estadisticas(estadisticas_por_categoria)
+
+# FUNCIÓN: muestra el resumen de estadísticas en la consola
+def imprimir_estadisticas(estadisticas, titulo="📊 Análisis de preguntas cargadas:"):
+    if not estadisticas["total_preguntas"]:
+        print("No hay preguntas cargadas")
+        return
+    print(titulo)
+    print(f"   Total: {estadisticas['total_preguntas']} preguntas")
+    print(f"   Longitud promedio: {estadisticas['longitud_promedio']} caracteres")
+    print(f"   Categorías activas: {estadisticas['categorias_activas']}")
 
 # ==================== FIN NUEVAS IMPLEMENTACIONES ====================
 
@@ -153,52 +114,104 @@ def analizar_preguntas():
 def directorio_script():
     return os.path.dirname(os.path.abspath(__file__))  # Devuelve la ruta de la carpeta actual
 
-# FUNCIÓN: carga todas las preguntas desde los archivos JSON al iniciar
-def cargar_preguntas(mapa_archivos):
+# FUNCIÓN: carga las preguntas de un solo archivo de categoría
+def cargar_categoria(nombre_archivo):
     """
-    Lee los archivos JSON de cada categoría y carga todas las preguntas en memoria.
-    Devuelve un diccionario: {"Cine": [pregunta1, pregunta2...], "Música": [...], etc}
+    Lee el archivo JSON de una categoría y devuelve su lista de preguntas.
+    Si el archivo no existe lo crea vacío; si está mal formado devuelve una lista vacía.
     """
-    todos_datos = {}  # Diccionario vacío donde guardaremos todas las preguntas
-    base = directorio_script()  # Obtiene la ruta base donde está el programa
-    
-    for nombre_categoria, nombre_archivo in mapa_archivos.items():  # Recorre cada categoría y su archivo
-        ruta = os.path.join(base, nombre_archivo)  # Construye la ruta completa del archivo JSON
-        try:
-            with open(ruta, "r", encoding="utf-8") as f:  # Abre el archivo en modo lectura
-                datos = json.load(f)  # Convierte el JSON a una lista de Python
-                if isinstance(datos, list) and datos:  # Verifica que sea una lista no vacía
-                    todos_datos[nombre_categoria] = datos  # Guarda las preguntas en el diccionario
-                else:
-                    todos_datos[nombre_categoria] = datos if isinstance(datos, list) else []  # Si no es lista, vacío
-        except FileNotFoundError:  # Si el archivo no existe
-            try:
-                with open(ruta, "w", encoding="utf-8") as f:  # Crea el archivo vacío
-                    json.dump([], f, ensure_ascii=False, indent=2)  # Escribe una lista vacía
-                todos_datos[nombre_categoria] = []  # Añade categoría vacía al diccionario
-            except Exception as e:  # Si hay error al crear el archivo
-                print(f"No se pudo crear {nombre_archivo}: {e}")  # Imprime el error
-        except json.JSONDecodeError:  # Si el JSON está mal formado
-            print(f"JSON inválido en {nombre_archivo}.")  # Imprime el error
-            todos_datos[nombre_categoria] = []  # Añade categoría vacía
-        except Exception as e:  # Cualquier otro error
-            print(f"Error cargando {nombre_archivo}: {e}")  # Imprime el error
-            todos_datos[nombre_categoria] = []  # Añade categoría vacía
-    
-    # Mostrar análisis de preguntas cargadas
-    estadisticas = analizar_preguntas()
-    if isinstance(estadisticas, dict):
-        print(f"📊 Análisis de preguntas cargadas:")
-        print(f"   Total: {estadisticas['total_preguntas']} preguntas")
-        print(f"   Longitud promedio: {estadisticas['longitud_promedio']} caracteres")
-        print(f"   Categorías activas: {estadisticas['categorias_activas']}")
-    
-    return todos_datos  # Devuelve el diccionario completo de todas las preguntas
+    preguntas = leer_categoria(os.path.join(directorio_script(), nombre_archivo))  # Ruta completa del archivo JSON
+    return registros_compactos(preguntas)  # Preguntas compactas (__slots__) que se leen como diccionarios
+
+# FUNCIÓN: devuelve las preguntas de una categoría, cargándolas la primera vez que se piden
+def obtener_preguntas_categoria(categoria):
+    """
+    Carga perezosa: el archivo de la categoría se parsea recién cuando se juega
+    y desde ahí queda en memoria dentro de datos_todas_preguntas.
+    """
+    if categoria not in datos_todas_preguntas:  # Todavía no se cargó
+        if categoria not in MAPA_ARCHIVOS:  # Categoría desconocida
+            return []
+        datos_todas_preguntas[categoria] = cargar_categoria(MAPA_ARCHIVOS[categoria])  # La carga y la guarda
+    return datos_todas_preguntas[categoria]
+
+# FUNCIÓN: decide si una categoría se muestrea en flujo en lugar de cargarla entera
+def usar_flujo(categoria):
+    """
+    Solo para bancos JSON que superan UMBRAL_FLUJO y que todavía no están en memoria
+    (si ya se cargaron, muestrear la lista es más rápido que volver a leer el archivo).
+    """
+    if UMBRAL_FLUJO is None or categoria in datos_todas_preguntas or categoria not in MAPA_ARCHIVOS:
+        return False
+    try:
+        return os.path.getsize(os.path.join(directorio_script(), MAPA_ARCHIVOS[categoria])) > UMBRAL_FLUJO
+    except OSError:  # Archivo faltante: la carga normal lo crea
+        return False
+
+# FUNCIÓN: cuenta las preguntas de una categoría sin cargarla
+def contar_preguntas(categoria):
+    """
+    Si la categoría ya está en memoria usa su largo; si no, la cantidad del manifiesto.
+    """
+    if categoria in datos_todas_preguntas:
+        return len(datos_todas_preguntas[categoria])
+    return manifiesto_bancos.get(categoria, {}).get("cantidad", 0)  # 0 si no está en el manifiesto
+
+# FUNCIÓN: devuelve el índice de textos normalizados de una categoría (lo arma la primera vez)
+def obtener_indice_duplicados(categoria):
+    """
+    Se arma una sola vez por categoría, con las preguntas en memoria si ya se cargó
+    o leyéndola sin dejarla cargada; después cada guardado lo actualiza.
+    """
+    if categoria not in indice_duplicados:
+        if BACKEND_BANCOS == "sqlite":
+            preguntas = banco_sqlite.leer_categoria_sqlite(conexion_sqlite, categoria)
+        elif categoria in datos_todas_preguntas:
+            preguntas = datos_todas_preguntas[categoria]
+        else:  # Se lee solo para el índice
+            preguntas = leer_categoria(os.path.join(directorio_script(), MAPA_ARCHIVOS[categoria]))
+        indice_duplicados[categoria] = {normalizar_texto(q.get("pregunta")) for q in preguntas}
+    return indice_duplicados[categoria]
+
+# FUNCIÓN: devuelve el índice de búsqueda de todas las categorías (lo arma la primera vez)
+def obtener_indice_busqueda():
+    """
+    Se arma una sola vez con las preguntas de todas las categorías (quedan cargadas
+    en datos_todas_preguntas); después cada guardado lo actualiza.
+    """
+    global indice_busqueda
+    if indice_busqueda is None:
+        if BACKEND_BANCOS == "sqlite":
+            preguntas = {cat: banco_sqlite.leer_categoria_sqlite(conexion_sqlite, cat) for cat in MAPA_ARCHIVOS}
+        else:
+            preguntas = {cat: obtener_preguntas_categoria(cat) for cat in MAPA_ARCHIVOS}
+        indice_busqueda = construir_indice(preguntas)
+    return indice_busqueda
+
+# FUNCIÓN: suma una pregunta recién guardada a los datos en memoria
+def registrar_pregunta_en_memoria(categoria, nueva_pregunta):
+    """
+    Actualiza solo lo que depende de esa categoría, en O(1):
+    la agrega a su lista si ya estaba cargada, suma 1 a su cantidad y a sus estadísticas
+    en el manifiesto y agrega su texto al índice de duplicados y al de búsqueda.
+    Si la categoría no estaba cargada, se leerá con la pregunta incluida (está en el diario).
+    """
+    if categoria in datos_todas_preguntas:  # Solo si ya estaba en memoria
+        datos_todas_preguntas[categoria].append(nueva_pregunta)
+    if categoria in indice_duplicados:
+        indice_duplicados[categoria].add(normalizar_texto(nueva_pregunta["pregunta"]))
+    if indice_busqueda is not None:
+        indice_busqueda.agregar(categoria, nueva_pregunta)
+    if categoria in manifiesto_bancos:
+        manifiesto_bancos[categoria]["cantidad"] += 1  # El menú muestra la cantidad nueva sin releer nada
+        sumar_pregunta(manifiesto_bancos[categoria].setdefault("estadisticas", estadisticas_vacias()), nueva_pregunta)
 
 # FUNCIÓN: guarda una nueva pregunta en el archivo JSON de la categoría
 def guardar_pregunta_en_json(categoria, nueva_pregunta):
     """
-    Añade una pregunta nueva al final del archivo JSON de una categoría.
+    Añade una pregunta nueva al diario de la categoría ("<archivo>.json.diario", o ".json.gz.diario").
+    No reescribe el archivo JSON: el diario se suma al cargar y se compacta aparte
+    (con el mismo formato del banco, comprimido si su nombre en MAPA_ARCHIVOS termina en .gz o .xz).
     La pregunta tiene: pregunta, opciones, respuestaCorrecta
     """
     base = directorio_script()  # Obtiene la ruta base
@@ -207,109 +220,174 @@ def guardar_pregunta_en_json(categoria, nueva_pregunta):
     
     ruta = os.path.join(base, MAPA_ARCHIVOS[categoria])  # Construye la ruta del archivo
     try:
-        with open(ruta, "r", encoding="utf-8") as f:  # Abre el archivo para leer
-            existentes = json.load(f)  # Carga las preguntas existentes
-            if not isinstance(existentes, list):  # Si no es una lista
-                existentes = []  # Inicia como lista vacía
-    except Exception:
-        existentes = []  # Si hay error, crea lista vacía
-    
-    existentes.append(nueva_pregunta)  # Añade la nueva pregunta a la lista
-    try:
-        with open(ruta, "w", encoding="utf-8") as f:  # Abre el archivo para escribir (sobrescribe)
-            json.dump(existentes, f, ensure_ascii=False, indent=2)  # Convierte lista a JSON y guarda
+        if BACKEND_BANCOS == "sqlite":  # Con el backend SQLite se inserta una fila
+            banco_sqlite.insertar(conexion_sqlite, categoria, nueva_pregunta)
+            return True, None
+        escritos = agregar_al_diario(ruta, nueva_pregunta)  # Agrega una línea al diario (no depende del tamaño del banco)
+        if categoria in firmas_bancos:  # Cambio propio: ya está en memoria, no hay que releer por él
+            firmas_bancos[categoria] = sumar_al_diario(firmas_bancos[categoria], ruta, escritos)
+        if categoria in bancos_mmap:  # El .banco no tiene la pregunta nueva: la categoría vuelve al JSON + diario
+            bancos_mmap.pop(categoria).cerrar()
         return True, None  # Devuelve éxito
     except Exception as e:  # Si hay error al guardar
         return False, str(e)  # Devuelve el error
 
+# === RECARGA EN CALIENTE: bancos editados con la app abierta ===
+# Cada INTERVALO_RECARGA_MS se compara la fecha y el tamaño de cada JSON (y de su diario) con los de
+# la última lectura: es un os.stat por archivo, sin abrirlos. La categoría que cambió se relee en un
+# hilo y se reemplaza en memoria recién cuando no hay un quiz en curso (el quiz sigue con sus preguntas).
+# Solo con BACKEND_BANCOS = "json" (la base SQLite y los .banco no se editan a mano).
+
+# FUNCIÓN: firma de los archivos de una categoría (cambia si alguien los edita)
+def firma_categoria(categoria):
+    ruta = os.path.join(directorio_script(), MAPA_ARCHIVOS[categoria])
+    try:
+        info = os.stat(ruta)
+        firma = (info.st_mtime_ns, info.st_size)
+    except OSError:  # Archivo borrado o todavía no creado
+        firma = None
+    return firma, firma_diarios(ruta)
+
+# FUNCIÓN: firma conocida más los bytes que esta instancia acaba de agregar al diario
+def sumar_al_diario(firma, ruta, escritos):
+    """
+    Solo avanza el tamaño del diario: si otra instancia o un editor cambiaron algo desde la última
+    revisión, la firma guardada sigue sin coincidir y vigilar_bancos relee la categoría igual.
+    (Tomar la firma del disco después de escribir escondería esos cambios.)
+    """
+    firma_archivo, diarios = firma
+    nombre = os.path.basename(ruta_diario(ruta))
+    diarios = [list(entrada) for entrada in diarios]
+    for entrada in diarios:
+        if entrada[0] == nombre:
+            entrada[1] += escritos
+            break
+    else:  # Todavía no había diario: lo creó esta escritura
+        diarios.insert(0, [nombre, escritos])
+    return firma_archivo, diarios
+
+# FUNCIÓN: relee una categoría (corre en un hilo: no toca la interfaz ni los datos en uso)
+def releer_categoria(categoria, firma):
+    """
+    Deja el resultado en recargas_listas; vigilar_bancos lo aplica en el hilo de la ventana.
+    Solo se parsean las preguntas si la categoría ya estaba cargada; si no, alcanza con el manifiesto.
+    """
+    try:
+        nombre_archivo = MAPA_ARCHIVOS[categoria]
+        entrada = entrada_manifiesto(os.path.join(directorio_script(), nombre_archivo), nombre_archivo)
+        preguntas = cargar_categoria(nombre_archivo) if categoria in datos_todas_preguntas else None
+        recargas_listas[categoria] = (firma, preguntas, entrada)
+    finally:
+        categorias_releyendo.discard(categoria)
+
+# FUNCIÓN: indica si se está jugando un quiz (su pantalla está a la vista)
+def quiz_en_curso():
+    return bool(marco_quiz.winfo_manager())  # "" si el frame del quiz está oculto
+
+# FUNCIÓN: reemplaza en memoria las categorías releídas
+def aplicar_recargas():
+    """
+    Cada categoría se cambia con una sola asignación (datos_todas_preguntas[categoria] = nueva lista).
+    Los índices que dependen de ella se descartan y se rearman cuando se usan.
+    """
+    global indice_busqueda
+    for categoria in list(recargas_listas):
+        firma, preguntas, entrada = recargas_listas.pop(categoria)
+        if preguntas is not None:
+            datos_todas_preguntas[categoria] = preguntas
+        else:
+            datos_todas_preguntas.pop(categoria, None)  # Si se cargó mientras tanto, se vuelve a leer al jugar
+        manifiesto_bancos[categoria] = entrada  # Cantidad y estadísticas nuevas para el menú
+        indice_duplicados.pop(categoria, None)
+        firmas_bancos[categoria] = firma
+        print(f"🔄 Banco recargado: {categoria} ({entrada['cantidad']} preguntas)")
+    indice_busqueda = None  # Tiene preguntas viejas: se rearma en la próxima búsqueda
+    if marco_categorias.winfo_manager():  # El menú está a la vista: se redibuja con las cantidades nuevas
+        mostrar_seleccion_categorias()
+
+# FUNCIÓN: revisa los bancos y se vuelve a programar con ventana_principal.after
+def vigilar_bancos():
+    for categoria in MAPA_ARCHIVOS:
+        if categoria in categorias_releyendo:
+            continue
+        conocida = recargas_listas[categoria][0] if categoria in recargas_listas else firmas_bancos.get(categoria)
+        firma = firma_categoria(categoria)
+        if firma != conocida:  # Alguien editó el archivo: se relee sin frenar la ventana
+            categorias_releyendo.add(categoria)
+            threading.Thread(target=releer_categoria, args=(categoria, firma), daemon=True).start()
+    if recargas_listas and not quiz_en_curso():
+        aplicar_recargas()
+    ventana_principal.after(INTERVALO_RECARGA_MS, vigilar_bancos)
+
 # === SECCIÓN 2: LÓGICA DEL QUIZ ===
+# El estado de la partida vive en sesion_actual (sesion_quiz.SesionQuiz); estas funciones
+# solo eligen el banco y le pasan a la sesión lo que hace el jugador.
 
 # FUNCIÓN: inicia un nuevo quiz con la categoría seleccionada
 def iniciar_quiz(categoria):
     """
-    Prepara el quiz: obtiene 10 preguntas al azar de la categoría,
-    resetea puntaje, temporizador y otras variables de estado.
+    Prepara el quiz: crea una sesión nueva con 10 preguntas al azar de la categoría
+    (puntaje, temporizador y ayudas empiezan de cero en la sesión).
     """
-    global preguntas_actuales, indice_pregunta_actual, puntaje, categoria_actual, tiempo_restante, ayudas_restantes, ayuda_usada_esta_pregunta
+    global sesion_actual
+    
+    if BACKEND_BANCOS == "sqlite":  # La base elige las preguntas al azar sin cargar la categoría
+        banco = banco_sqlite.muestrear(conexion_sqlite, categoria, NUMERO_PREGUNTAS)
+    elif BACKEND_BANCOS == "mmap" and categoria in bancos_mmap:  # Solo se decodifican las preguntas elegidas
+        banco = bancos_mmap[categoria].muestrear(NUMERO_PREGUNTAS)
+    elif usar_flujo(categoria):  # Banco enorme: una pasada por el archivo guardando solo 10 preguntas
+        banco = muestrear_categoria_flujo(os.path.join(directorio_script(), MAPA_ARCHIVOS[categoria]), NUMERO_PREGUNTAS)
+    else:
+        banco = obtener_preguntas_categoria(categoria)  # Carga la categoría si todavía no estaba en memoria
     
     # Verifica que la categoría tenga suficientes preguntas (mínimo 10)
-    if categoria not in datos_todas_preguntas or not isinstance(datos_todas_preguntas[categoria], list) or not datos_todas_preguntas[categoria] or len(datos_todas_preguntas[categoria]) < NUMERO_PREGUNTAS:
+    if not isinstance(banco, list) or len(banco) < NUMERO_PREGUNTAS:
         return False  # Devuelve False si no hay suficientes preguntas
     
-    categoria_actual = categoria  # Guarda la categoría actual
-    puntaje = 0  # Resetea el puntaje a 0
-    indice_pregunta_actual = 0  # Empieza en la primera pregunta
-    tiempo_restante = 15  # Inicializa el temporizador a 15 segundos
-    ayudas_restantes = 2  # Permite 2 ayudas por quiz
-    ayuda_usada_esta_pregunta = False  # Aún no usó ayuda en esta pregunta
-    
-    preguntas = list(datos_todas_preguntas[categoria])  # Copia la lista de preguntas
-    random.shuffle(preguntas)  # Las mezcla aleatoriamente
-    preguntas_actuales = preguntas[:NUMERO_PREGUNTAS]  # Toma solo las primeras 10
+    sesion_actual = SesionQuiz(categoria, banco, NUMERO_PREGUNTAS)  # Elige 10 al azar sin copiar el banco
     return True  # Devuelve True indicando que el quiz comenzó
 
 # FUNCIÓN: obtiene la pregunta que se está mostrando actualmente
 def obtener_pregunta_actual():
     """
-    Devuelve el diccionario de la pregunta actual (pregunta, opciones, respuestaCorrecta).
-    Si no hay más preguntas, devuelve None.
+    Devuelve el diccionario de la pregunta actual (pregunta, opciones, respuestaCorrecta, indiceCorrecto).
+    Si no hay más preguntas (o no hay quiz), devuelve None.
     """
-    if indice_pregunta_actual < len(preguntas_actuales):  # Verifica que el índice sea válido
-        return preguntas_actuales[indice_pregunta_actual]  # Devuelve la pregunta actual
-    return None  # Devuelve None si ya terminaron las preguntas
+    return sesion_actual.pregunta_actual() if sesion_actual else None
 
 # FUNCIÓN: verifica si la respuesta seleccionada es correcta
 def verificar_respuesta(indice_opcion_seleccionada):
     """
-    Compara la opción seleccionada con la respuesta correcta.
-    Si es correcta, suma 1 al puntaje.
+    Compara la opción seleccionada con la respuesta correcta (índice precalculado, dos enteros).
+    Si es correcta, suma 1 al puntaje; una pregunta ya respondida no vuelve a sumar.
     Devuelve True si es correcta, False si es incorrecta.
     """
-    global puntaje  # Accede a la variable global puntaje
-    
-    q = obtener_pregunta_actual()  # Obtiene la pregunta actual
-    if not q:  # Si no hay pregunta
-        return False  # Devuelve False
-    try:
-        respuesta_correcta = q["respuestaCorrecta"]  # Obtiene la respuesta correcta (texto)
-        indice_correcto = q["opciones"].index(respuesta_correcta)  # Obtiene el índice de esa respuesta
-    except Exception:
-        return False  # Devuelve False si hay error
-    
-    correcto = (indice_opcion_seleccionada == indice_correcto)  # Verifica si coinciden los índices
-    if correcto:  # Si es correcta
-        puntaje += 1  # Suma 1 al puntaje
-    return correcto  # Devuelve True o False
+    return sesion_actual.responder(indice_opcion_seleccionada) if sesion_actual else False
 
 # FUNCIÓN: avanza a la siguiente pregunta
 def siguiente_pregunta():
     """
-    Incrementa el índice de la pregunta actual y resetea el temporizador.
+    Incrementa el índice de la pregunta actual y resetea el temporizador y la ayuda.
     Devuelve True si hay más preguntas, False si ya terminaron.
     """
-    global indice_pregunta_actual, tiempo_restante, ayuda_usada_esta_pregunta
-    indice_pregunta_actual += 1  # Incrementa el índice
-    tiempo_restante = 15  # Resetea el temporizador
-    ayuda_usada_esta_pregunta = False  # Permite usar ayuda nuevamente
-    return indice_pregunta_actual < len(preguntas_actuales)  # Devuelve True si hay más preguntas
+    return sesion_actual.siguiente() if sesion_actual else False
 
 # FUNCIÓN: obtiene los resultados finales del quiz
 def obtener_resultados():
     """
     Devuelve una tupla (puntaje_actual, total_preguntas) para calcular el porcentaje.
     """
-    return puntaje, len(preguntas_actuales)  # Devuelve puntaje y total de preguntas
+    return sesion_actual.resultados() if sesion_actual else (0, 0)
 
 # === SECCIÓN 3: TEMPORIZADOR Y BARRA DE TIEMPO ===
 
 # FUNCIÓN: inicia el temporizador de 15 segundos
 def iniciar_temporizador():
     """
-    Activa el temporizador, lo setea a 15 segundos y comienza a contar.
+    Activa el temporizador y comienza a contar (la sesión ya tiene 15 segundos para la pregunta).
     """
-    global temporizador_activo, tiempo_restante, id_temporizador
+    global temporizador_activo, id_temporizador
     temporizador_activo = True  # Marca que el temporizador está corriendo
-    tiempo_restante = 15  # Inicializa a 15 segundos
     actualizar_visualizacion_temporizador()  # Actualiza la visualización en la interfaz
     actualizar_barra_tiempo()  # Actualiza la barra de tiempo
     id_temporizador = ventana_principal.after(1000, actualizar_temporizador)  # Llama a actualizar_temporizador en 1000ms (1 segundo)
@@ -329,18 +407,18 @@ def detener_temporizador():
 def actualizar_temporizador():
     """
     Se ejecuta cada segundo mientras temporizador_activo sea True.
-    Decrementa tiempo_restante, actualiza la pantalla y llama a tiempo_agotado() si llegó a 0.
+    Descuenta un segundo en la sesión, actualiza la pantalla y llama a tiempo_agotado() si llegó a 0.
     """
-    global tiempo_restante, temporizador_activo, id_temporizador
+    global temporizador_activo, id_temporizador
     
     if not temporizador_activo:  # Si el temporizador no está corriendo
         return  # Sale de la función
         
-    tiempo_restante -= 1  # Resta 1 segundo
+    se_acabo = sesion_actual.descontar_segundo()  # Resta 1 segundo
     actualizar_visualizacion_temporizador()  # Actualiza el texto del temporizador
     actualizar_barra_tiempo()  # Actualiza la barra de progreso
     
-    if tiempo_restante <= 0:  # Si se acabó el tiempo
+    if se_acabo:  # Si se acabó el tiempo
         detener_temporizador()  # Detiene el temporizador
         tiempo_agotado()  # Ejecuta la función de tiempo agotado
     else:
@@ -353,6 +431,7 @@ def actualizar_visualizacion_temporizador():
     Cambia el color a verde si hay > 5 segundos, rojo si hay <= 5 segundos.
     """
     if hasattr(actualizar_visualizacion_temporizador, 'etiqueta_temporizador') and actualizar_visualizacion_temporizador.etiqueta_temporizador:  # Verifica que exista el label
+        tiempo_restante = sesion_actual.tiempo_restante
         color = PALETA_COLORES["EXITO"] if tiempo_restante > 5 else PALETA_COLORES["ERROR"]  # Verde si >5s, rojo si <=5s
         actualizar_visualizacion_temporizador.etiqueta_temporizador.config(text=f"⏱️ {tiempo_restante}s", fg=color)  # Actualiza el texto y color
 
@@ -363,7 +442,8 @@ def actualizar_barra_tiempo():
     Cambia de color: verde (>5s) → amarillo (>2s) → rojo (<=2s).
     """
     if hasattr(actualizar_barra_tiempo, 'canvas_barra_tiempo') and actualizar_barra_tiempo.canvas_barra_tiempo:  # Verifica que exista el canvas
-        porcentaje = (tiempo_restante / 15) * 100  # Calcula qué porcentaje del tiempo queda (0-100%)
+        tiempo_restante = sesion_actual.tiempo_restante
+        porcentaje = (tiempo_restante / TIEMPO_POR_PREGUNTA) * 100  # Calcula qué porcentaje del tiempo queda (0-100%)
         
         # Elige color según el tiempo restante
         if tiempo_restante > 5:
@@ -410,11 +490,10 @@ def tiempo_agotado():
     if not q:
         return  # Si no hay pregunta, sale
         
-    respuesta_correcta = q.get("respuestaCorrecta", "")  # Obtiene la respuesta correcta
+    indice_correcto = q.get("indiceCorrecto", -1)  # Índice de la respuesta correcta
     
-    for b in botones_actuales:  # Recorre todos los botones
-        texto = b.cget("text")  # Obtiene el texto del botón
-        if texto == respuesta_correcta:
+    for b, indice in zip(botones_actuales, indices_botones):  # Recorre todos los botones con su índice original
+        if indice == indice_correcto:
             b.config(bg=PALETA_COLORES["EXITO"], fg="white")  # Colorea la correcta de verde
         else:
             b.config(bg=PALETA_COLORES["ERROR"])  # Colorea las incorrectas de rojo
@@ -441,42 +520,25 @@ def avanzar_despues_tiempo_agotado():
 def usar_ayuda():
     """
     Elimina 2 opciones incorrectas aleatorias (mostradas en gris).
-    Solo se puede usar 1 ayuda por pregunta y máximo 2 por quiz.
+    Solo se puede usar 1 ayuda por pregunta y máximo 2 por quiz (lo controla la sesión).
     """
-    global ayudas_restantes, ayuda_usada_esta_pregunta, botones_actuales
+    global botones_actuales
     
-    if ayudas_restantes <= 0 or ayuda_usada_esta_pregunta:  # Si no quedan ayudas o ya usó una en esta pregunta
+    habilitadas = [indice for boton, indice in zip(botones_actuales, indices_botones) if boton.cget("state") == "normal"]
+    a_eliminar = sesion_actual.usar_ayuda(habilitadas)  # Índices (en "opciones") de las opciones incorrectas elegidas
+    if not a_eliminar:  # Si no quedan ayudas o ya usó una en esta pregunta
         return  # Sale de la función
-        
-    ayudas_restantes -= 1  # Decrementa las ayudas disponibles
-    ayuda_usada_esta_pregunta = True  # Marca que ya usó ayuda en esta pregunta
     
+    ayudas_restantes = sesion_actual.ayudas_restantes
     if hasattr(cargar_interfaz_pregunta, 'boton_ayuda'):  # Si existe el botón de ayuda
         if ayudas_restantes > 0:
             cargar_interfaz_pregunta.boton_ayuda.config(text=f"❓ Ayuda ({ayudas_restantes} restantes)", state="normal")  # Actualiza el texto
         else:
             cargar_interfaz_pregunta.boton_ayuda.config(text="❓ Ayudas agotadas", state="disabled")  # Si no quedan, lo deshabilita
     
-    q = obtener_pregunta_actual()  # Obtiene la pregunta actual
-    if not q:
-        return  # Si no hay pregunta, sale
-        
-    respuesta_correcta = q.get("respuestaCorrecta", "")  # Obtiene la respuesta correcta
-    
-    indices_incorrectos = []  # Lista para guardar los índices de respuestas incorrectas
-    for i, boton in enumerate(botones_actuales):  # Recorre todos los botones
-        if boton.cget("text") != respuesta_correcta and boton.cget("state") == "normal":  # Si es incorrecta y está habilitada
-            indices_incorrectos.append(i)  # Añade su índice a la lista
-    
-    if len(indices_incorrectos) >= 2:  # Si hay 2 o más opciones incorrectas
-        random.shuffle(indices_incorrectos)  # Las mezcla aleatoriamente
-        a_eliminar = indices_incorrectos[:2]  # Toma las primeras 2
-        
-        for indice in a_eliminar:  # Recorre los índices a eliminar
-            botones_actuales[indice].config(state="disabled", bg="#666666", fg="#999999", text="❌ Eliminada")  # Las deshabilita y cambia de color
-    
-    elif len(indices_incorrectos) == 1:  # Si solo hay 1 opción incorrecta
-        botones_actuales[indices_incorrectos[0]].config(state="disabled", bg="#666666", fg="#999999", text="❌ Eliminada")  # La elimina
+    for boton, indice in zip(botones_actuales, indices_botones):  # Recorre los botones con su índice original
+        if indice in a_eliminar:
+            boton.config(state="disabled", bg="#666666", fg="#999999", text="❌ Eliminada")  # La deshabilita y cambia de color
 
 # === SECCIÓN 5: INTERFAZ GRÁFICA (TKINTER) ===
 
@@ -553,14 +615,20 @@ def mostrar_seleccion_categorias():
     Label(marco_categorias, text=f"Cada quiz tiene {NUMERO_PREGUNTAS} preguntas", font=fuente_mediana,
           bg=PALETA_COLORES["FONDO_CLARO"], fg=PALETA_COLORES["TEXTO_SECUNDARIO"]).pack(pady=4)  # Texto informativo
 
+    estadisticas = analizar_preguntas()  # Suma de las estadísticas guardadas (no recorre preguntas)
+    Label(marco_categorias, text=f"{estadisticas['total_preguntas']} preguntas en {estadisticas['categorias_activas']} "
+                                 f"categorías · {estadisticas['longitud_promedio']} caracteres en promedio",
+          font=fuente_pequena, bg=PALETA_COLORES["FONDO_CLARO"],
+          fg=PALETA_COLORES["TEXTO_SECUNDARIO"]).pack()  # Resumen de los bancos
+
     grid = Frame(marco_categorias, bg=PALETA_COLORES["FONDO_CLARO"])  # Frame para el grid de categorías
     grid.pack(expand=True, fill="both", pady=10)  # Lo empaqueta
 
-    categorias = list(dict.fromkeys(list(COLORES_CATEGORIAS.keys()) + list(datos_todas_preguntas.keys())))  # Obtiene lista de categorías sin duplicados
+    categorias = list(dict.fromkeys(list(COLORES_CATEGORIAS.keys()) + list(manifiesto_bancos.keys())))  # Obtiene lista de categorías sin duplicados
 
     for i, cat in enumerate(categorias):  # Recorre cada categoría con su índice
         colores = COLORES_CATEGORIAS.get(cat, {"bg": "#DDDDDD", "hover": "#CCCCCC", "icon": "❓", "fg": "#111"})  # Obtiene colores de la categoría
-        num_p = len(datos_todas_preguntas.get(cat, []))  # Cuenta cuántas preguntas tiene
+        num_p = contar_preguntas(cat)  # Cuenta cuántas preguntas tiene (sin cargar la categoría)
         tiene_preguntas = num_p >= NUMERO_PREGUNTAS  # Verifica si tiene suficientes preguntas
 
         estado_boton = "normal" if tiene_preguntas else "disabled"  # Estado del botón (habilitado o deshabilitado)
@@ -601,7 +669,7 @@ def cargar_interfaz_pregunta():
     """
     Borra la interfaz anterior y dibuja: encabezado, pregunta, 4 opciones, botón de ayuda y barra de tiempo.
     """
-    global botones_actuales
+    global botones_actuales, indices_botones
     
     for w in marco_quiz.winfo_children():  # Recorre todos los widgets del frame
         w.destroy()  # Los elimina
@@ -614,6 +682,7 @@ def cargar_interfaz_pregunta():
         mostrar_interfaz_resultados()  # Muestra los resultados
         return
 
+    categoria_actual = sesion_actual.categoria
     info_cat = COLORES_CATEGORIAS.get(categoria_actual, {"hover": "#888", "icon": "?"})  # Obtiene colores de la categoría
     
     encabezado = Frame(marco_quiz, bg=PALETA_COLORES["FONDO_CLARO"])  # Frame del encabezado
@@ -622,17 +691,17 @@ def cargar_interfaz_pregunta():
     Button(encabezado, text="← Categorías", command=mostrar_seleccion_categorias,  # Botón para volver a categorías
            relief="flat", bd=0, bg=PALETA_COLORES["FONDO_CLARO"]).pack(side=LEFT, padx=5)
     
-    actualizar_visualizacion_temporizador.etiqueta_temporizador = Label(encabezado, text=f"⏱️ {tiempo_restante}s", font=fuente_mediana,  # Label del temporizador
+    actualizar_visualizacion_temporizador.etiqueta_temporizador = Label(encabezado, text=f"⏱️ {sesion_actual.tiempo_restante}s", font=fuente_mediana,  # Label del temporizador
                                             bg=PALETA_COLORES["FONDO_CLARO"], fg=PALETA_COLORES["EXITO"])
     actualizar_visualizacion_temporizador.etiqueta_temporizador.pack(side=RIGHT, padx=8)
     
-    Label(encabezado, text=f"Puntaje: {puntaje}/{NUMERO_PREGUNTAS}", font=fuente_mediana,  # Label del puntaje
+    Label(encabezado, text=f"Puntaje: {sesion_actual.puntaje}/{NUMERO_PREGUNTAS}", font=fuente_mediana,  # Label del puntaje
           bg=PALETA_COLORES["FONDO_CLARO"], fg=PALETA_COLORES["EXITO"]).pack(side=RIGHT, padx=8)
     
     Label(encabezado, text=f"{info_cat.get('icon','')}  {categoria_actual}", font=fuente_mediana,  # Label de la categoría
           bg=PALETA_COLORES["FONDO_CLARO"]).pack(side=RIGHT, padx=8)
 
-    Label(marco_quiz, text=f"Pregunta {indice_pregunta_actual + 1} de {NUMERO_PREGUNTAS}",  # Contador de pregunta
+    Label(marco_quiz, text=f"Pregunta {sesion_actual.indice + 1} de {NUMERO_PREGUNTAS}",  # Contador de pregunta
           font=fuente_pequena, bg=PALETA_COLORES["FONDO_CLARO"], fg=PALETA_COLORES["TEXTO_SECUNDARIO"]).pack()
 
     contenedor_pregunta = Frame(marco_quiz, bg=info_cat["hover"], height=150)  # Frame para la pregunta
@@ -649,8 +718,9 @@ def cargar_interfaz_pregunta():
     marco_opciones.pack(fill="both", expand=False, pady=10)
 
     # USANDO LA TUPLA COLORES_KAHOOT en lugar de lista
-    opciones_mezcladas = random.sample(pregunta["opciones"], len(pregunta["opciones"]))  # Mezcla las opciones aleatoriamente
+    indices_mezclados = random.sample(range(len(pregunta["opciones"])), len(pregunta["opciones"]))  # Mezcla los índices de las opciones
     botones_actuales = []
+    indices_botones = []
 
     altura_pantalla = ventana_principal.winfo_screenheight() if ventana_principal else 900  # Obtiene la altura de la pantalla
     # Ajusta tamaño de botones según la altura de pantalla
@@ -670,11 +740,8 @@ def cargar_interfaz_pregunta():
         salto_b = 350
         relleno_b = 20
 
-    for i, texto_opcion in enumerate(opciones_mezcladas):  # Recorre cada opción
-        try:
-            indice_original = pregunta["opciones"].index(texto_opcion)  # Obtiene el índice original en el JSON
-        except ValueError:
-            indice_original = -1
+    for i, indice_original in enumerate(indices_mezclados):  # Recorre cada opción (índice original en el JSON)
+        texto_opcion = pregunta["opciones"][indice_original]  # Texto de la opción
 
         # USO DE TUPLA COLORES_KAHOOT - acceso por índice
         color_boton = COLORES_KAHOOT[i % len(COLORES_KAHOOT)]  # Asigna color a la opción
@@ -691,6 +758,7 @@ def cargar_interfaz_pregunta():
         btn.grid(row=i // 2, column=i % 2, padx=12, pady=12, sticky="nsew")  # Posiciona en grid 2x2
 
         botones_actuales.append(btn)  # Añade el botón a la lista global
+        indices_botones.append(indice_original)  # Y su índice original, para comparar sin mirar el texto
 
     for col in range(2):
         marco_opciones.grid_columnconfigure(col, weight=1)  # Configura columnas
@@ -698,7 +766,7 @@ def cargar_interfaz_pregunta():
     marco_ayuda = Frame(marco_quiz, bg=PALETA_COLORES["FONDO_CLARO"])  # Frame para el botón de ayuda
     marco_ayuda.pack(pady=15)
     
-    texto_boton_ayuda = f"❓ Ayuda ({ayudas_restantes} restantes)"
+    texto_boton_ayuda = f"❓ Ayuda ({sesion_actual.ayudas_restantes} restantes)"
     cargar_interfaz_pregunta.boton_ayuda = Button(marco_ayuda, text=texto_boton_ayuda, font=("Inter", 14, "bold"),  # Botón de ayuda
                                          bg=PALETA_COLORES["AYUDA"], fg="white", 
                                          activebackground="#7C3AED", activeforeground="white",
@@ -725,7 +793,7 @@ def manejar_respuesta(indice_opcion_seleccionada, texto_opcion_seleccionada):
         cargar_interfaz_pregunta.boton_ayuda.config(state="disabled")  # Lo deshabilita
 
     q = obtener_pregunta_actual()  # Obtiene la pregunta actual
-    respuesta_correcta = q.get("respuestaCorrecta", "")  # Obtiene la respuesta correcta
+    indice_correcto = q.get("indiceCorrecto", -1)  # Índice de la respuesta correcta
     es_correcta = verificar_respuesta(indice_opcion_seleccionada)  # Verifica si la respuesta es correcta
 
     if hasattr(cargar_interfaz_pregunta, 'etiqueta_pregunta'):  # Si existe el label de la pregunta
@@ -734,12 +802,10 @@ def manejar_respuesta(indice_opcion_seleccionada, texto_opcion_seleccionada):
         else:
             cargar_interfaz_pregunta.etiqueta_pregunta.config(text="❌ INCORRECTO", bg=PALETA_COLORES["ERROR"])  # Muestra "INCORRECTO" en rojo
 
-    for b in botones_actuales:  # Recorre todos los botones
-        texto = b.cget("text")  # Obtiene el texto del botón
-        
-        if texto == respuesta_correcta:
+    for b, indice in zip(botones_actuales, indices_botones):  # Recorre todos los botones con su índice original
+        if indice == indice_correcto:
             b.config(bg=PALETA_COLORES["EXITO"], fg="white")  # Colorea la correcta en verde
-        elif texto == texto_opcion_seleccionada and not es_correcta:
+        elif indice == indice_opcion_seleccionada and not es_correcta:
             b.config(bg=PALETA_COLORES["ERROR"])  # Colorea la seleccionada incorrecta en rojo
         else:
             b.config(bg=PALETA_COLORES["ERROR"])  # Colorea las otras opciones en rojo
@@ -771,6 +837,7 @@ def mostrar_interfaz_resultados():
         w.destroy()  # Los elimina
 
     valor_puntaje, total = obtener_resultados()  # Obtiene el puntaje y total
+    categoria_actual = sesion_actual.categoria if sesion_actual else None
     porcentaje = (valor_puntaje / total) * 100 if total > 0 else 0.0  # Calcula el porcentaje
 
     # Determinar el mensaje y color basado en el porcentaje
@@ -895,13 +962,25 @@ def mostrar_interfaz_agregar_pregunta():
     Label(encabezado, text="➕ Agregar Nueva Pregunta", font=fuente_grande,  # Título
           bg=PALETA_COLORES["FONDO_CLARO"]).pack(side=LEFT, padx=8)
 
+    # BUSCADOR: para ver si un tema ya tiene preguntas antes de escribir una nueva
+    marco_busqueda = Frame(marco_agregar_pregunta, bg=PALETA_COLORES["FONDO_CLARO"])
+    marco_busqueda.pack(fill="x", padx=10, pady=(8, 0))
+    Label(marco_busqueda, text="🔍 Buscar en los bancos:", font=fuente_mediana,
+          bg=PALETA_COLORES["FONDO_CLARO"]).grid(row=0, column=0, sticky="w")
+    variable_busqueda = StringVar()  # Texto a buscar
+    Entry(marco_busqueda, textvariable=variable_busqueda, font=fuente_mediana).grid(row=0, column=1, sticky="ew", padx=6)
+    lista_resultados = Listbox(marco_busqueda, height=5, font=fuente_pequena, activestyle="none")  # Resultados
+    lista_resultados.grid(row=1, column=0, columnspan=2, sticky="ew", pady=4)
+    marco_busqueda.grid_columnconfigure(1, weight=1)
+    variable_busqueda.trace_add("write", lambda *_: programar_busqueda(variable_busqueda.get(), lista_resultados))
+
     formulario = Frame(marco_agregar_pregunta, bg=PALETA_COLORES["FONDO_CLARO"])  # Frame del formulario
     formulario.pack(fill="both", expand=True, pady=12, padx=10)
 
     # CATEGORÍA: Combobox para seleccionar la categoría
     Label(formulario, text="Categoría:", font=fuente_mediana, bg=PALETA_COLORES["FONDO_CLARO"]).grid(row=0, column=0, sticky="w", pady=6)
     variable_nueva_categoria = StringVar()  # Variable para guardar la categoría
-    categorias = list(datos_todas_preguntas.keys())  # Lista de categorías disponibles
+    categorias = list(MAPA_ARCHIVOS.keys())  # Lista de categorías disponibles
     variable_nueva_categoria.set(categorias[0] if categorias else "Seleccionar")  # Selecciona la primera por defecto
     combo_categorias = ttk.Combobox(formulario, textvariable=variable_nueva_categoria, values=categorias, state="readonly", font=fuente_mediana)  # Dropdown
     combo_categorias.grid(row=0, column=1, sticky="ew", pady=6)
@@ -940,47 +1019,50 @@ def mostrar_interfaz_agregar_pregunta():
 
     formulario.grid_columnconfigure(1, weight=1)  # Configura la columna para que se expanda
 
+# FUNCIÓN: lanza la búsqueda un momento después de la última tecla
+def programar_busqueda(texto, lista_resultados):
+    global id_busqueda
+    if id_busqueda is not None:
+        ventana_principal.after_cancel(id_busqueda)  # Cancela la búsqueda de la tecla anterior
+    id_busqueda = ventana_principal.after(150, mostrar_resultados_busqueda, texto, lista_resultados)
+
+# FUNCIÓN: muestra en la lista las preguntas que coinciden con el texto buscado
+def mostrar_resultados_busqueda(texto, lista_resultados):
+    global id_busqueda
+    id_busqueda = None
+    if not lista_resultados.winfo_exists():  # Se cambió de pantalla antes de buscar
+        return
+    lista_resultados.delete(0, END)  # Limpia los resultados anteriores
+    if not texto.strip():
+        return
+    resultados = obtener_indice_busqueda().buscar(texto, LIMITE_BUSQUEDA)
+    if not resultados:
+        lista_resultados.insert(END, "Sin resultados: el tema todavía no tiene preguntas")
+    for resultado in resultados:
+        registro = resultado["registro"]
+        lista_resultados.insert(END, f"[{resultado['categoria']}] {registro['pregunta']} → {registro['respuestaCorrecta']}")
+
 # FUNCIÓN: guarda una nueva pregunta en el JSON
 def guardar_nueva_pregunta():
     """
     Valida los datos del formulario, crea un diccionario de pregunta,
     lo guarda en el archivo JSON de la categoría y actualiza datos_todas_preguntas.
     """
-    global datos_todas_preguntas
-    
     categoria = variable_nueva_categoria.get()  # Obtiene la categoría seleccionada
     pregunta = variable_texto_nueva_pregunta.get("1.0", END).strip()  # Obtiene el texto de la pregunta
     
-    # ========== VALIDACIÓN MEJORADA CON EXPRESIONES REGULARES ==========
-    es_valida, mensaje_error = validar_formato_pregunta(pregunta)
-    if not es_valida:
-        messagebox.showerror("Error", mensaje_error)
-        return
-    
-    # ========== VALIDACIÓN CON CONJUNTO CATEGORIAS_PROHIBIDAS ==========
-    if categoria in CATEGORIAS_PROHIBIDAS:
-        messagebox.showerror("Error", f"'{categoria}' no es un nombre de categoría permitido.")
-        return
-    
     opciones = [v.get().strip() for v in variables_opciones]  # Obtiene todas las opciones
-    if any(not o for o in opciones):  # Si falta completar una opción
-        messagebox.showerror("Error", "Completá las 4 opciones.")  # Muestra error
-        return
-    
-    # ========== VALIDACIÓN MEJORADA CON CONJUNTO ==========
-    opciones_set = set(opciones)  # Convertir a conjunto para detectar duplicados
-    if len(opciones_set) != len(opciones):
-        messagebox.showerror("Error", "Las opciones no pueden repetirse.")  # Muestra error
-        return
-    
     indice = variable_correcta.get()  # Obtiene el índice de la opción correcta
     
-    if categoria not in MAPA_ARCHIVOS:  # Si la categoría no existe
-        messagebox.showerror("Error", "Seleccioná una categoría válida.")  # Muestra error
+    # ========== VALIDACIÓN: formato (regex), categorías prohibidas, opciones y respuesta ==========
+    es_valida, mensaje_error = validar_nueva_pregunta(categoria, pregunta, opciones, indice, MAPA_ARCHIVOS)
+    if not es_valida:
+        messagebox.showerror("Error", mensaje_error)
         return
-        
-    if indice < 0 or indice > 3:  # Si el índice es inválido
-        messagebox.showerror("Error", "Seleccioná la respuesta correcta.")  # Muestra error
+    
+    # ========== VALIDACIÓN CON EL ÍNDICE DE DUPLICADOS (búsqueda en un conjunto: O(1)) ==========
+    if normalizar_texto(pregunta) in obtener_indice_duplicados(categoria):
+        messagebox.showerror("Error", f"Esa pregunta ya existe en '{categoria}'.")
         return
         
     nueva = {  # Crea diccionario con la nueva pregunta
@@ -992,7 +1074,7 @@ def guardar_nueva_pregunta():
     ok, err = guardar_pregunta_en_json(categoria, nueva)  # Guarda en el archivo JSON
     
     if ok:  # Si se guardó correctamente
-        datos_todas_preguntas = cargar_preguntas(MAPA_ARCHIVOS)  # Recarga todas las preguntas
+        registrar_pregunta_en_memoria(categoria, compactar_registro(normalizar_pregunta(nueva, categoria)))  # Actualiza la memoria sin releer los archivos
         messagebox.showinfo("Éxito", f"Pregunta agregada a '{categoria}'.")  # Muestra mensaje de éxito
         variable_texto_nueva_pregunta.delete("1.0", END)  # Limpia el campo de pregunta
         for v in variables_opciones:
@@ -1005,13 +1087,29 @@ def guardar_nueva_pregunta():
 # FUNCIÓN: inicializa toda la aplicación
 def inicializar_aplicacion():
     """
-    Punto de entrada: carga todas las preguntas, crea la ventana principal,
+    Punto de entrada: lee el manifiesto de los bancos, crea la ventana principal,
     los frames para cada pantalla y muestra el menú de categorías.
     """
-    global datos_todas_preguntas, ventana_principal
+    global datos_todas_preguntas, manifiesto_bancos, conexion_sqlite, bancos_mmap, ventana_principal
     global marco_contenido_principal, marco_categorias, marco_quiz, marco_resultados, marco_agregar_pregunta
     
-    datos_todas_preguntas = cargar_preguntas(MAPA_ARCHIVOS)  # Carga todas las preguntas desde los JSON
+    if BACKEND_BANCOS == "sqlite":
+        conexion_sqlite = banco_sqlite.abrir_base()  # Base creada con: python banco_sqlite.py importar
+        manifiesto_bancos = banco_sqlite.manifiesto_sqlite(conexion_sqlite, MAPA_ARCHIVOS)  # Cantidades por categoría
+    else:
+        # Estado de los archivos ANTES de leerlos: si cambian mientras tanto, la recarga en caliente los relee
+        firmas_bancos.update({categoria: firma_categoria(categoria) for categoria in MAPA_ARCHIVOS})
+        # Compacta en segundo plano los diarios que crecieron mucho (reemplazo atómico, no bloquea la ventana)
+        threading.Thread(target=compactar_bancos, args=(directorio_script(), MAPA_ARCHIVOS), daemon=True).start()
+        manifiesto_bancos = leer_manifiesto(directorio_script(), MAPA_ARCHIVOS)  # Solo cantidades: las preguntas se cargan al jugar
+        if BACKEND_BANCOS == "mmap":
+            # Bancos creados con: python banco_mmap.py convertir. Los desactualizados no se abren, y al guardar
+            # una pregunta (va al diario del JSON) la categoría deja el .banco y se juega desde el JSON
+            bancos_mmap = banco_mmap.abrir_bancos_mmap(MAPA_ARCHIVOS, directorio_script())
+            for categoria, banco in bancos_mmap.items():
+                manifiesto_bancos[categoria]["cantidad"] = len(banco)  # La cantidad sale de la cabecera
+    datos_todas_preguntas = {}  # Se llena a medida que se eligen categorías
+    imprimir_estadisticas(analizar_preguntas(), "📊 Bancos de preguntas:")  # Con las estadísticas del manifiesto, sin leer preguntas
     
     ventana_principal = Tk()  # Crea la ventana principal
     ventana_principal.title("🎯 Respondidos - Estilo Kahoot")  # Título de la ventana
@@ -1031,6 +1129,9 @@ def inicializar_aplicacion():
     marco_agregar_pregunta = Frame(marco_contenido_principal, bg=PALETA_COLORES["FONDO_CLARO"], padx=20, pady=20)  # Frame de agregar preguntas
     
     mostrar_seleccion_categorias()  # Muestra el menú de selección de categorías
+
+    if BACKEND_BANCOS == "json" and INTERVALO_RECARGA_MS:
+        ventana_principal.after(INTERVALO_RECARGA_MS, vigilar_bancos)  # Recarga en caliente de los JSON editados
     
     ventana_principal.mainloop()  # Inicia el loop principal (mantiene la ventana abierta)
 
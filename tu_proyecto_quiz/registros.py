@@ -0,0 +1,168 @@
+"""
+RESPONDIDOS - REGISTRO ÚNICO DE PREGUNTA PARA LOS DOS FORMATOS DE BANCO
+- tu_proyecto_quiz/*.json: {"pregunta", "opciones", "respuestaCorrecta": texto}
+- trivia respondidos/*.json: {"category", "name", "icon", "questions": [{"question", "options", "correct": índice}]}
+Los dos se compilan al mismo registro, con el índice de la respuesta correcta ya calculado:
+{"id", "categoria", "pregunta", "opciones", "respuestaCorrecta", "indiceCorrecto"}
+Así verificar una respuesta es comparar dos enteros.
+Para bancos enormes, los registros se guardan en memoria como objetos Pregunta
+(__slots__, tuplas y textos internados) que se leen igual que un diccionario.
+"""
+
+# IMPORTACIONES
+import sys  # Para sys.intern
+from collections.abc import Mapping  # Para que Pregunta se use como un diccionario de solo lectura
+
+# CLAVE DEL ÍNDICE PRECALCULADO (-1 si la respuesta correcta no está entre las opciones)
+CLAVE_INDICE = "indiceCorrecto"
+
+# CLAVES que se guardan en los JSON (el índice se recalcula al cargar)
+CLAVES_JSON = ("id", "categoria", "pregunta", "opciones", "respuestaCorrecta")
+
+
+# FUNCIÓN: compila una pregunta de cualquiera de los dos formatos
+def normalizar_pregunta(datos, categoria=None):
+    """
+    Devuelve el registro compilado. Las preguntas del formato de quiz-app.py se
+    completan en el mismo diccionario (sin copiarlas); las del formato de trivia
+    se convierten a un diccionario nuevo con las claves en español.
+    """
+    if "pregunta" in datos:  # Formato de quiz-app.py: la respuesta es un texto
+        opciones = datos.get("opciones", [])
+        try:
+            datos[CLAVE_INDICE] = opciones.index(datos.get("respuestaCorrecta"))
+        except (ValueError, AttributeError):
+            datos[CLAVE_INDICE] = -1  # Respuesta que no está entre las opciones
+        if categoria is not None and "categoria" not in datos:
+            datos["categoria"] = categoria
+        return datos
+
+    # Formato de trivia: la respuesta es un índice
+    opciones = datos.get("options")
+    if isinstance(opciones, tuple):
+        opciones = list(opciones)
+    # Si no es una lista se deja como está (un texto no se parte en letras) para que lint_bancos lo informe
+    indice = datos.get("correct")
+    if (not isinstance(opciones, list) or not isinstance(indice, int) or isinstance(indice, bool)
+            or not 0 <= indice < len(opciones)):
+        indice = -1
+    registro = {
+        "categoria": categoria,
+        "pregunta": datos.get("question", ""),
+        "respuestaCorrecta": opciones[indice] if indice >= 0 else None,
+        CLAVE_INDICE: indice,
+    }
+    if "options" in datos:  # Sin "options" queda sin "opciones", igual que una pregunta de quiz-app.py sin ellas
+        registro["opciones"] = opciones
+    if "id" in datos:
+        registro["id"] = datos["id"]
+    return registro
+
+
+# FUNCIÓN: compila el contenido de un archivo de banco (lista o envoltorio de trivia)
+def compilar_banco(datos, categoria=None):
+    """
+    Acepta la lista de quiz-app.py o el diccionario {"questions": [...]} de trivia.
+    Devuelve la lista de registros compilados (lo que no sea un diccionario se descarta).
+    """
+    if isinstance(datos, dict):  # Envoltorio de trivia
+        categoria = categoria or datos.get("name") or datos.get("category")
+        datos = datos.get("questions", [])
+    if not isinstance(datos, list):
+        return []
+    return [normalizar_pregunta(q, categoria) for q in datos if isinstance(q, dict)]
+
+
+# FUNCIÓN: compila un archivo de trivia manteniendo sus datos de categoría
+def compilar_archivo_trivia(datos):
+    """
+    Devuelve {"category": {"key", "name", "icon", "color"}, "questions": [registros]}.
+    Acepta "category" como texto (archivos actuales) o como diccionario.
+    """
+    info = datos.get("category") if isinstance(datos, dict) else None
+    if not isinstance(info, dict):
+        info = {"key": info, "name": datos.get("name", info), "icon": datos.get("icon", "❓"),
+                "color": datos.get("color")}
+    return {"category": info, "questions": compilar_banco(datos, info.get("name"))}
+
+
+# FUNCIÓN: deja solo las claves que van al JSON (para volver a guardar un registro)
+def a_formato_json(registro):
+    """
+    Sirve para diccionarios y para Preguntas compactas (las opciones vuelven a ser lista).
+    """
+    datos = {clave: registro[clave] for clave in CLAVES_JSON if clave in registro}
+    if "opciones" in datos:
+        datos["opciones"] = list(datos["opciones"])
+    return datos
+
+
+# === REGISTRO COMPACTO EN MEMORIA ===
+# Un diccionario por pregunta ocupa varios cientos de bytes y repite en cada una
+# el texto de la categoría y de opciones comunes ("Brasil", "1990", ...).
+# Pregunta guarda lo mismo en 6 slots, con las opciones en una tupla y los textos
+# repetidos internados (una sola copia por texto en todo el proceso).
+
+# CLAVE DEL DICCIONARIO -> ATRIBUTO de Pregunta
+ATRIBUTOS_PREGUNTA = {
+    "id": "id",
+    "categoria": "categoria",
+    "pregunta": "pregunta",
+    "opciones": "opciones",
+    "respuestaCorrecta": "respuesta_correcta",
+    CLAVE_INDICE: "indice_correcto",
+}
+
+
+# FUNCIÓN: interna un texto (los demás valores quedan igual)
+def internar(valor):
+    return sys.intern(valor) if type(valor) is str else valor
+
+
+# CLASE: pregunta compacta que se lee como un diccionario (q["pregunta"], q.get("id"), etc.)
+class Pregunta(Mapping):
+    __slots__ = ("id", "categoria", "pregunta", "opciones", "respuesta_correcta", "indice_correcto")
+
+    def __init__(self, id, categoria, pregunta, opciones, respuesta_correcta, indice_correcto):
+        self.id = id
+        self.categoria = internar(categoria)
+        self.pregunta = pregunta  # Casi siempre único: no vale la pena internarlo
+        self.opciones = tuple(internar(o) for o in opciones)
+        self.respuesta_correcta = internar(respuesta_correcta)
+        self.indice_correcto = indice_correcto
+
+    def __getitem__(self, clave):
+        atributo = ATRIBUTOS_PREGUNTA.get(clave)
+        if atributo is None:
+            raise KeyError(clave)
+        valor = getattr(self, atributo)
+        if valor is None and clave in ("id", "categoria"):
+            raise KeyError(clave)  # Igual que un diccionario al que le falta la clave
+        return valor
+
+    def __iter__(self):
+        return (clave for clave in ATRIBUTOS_PREGUNTA if clave in self)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __contains__(self, clave):
+        atributo = ATRIBUTOS_PREGUNTA.get(clave)
+        return atributo is not None and (clave not in ("id", "categoria") or getattr(self, atributo) is not None)
+
+    def __repr__(self):
+        return f"Pregunta({dict(self)!r})"
+
+
+# FUNCIÓN: convierte un registro compilado (diccionario) en una Pregunta compacta
+def compactar_registro(registro):
+    if isinstance(registro, Pregunta):
+        return registro
+    return Pregunta(registro.get("id"), registro.get("categoria"), registro.get("pregunta", ""),
+                    registro.get("opciones", ()), registro.get("respuestaCorrecta"),
+                    registro.get(CLAVE_INDICE, -1))
+
+
+# FUNCIÓN: convierte una lista de registros compilados en Preguntas compactas
+def registros_compactos(registros):
+    return [compactar_registro(r) for r in registros]
@@ -0,0 +1,135 @@
+"""
+RESPONDIDOS - RUEDA DE TEMPORIZADORES JERÁRQUICA
+Un solo bucle maneja los temporizadores de todas las salas del servidor (la cuenta regresiva de
+cada segundo, el tiempo agotado y la pausa después de cada pregunta) en vez de una tarea de
+asyncio con su propio sleep por sala.
+- El tiempo avanza en pasos de RESOLUCION segundos (un "tic")
+- NIVELES ruedas de RANURAS ranuras: el nivel 0 tiene una ranura por tic, el nivel 1 una cada
+  RANURAS tics, etc. Un temporizador va a la ranura del nivel más bajo que lo contiene y, cuando
+  la rueda de arriba llega a su ranura, baja de nivel ("cascada") hasta vencer en el nivel 0
+- Programar y cancelar son O(1): cada ranura es un dict y el temporizador recuerda en cuál está
+- Cada tic solo mira una ranura: el costo no depende de cuántos temporizadores hay esperando
+Con los valores de abajo llega a 2^24 tics (46 horas); lo que venza después espera en "lejanos".
+"""
+
+# IMPORTACIONES
+import asyncio  # Para correr la rueda dentro del servidor
+import time  # Reloj monotónico (el mismo que usa asyncio)
+import traceback  # Un temporizador que falla no frena a los demás
+
+# CONFIGURACIÓN
+RESOLUCION = 0.01  # Segundos por tic
+BITS = 6  # RANURAS = 2^BITS
+RANURAS = 1 << BITS  # Ranuras por nivel
+MASCARA = RANURAS - 1
+NIVELES = 4
+
+
+# CLASE: un temporizador programado (lo devuelve programar, sirve para cancelar)
+class Temporizador:
+    __slots__ = ("vence", "funcion", "args", "ranura")
+
+    def __init__(self, vence, funcion, args):
+        self.vence = vence  # Tic en el que vence
+        self.funcion = funcion
+        self.args = args
+        self.ranura = None  # dict de la rueda donde está; None si ya venció o se canceló
+
+    def activo(self):
+        return self.ranura is not None
+
+
+# CLASE: la rueda (todos los temporizadores de un proceso)
+class RuedaTemporizadores:
+    """
+    programar(segundos, funcion, *args) -> Temporizador; cancelar(temporizador).
+    avanzar(ahora) ejecuta lo vencido hasta el instante "ahora"; correr() lo hace solo dentro de asyncio.
+    Los segundos se cuentan desde el último tic (error de a lo sumo una RESOLUCION).
+    """
+
+    def __init__(self, resolucion=RESOLUCION, reloj=time.monotonic):
+        self.resolucion = resolucion
+        self.reloj = reloj
+        self.actual = int(reloj() / resolucion)  # Último tic procesado
+        self.niveles = [[{} for _ in range(RANURAS)] for _ in range(NIVELES)]
+        self.lejanos = {}  # Temporizadores más allá del último nivel
+        self.cantidad = 0  # Temporizadores activos
+
+    def __len__(self):
+        return self.cantidad
+
+    def programar(self, segundos, funcion, *args):
+        """Ejecuta funcion(*args) dentro de "segundos" (al menos un tic después)."""
+        temporizador = Temporizador(self.actual + max(1, round(segundos / self.resolucion)), funcion, args)
+        self.colocar(temporizador)
+        self.cantidad += 1
+        return temporizador
+
+    def cancelar(self, temporizador):
+        """Devuelve True si estaba activo. Cancelar uno ya vencido o cancelado no hace nada."""
+        if temporizador is None or temporizador.ranura is None:
+            return False
+        del temporizador.ranura[temporizador]
+        temporizador.ranura = None
+        self.cantidad -= 1
+        return True
+
+    def colocar(self, temporizador):
+        """Lo pone en la ranura del nivel más bajo cuyo período contiene su vencimiento."""
+        distinto = temporizador.vence ^ self.actual  # Bits en que difieren: el más alto dice el nivel
+        if distinto >> (BITS * NIVELES):
+            ranura = self.lejanos
+        else:
+            nivel = 0
+            while distinto >> (BITS * (nivel + 1)):
+                nivel += 1
+            ranura = self.niveles[nivel][(temporizador.vence >> (BITS * nivel)) & MASCARA]
+        ranura[temporizador] = None
+        temporizador.ranura = ranura
+
+    def bajar(self, nivel, indice):
+        """Cascada: reparte la ranura de un nivel alto entre los niveles de abajo."""
+        ruedas = self.niveles[nivel] if nivel < NIVELES else None
+        if ruedas is None:
+            pendientes, self.lejanos = self.lejanos, {}
+        else:
+            pendientes, ruedas[indice] = ruedas[indice], {}
+        for temporizador in pendientes:
+            self.colocar(temporizador)
+
+    def avanzar(self, ahora=None):
+        """Procesa los tics hasta "ahora" (por defecto, el reloj). Devuelve cuántos temporizadores ejecutó."""
+        objetivo = int((self.reloj() if ahora is None else ahora) / self.resolucion)
+        if self.cantidad == 0:  # Nada pendiente: saltar directo sin recorrer los tics vacíos
+            self.actual = max(self.actual, objetivo)
+            return 0
+        ejecutados = 0
+        while self.actual < objetivo:
+            self.actual += 1
+            if not self.actual & MASCARA:  # Terminó una vuelta del nivel 0: bajan los de arriba
+                for nivel in range(NIVELES, 0, -1):
+                    if not self.actual & ((1 << (BITS * nivel)) - 1):
+                        self.bajar(nivel, (self.actual >> (BITS * nivel)) & MASCARA)
+            ruedas = self.niveles[0]
+            indice = self.actual & MASCARA
+            vencidos = ruedas[indice]
+            if not vencidos:
+                continue
+            ruedas[indice] = {}  # Lo que se programe durante los llamados va a una ranura nueva
+            for temporizador in list(vencidos):
+                if temporizador.ranura is not vencidos:  # Lo canceló un llamado anterior de este mismo tic
+                    continue
+                temporizador.ranura = None
+                self.cantidad -= 1
+                ejecutados += 1
+                try:
+                    temporizador.funcion(*temporizador.args)
+                except Exception:
+                    traceback.print_exc()
+        return ejecutados
+
+    async def correr(self):
+        """Avanza la rueda una vez por tic hasta que se cancele la tarea."""
+        while True:
+            await asyncio.sleep(max(0.0, (self.actual + 1) * self.resolucion - self.reloj()))
+            self.avanzar()
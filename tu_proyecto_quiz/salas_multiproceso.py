@@ -0,0 +1,222 @@
+"""
+RESPONDIDOS - SERVIDOR MULTIJUGADOR EN VARIOS PROCESOS (UNO POR NÚCLEO)
+Un solo proceso de asyncio usa un solo núcleo. servir_multiproceso() carga los bancos una vez,
+crea N procesos trabajadores con fork (los bancos se comparten copia-en-escritura) y cada uno
+corre su propio ServidorJuego con sus propias salas.
+- Reparto de conexiones: cada trabajador abre su socket en el mismo puerto con SO_REUSEPORT y
+  el kernel reparte las conexiones nuevas ("reuseport"), o todos aceptan del mismo socket
+  heredado del padre ("compartido", para sistemas sin SO_REUSEPORT)
+- Reparto de salas: el código de sala dice de qué trabajador es (trabajador_de_sala). Si un
+  "unirse" llega al trabajador equivocado, este le pasa la conexión abierta (el descriptor, con
+  SCM_RIGHTS por un socketpair) y la línea ya leída al dueño de la sala, y se olvida de ella
+- Por eso un cliente que se une espera el "unido" antes de mandar otra cosa: lo que mande
+  después de la primera línea lo lee el trabajador dueño de la sala
+Solo Linux/macOS (fork, SO_REUSEPORT, socket.send_fds).
+"""
+
+# IMPORTACIONES
+import asyncio  # Cada trabajador tiene su propio bucle de eventos
+import gc  # Para congelar los bancos antes del fork
+import json  # Para mirar la primera línea de cada conexión
+import os  # fork, pipes, waitpid
+import random  # Cada trabajador necesita su propia semilla
+import signal  # Para reenviar Ctrl+C / SIGTERM a los trabajadores
+import socket  # SO_REUSEPORT y pasaje de descriptores entre procesos
+import traceback  # Para mostrar el error de un trabajador que se cae
+from servidor_juego import COLA_CONEXIONES, LIMITE_LINEA, PAUSA_RESULTADO, ServidorJuego, cargar_bancos
+
+# CONFIGURACIÓN
+REPARTOS = ("reuseport", "compartido")
+
+
+# FUNCIÓN: qué trabajador (0..total-1) es dueño de una sala
+def trabajador_de_sala(codigo, total):
+    return sum(map(ord, codigo)) % total
+
+
+# CLASE: un ServidorJuego que solo crea salas propias y pasa a otro trabajador los jugadores ajenos
+class ServidorTrabajador(ServidorJuego):
+    def __init__(self, bancos, indice, total, canal, envios, rng=random, pausa=PAUSA_RESULTADO):
+        super().__init__(bancos, rng, pausa)
+        self.indice = indice  # Número de este trabajador
+        self.total = total
+        self.canal = canal  # Socket por el que llegan conexiones de otros trabajadores
+        self.envios = envios  # [socket para pasarle conexiones al trabajador i]
+        self.traspasadas = 0  # Conexiones que este trabajador le pasó a otro
+        self.recibidas = set()  # Tareas de las conexiones recibidas (para que no se las lleve el recolector)
+
+    def codigo_nuevo(self):
+        while True:  # En promedio "total" intentos
+            codigo = super().codigo_nuevo()
+            if trabajador_de_sala(codigo, self.total) == self.indice:
+                return codigo
+
+    async def atender(self, lector, escritor, primera=None):
+        if primera is None:
+            try:
+                primera = await lector.readline()
+            except (ValueError, ConnectionError):
+                escritor.close()
+                return
+            destino = self.destino(primera)
+            if destino is not None and destino != self.indice:
+                self.traspasar(destino, primera, escritor)
+                return
+        await super().atender(lector, escritor, primera)
+
+    def destino(self, linea):
+        """Trabajador dueño de la sala si la línea es un "unirse"; None si la atiende cualquiera."""
+        try:
+            datos = json.loads(linea)
+            codigo = datos["sala"] if datos["tipo"] == "unirse" else None
+        except (ValueError, KeyError, TypeError):
+            return None
+        if not isinstance(codigo, str) or not codigo:
+            return None
+        return trabajador_de_sala(codigo, self.total)
+
+    def traspasar(self, destino, linea, escritor):
+        """Manda el descriptor de la conexión y la primera línea al trabajador destino y cierra la copia propia."""
+        conexion = escritor.get_extra_info("socket")
+        try:
+            socket.send_fds(self.envios[destino], [linea], [conexion.fileno()])
+            self.traspasadas += 1
+        except OSError:  # El otro trabajador no está: la conexión se pierde como si el servidor la cortara
+            pass
+        escritor.close()  # Cierra solo este descriptor: la conexión sigue abierta en el destino
+
+    def recibir_traspaso(self):
+        """Lo llama el bucle de eventos cuando otro trabajador manda una conexión."""
+        try:
+            linea, descriptores, _, _ = socket.recv_fds(self.canal, LIMITE_LINEA, 1)
+        except BlockingIOError:
+            return
+        if not descriptores:
+            return
+        conexion = socket.socket(fileno=descriptores[0])
+        conexion.setblocking(False)
+        tarea = asyncio.get_running_loop().create_task(self.atender_traspasada(conexion, linea))
+        self.recibidas.add(tarea)
+        tarea.add_done_callback(self.recibidas.discard)
+
+    async def atender_traspasada(self, conexion, linea):
+        lector, escritor = await asyncio.open_connection(sock=conexion, limit=LIMITE_LINEA)
+        await self.atender(lector, escritor, linea)
+
+    async def servir(self, host=None, puerto=None, listo=None, sock=None):
+        self.canal.setblocking(False)
+        asyncio.get_running_loop().add_reader(self.canal.fileno(), self.recibir_traspaso)
+        await super().servir(host, puerto, listo, sock)
+
+
+# FUNCIÓN: socket TCP en host:puerto (con SO_REUSEPORT para que varios procesos usen el mismo puerto)
+def socket_tcp(host, puerto, reuseport):
+    familia = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(familia, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if reuseport:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, puerto))
+    return sock
+
+
+# FUNCIÓN: cuerpo de un proceso trabajador (no vuelve: termina con os._exit)
+def correr_trabajador(indice, total, bancos, host, puerto, reparto, compartido, canal, envios, aviso, pausa):
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    random.seed()  # Tras el fork todos los procesos tienen el mismo estado de random
+    codigo_salida = 0
+    try:
+        if reparto == "reuseport":
+            sock = socket_tcp(host, puerto, reuseport=True)
+            sock.listen(COLA_CONEXIONES)
+        else:
+            sock = compartido
+        sock.setblocking(False)
+        juego = ServidorTrabajador(bancos, indice, total, canal, envios, pausa=pausa)
+
+        def listo(_):
+            os.write(aviso, b".")  # Le avisa al padre que ya acepta conexiones
+            os.close(aviso)
+
+        asyncio.run(juego.servir(sock=sock, listo=listo))
+    except KeyboardInterrupt:
+        pass
+    except BaseException:
+        traceback.print_exc()
+        codigo_salida = 1
+    os._exit(codigo_salida)  # Sin atexit ni destructores heredados del padre
+
+
+# FUNCIÓN: levanta "trabajadores" procesos que atienden salas y espera a que terminen
+def servir_multiproceso(trabajadores, host="0.0.0.0", puerto=8765, reparto="reuseport", pausa=PAUSA_RESULTADO,
+                        bancos=None):
+    """
+    Carga los bancos en este proceso (una sola vez) y hace fork de los trabajadores.
+    Imprime "Escuchando en host:puerto" cuando todos aceptan conexiones.
+    Ctrl+C o SIGTERM al padre terminan a todos. Devuelve el código de salida (0 si todo anduvo bien).
+    """
+    if reparto not in REPARTOS:
+        raise ValueError(f"Reparto desconocido: {reparto!r} (opciones: {', '.join(REPARTOS)})")
+    if bancos is None:
+        bancos = cargar_bancos()
+    gc.collect()
+    gc.freeze()  # El recolector no vuelve a recorrer los bancos: sus páginas quedan compartidas tras el fork
+
+    # El padre reserva el puerto (con 0, el kernel elige uno) sin escuchar en él
+    reservado = socket_tcp(host, puerto, reuseport=(reparto == "reuseport"))
+    puerto = reservado.getsockname()[1]
+    compartido = None
+    if reparto == "compartido":
+        reservado.listen(COLA_CONEXIONES)
+        compartido = reservado
+
+    pares = [socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET) for _ in range(trabajadores)]
+    envios = [envio for envio, _ in pares]
+    lectura_aviso, aviso = os.pipe()
+    hijos = []
+    for indice in range(trabajadores):
+        pid = os.fork()
+        if pid == 0:
+            for otro, (_, canal_otro) in enumerate(pares):
+                if otro != indice:
+                    canal_otro.close()
+            os.close(lectura_aviso)
+            correr_trabajador(indice, trabajadores, bancos, host, puerto, reparto, compartido,
+                              pares[indice][1], envios, aviso, pausa)
+        hijos.append(pid)
+    os.close(aviso)
+    for envio, canal in pares:
+        envio.close()
+        canal.close()
+
+    def reenviar(numero, _):
+        for pid in hijos:
+            try:
+                os.kill(pid, numero)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, reenviar)
+    signal.signal(signal.SIGINT, reenviar)
+
+    listos = 0
+    while listos < trabajadores:
+        leido = os.read(lectura_aviso, trabajadores)
+        if not leido:  # Algún trabajador murió antes de escuchar
+            break
+        listos += len(leido)
+    os.close(lectura_aviso)
+    if listos == trabajadores:
+        print(f"Escuchando en {host}:{puerto}", flush=True)
+        print(f"{trabajadores} trabajadores (reparto {reparto}), pids {' '.join(map(str, hijos))}", flush=True)
+    else:
+        reenviar(signal.SIGTERM, None)
+
+    codigo_salida = 0 if listos == trabajadores else 1
+    for pid in hijos:
+        _, estado = os.waitpid(pid, 0)
+        if os.waitstatus_to_exitcode(estado) not in (0, -signal.SIGTERM, -signal.SIGINT):
+            codigo_salida = 1  # Un trabajador terminó con error
+    reservado.close()
+    return codigo_salida
@@ -0,0 +1,327 @@
+"""
+RESPONDIDOS - SERVIDOR MULTIJUGADOR PARA LA RED LOCAL (ESTILO KAHOOT)
+Un anfitrión crea una sala para una categoría, los jugadores se unen con el código de la sala
+y todos reciben la misma pregunta al mismo tiempo. El servidor lleva la cuenta regresiva de 15
+segundos (las respuestas que llegan tarde no cuentan) y suma los puntos con la misma regla que
+verificar_respuesta (sesion_quiz.es_correcta): 1 punto por respuesta correcta, una respuesta por pregunta.
+Solo librería estándar (asyncio): miles de jugadores en un único proceso, o varios procesos
+con --trabajadores N (salas_multiproceso.py) para usar todos los núcleos.
+Los tiempos de todas las salas (un tic por segundo de cuenta regresiva, tiempo agotado, pausa entre
+preguntas) los maneja una sola RuedaTemporizadores por proceso, no una tarea con sleep por sala.
+
+PROTOCOLO: TCP, un objeto JSON por línea (UTF-8). Los mensajes tienen "tipo".
+  cliente -> servidor
+    {"tipo": "crear", "categoria": "Ciencia"}               el anfitrión crea la sala
+    {"tipo": "unirse", "sala": "QXZT", "nombre": "Ana"}     un jugador entra a una sala que no empezó
+    {"tipo": "empezar"}                                     el anfitrión arranca la partida
+    {"tipo": "responder", "numero": 0, "opcion": 2}         opcion: índice en "opciones"
+  servidor -> cliente
+    {"tipo": "sala", "sala": "QXZT", "categoria": ...}      al anfitrión
+    {"tipo": "unido", "sala": ..., "jugador": 17}           al jugador
+    {"tipo": "jugadores", "cantidad": 18}                   al anfitrión, cada vez que entra o sale alguien
+    {"tipo": "pregunta", "numero", "total", "pregunta", "opciones", "tiempo"}   a todos
+    {"tipo": "recibida", "numero": 0}                       confirmación de cada respuesta aceptada
+    {"tipo": "resultado", "numero", "correcta", "acertaste", "puntaje"}         a cada jugador al cerrar la pregunta
+    {"tipo": "fin", "ranking": [[nombre, puntaje], ...], "puntaje": ...}        a todos al terminar
+    {"tipo": "error", "mensaje": ...}
+
+Un cliente que se une espera el "unido" antes de mandar otro mensaje (en modo multiproceso
+la conexión puede pasar a otro proceso después de leer esa primera línea).
+
+Uso: python servidor_juego.py [--host 0.0.0.0] [--puerto 8765] [--trabajadores N] [--pausa 2]
+"""
+
+# IMPORTACIONES
+import argparse  # Para las opciones de la línea de comandos
+import asyncio  # Un solo hilo atiende a todos los clientes
+import json  # Formato de los mensajes
+import os  # Para rutas de archivos
+import random  # Para el código de sala
+import string  # Letras del código de sala
+from bancos import CARPETA_BANCOS, MAPA_ARCHIVOS, leer_categoria
+from rueda_temporizadores import RuedaTemporizadores
+from sesion_quiz import NUMERO_PREGUNTAS, TIEMPO_POR_PREGUNTA, SesionQuiz, es_correcta
+
+# CONFIGURACIÓN
+HOST = "0.0.0.0"  # Todas las interfaces: los jugadores están en la red local
+PUERTO = 8765
+PAUSA_RESULTADO = 2  # Segundos entre cerrar una pregunta y mostrar la siguiente (como el after(2000) de quiz-app.py)
+LARGO_CODIGO = 4  # Letras del código de sala
+TAMANO_RANKING = 10  # Jugadores que aparecen en el ranking final
+LIMITE_LINEA = 16 * 1024  # Bytes máximos de un mensaje del cliente
+LIMITE_PENDIENTE = 256 * 1024  # Si a un cliente se le acumula más que esto sin leer, se lo desconecta
+COLA_CONEXIONES = 4096  # Conexiones que pueden esperar a ser aceptadas (muchos jugadores entran juntos)
+
+
+# FUNCIÓN: codifica un mensaje (una línea JSON)
+def mensaje(**campos):
+    return json.dumps(campos, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+# FUNCIÓN: envía bytes sin esperar: un cliente lento no frena al resto de la sala
+def enviar(escritor, datos):
+    """
+    Devuelve False (y corta la conexión) si el cliente ya tiene demasiado sin leer.
+    """
+    if escritor.is_closing():
+        return False
+    if escritor.transport.get_write_buffer_size() > LIMITE_PENDIENTE:
+        escritor.close()
+        return False
+    escritor.write(datos)
+    return True
+
+
+# CLASE: un jugador conectado a una sala
+class Jugador:
+    __slots__ = ("numero", "nombre", "escritor", "puntaje", "ultima_respondida", "acerto")
+
+    def __init__(self, numero, nombre, escritor):
+        self.numero = numero
+        self.nombre = nombre
+        self.escritor = escritor
+        self.puntaje = 0
+        self.ultima_respondida = -1  # Número de la última pregunta que respondió
+        self.acerto = False  # ¿Acertó la última que respondió?
+
+
+# CLASE: una sala (una partida con muchos jugadores)
+class Sala:
+    def __init__(self, codigo, sesion, anfitrion):
+        self.codigo = codigo
+        self.sesion = sesion  # SesionQuiz: las preguntas y cuál se está jugando
+        self.anfitrion = anfitrion  # Escritor del anfitrión (no responde, solo mira)
+        self.jugadores = {}  # {número: Jugador}
+        self.estado = "esperando"  # "esperando" -> "jugando" -> "terminada"
+        self.abierta = False  # ¿Se aceptan respuestas para la pregunta actual?
+        self.respondieron = set()  # Números de los jugadores conectados que ya respondieron la pregunta actual
+        self.confirmacion = b""  # Mensaje "recibida" de la pregunta actual (el mismo para todos)
+        self.temporizador = None  # Próximo segundo de la cuenta regresiva, o fin de la pausa entre preguntas
+
+    def difundir(self, datos):
+        """Envía los mismos bytes a todos (jugadores y anfitrión)."""
+        enviar(self.anfitrion, datos)
+        for jugador in list(self.jugadores.values()):
+            enviar(jugador.escritor, datos)
+
+
+# CLASE: el servidor (todas las salas y los bancos cargados, compartidos entre salas)
+class ServidorJuego:
+    def __init__(self, bancos=None, rng=random, pausa=PAUSA_RESULTADO):
+        self.bancos = dict(bancos or {})  # {categoría: registros}, se cargan una sola vez
+        self.salas = {}  # {código: Sala}
+        self.rng = rng
+        self.pausa = pausa  # Segundos entre preguntas (0 en los benchmarks)
+        self.rueda = RuedaTemporizadores()  # Los tiempos de todas las salas
+        self.siguiente_jugador = 0
+
+    def banco(self, categoria):
+        if categoria not in self.bancos:
+            self.bancos[categoria] = leer_categoria(os.path.join(CARPETA_BANCOS, MAPA_ARCHIVOS[categoria]))
+        return self.bancos[categoria]
+
+    def codigo_nuevo(self):
+        while True:
+            codigo = "".join(self.rng.choices(string.ascii_uppercase, k=LARGO_CODIGO))
+            if codigo not in self.salas:
+                return codigo
+
+    async def atender(self, lector, escritor, primera=None):
+        """Una conexión: lee mensajes hasta que el cliente se va. primera: línea ya leída por otro proceso."""
+        sala = jugador = None  # A qué sala pertenece esta conexión (y como qué)
+        try:
+            while True:
+                try:
+                    linea, primera = primera or await lector.readline(), None
+                except (ValueError, ConnectionError):  # Línea demasiado larga o conexión cortada
+                    break
+                if not linea:
+                    break
+                try:
+                    datos = json.loads(linea)
+                    tipo = datos["tipo"]
+                except (ValueError, KeyError, TypeError):
+                    enviar(escritor, mensaje(tipo="error", mensaje="Mensaje inválido"))
+                    continue
+
+                if tipo == "responder" and jugador is not None:  # El caso más frecuente primero
+                    self.responder(sala, jugador, datos)
+                elif tipo == "crear" and sala is None:
+                    sala = self.crear_sala(datos.get("categoria"), escritor)
+                elif tipo == "unirse" and sala is None:
+                    sala, jugador = self.unirse(datos.get("sala"), str(datos.get("nombre") or "Jugador"), escritor)
+                elif tipo == "empezar" and sala is not None and jugador is None:
+                    self.empezar(sala)
+                else:
+                    enviar(escritor, mensaje(tipo="error", mensaje=f"No se puede '{tipo}' ahora"))
+        finally:
+            self.desconectar(sala, jugador)
+            escritor.close()
+
+    def crear_sala(self, categoria, escritor):
+        if type(categoria) is not str or (categoria not in MAPA_ARCHIVOS and categoria not in self.bancos):
+            enviar(escritor, mensaje(tipo="error", mensaje=f"Categoría desconocida: {categoria}"))
+            return None
+        try:
+            sesion = SesionQuiz(categoria, self.banco(categoria), NUMERO_PREGUNTAS, self.rng)
+        except ValueError as e:  # Menos de 10 preguntas
+            enviar(escritor, mensaje(tipo="error", mensaje=str(e)))
+            return None
+        sala = Sala(self.codigo_nuevo(), sesion, escritor)
+        self.salas[sala.codigo] = sala
+        enviar(escritor, mensaje(tipo="sala", sala=sala.codigo, categoria=categoria))
+        return sala
+
+    def unirse(self, codigo, nombre, escritor):
+        sala = self.salas.get(codigo) if type(codigo) is str else None  # Una lista o un objeto no se pueden buscar
+        if sala is None or sala.estado != "esperando":
+            enviar(escritor, mensaje(tipo="error", mensaje="La sala no existe o ya empezó"))
+            return None, None
+        self.siguiente_jugador += 1
+        jugador = Jugador(self.siguiente_jugador, nombre[:40], escritor)
+        sala.jugadores[jugador.numero] = jugador
+        enviar(escritor, mensaje(tipo="unido", sala=sala.codigo, jugador=jugador.numero))
+        enviar(sala.anfitrion, mensaje(tipo="jugadores", cantidad=len(sala.jugadores)))
+        return sala, jugador
+
+    def empezar(self, sala):
+        if sala.estado != "esperando":
+            return
+        sala.estado = "jugando"
+        self.abrir_pregunta(sala)
+
+    def responder(self, sala, jugador, datos):
+        """Acepta la respuesta si es para la pregunta abierta y es la primera del jugador en esa pregunta."""
+        numero = sala.sesion.indice
+        if not sala.abierta or datos.get("numero") != numero or jugador.ultima_respondida == numero:
+            enviar(jugador.escritor, mensaje(tipo="error", mensaje="Respuesta fuera de tiempo o repetida"))
+            return
+        opcion = datos.get("opcion")
+        jugador.ultima_respondida = numero
+        jugador.acerto = type(opcion) is int and es_correcta(sala.sesion.pregunta_actual(), opcion)
+        if jugador.acerto:
+            jugador.puntaje += 1
+        enviar(jugador.escritor, sala.confirmacion)
+        sala.respondieron.add(jugador.numero)
+        if len(sala.respondieron) >= len(sala.jugadores):
+            self.cerrar_pregunta(sala)  # Todos respondieron: no hace falta esperar los 15 segundos
+
+    def desconectar(self, sala, jugador):
+        if sala is None:
+            return
+        if jugador is None:  # Se fue el anfitrión: si la partida no empezó, la sala se cierra
+            if sala.estado == "esperando":
+                sala.estado = "terminada"
+                self.salas.pop(sala.codigo, None)
+                sala.difundir(mensaje(tipo="error", mensaje="El anfitrión cerró la sala"))
+                for otro in sala.jugadores.values():
+                    otro.escritor.close()
+            return
+        sala.jugadores.pop(jugador.numero, None)
+        sala.respondieron.discard(jugador.numero)  # Su respuesta ya no cuenta para cerrar la pregunta antes
+        if sala.estado == "esperando":
+            enviar(sala.anfitrion, mensaje(tipo="jugadores", cantidad=len(sala.jugadores)))
+        elif sala.abierta and len(sala.respondieron) >= len(sala.jugadores):
+            self.cerrar_pregunta(sala)  # Los que quedan ya respondieron
+
+    def abrir_pregunta(self, sala):
+        """Envía la pregunta actual a todos y arranca su cuenta regresiva."""
+        sesion = sala.sesion
+        q = sesion.pregunta_actual()
+        numero = sesion.indice
+        sala.respondieron = set()
+        sala.confirmacion = mensaje(tipo="recibida", numero=numero)
+        sala.abierta = True
+        sala.difundir(mensaje(tipo="pregunta", numero=numero, total=len(sesion.preguntas),
+                              pregunta=q.get("pregunta"), opciones=list(q.get("opciones") or ()),
+                              tiempo=TIEMPO_POR_PREGUNTA))  # Se codifica una vez para toda la sala
+        sala.temporizador = self.rueda.programar(1, self.descontar_segundo, sala)
+
+    def descontar_segundo(self, sala):
+        """Un tic de la cuenta regresiva (como actualizar_temporizador en quiz-app.py)."""
+        if sala.sesion.descontar_segundo():
+            self.cerrar_pregunta(sala)  # Tiempo agotado: los que no respondieron no suman
+        else:
+            sala.temporizador = self.rueda.programar(1, self.descontar_segundo, sala)
+
+    def cerrar_pregunta(self, sala):
+        """Deja de aceptar respuestas, manda los resultados y programa la próxima pregunta (o el final)."""
+        if not sala.abierta:
+            return
+        sala.abierta = False
+        self.rueda.cancelar(sala.temporizador)
+        sesion = sala.sesion
+        q = sesion.pregunta_actual()
+        numero = sesion.indice
+        correcta = q.get("indiceCorrecto", -1)
+        resultados = {}  # {(acertó, puntaje): mensaje}: a lo sumo 2 x 11 mensajes distintos para toda la sala
+        for jugador in list(sala.jugadores.values()):
+            clave = (jugador.ultima_respondida == numero and jugador.acerto, jugador.puntaje)
+            if clave not in resultados:
+                resultados[clave] = mensaje(tipo="resultado", numero=numero, correcta=correcta,
+                                            acertaste=clave[0], puntaje=clave[1])
+            enviar(jugador.escritor, resultados[clave])
+        enviar(sala.anfitrion, mensaje(tipo="resultado", numero=numero, correcta=correcta,
+                                       respuestas=len(sala.respondieron), jugadores=len(sala.jugadores)))
+        if sesion.siguiente():
+            sala.temporizador = self.rueda.programar(self.pausa, self.abrir_pregunta, sala)
+        else:
+            self.terminar(sala)
+
+    def terminar(self, sala):
+        sala.estado = "terminada"
+        sala.temporizador = None
+        self.salas.pop(sala.codigo, None)
+        ranking = sorted(sala.jugadores.values(), key=lambda j: (-j.puntaje, j.numero))[:TAMANO_RANKING]
+        ranking = [[j.nombre, j.puntaje] for j in ranking]
+        enviar(sala.anfitrion, mensaje(tipo="fin", ranking=ranking))
+        for jugador in list(sala.jugadores.values()):
+            enviar(jugador.escritor, mensaje(tipo="fin", ranking=ranking, puntaje=jugador.puntaje))
+
+    async def servir(self, host=HOST, puerto=PUERTO, listo=None, sock=None):
+        """
+        Acepta conexiones hasta que se cancele. listo(puerto) se llama cuando ya escucha.
+        sock: un socket que ya escucha (modo multiproceso); entonces host y puerto no se usan.
+        """
+        if sock is not None:
+            servidor = await asyncio.start_server(self.atender, sock=sock, limit=LIMITE_LINEA)
+        else:
+            servidor = await asyncio.start_server(self.atender, host, puerto, limit=LIMITE_LINEA, backlog=COLA_CONEXIONES)
+        reloj = asyncio.get_running_loop().create_task(self.rueda.correr())
+        try:
+            async with servidor:
+                if listo:
+                    listo(servidor.sockets[0].getsockname()[1])
+                await servidor.serve_forever()
+        finally:
+            reloj.cancel()
+
+
+# FUNCIÓN: carga todas las categorías (una vez, antes de aceptar jugadores)
+def cargar_bancos(mapa_archivos=MAPA_ARCHIVOS, base=CARPETA_BANCOS):
+    return {categoria: leer_categoria(os.path.join(base, archivo)) for categoria, archivo in mapa_archivos.items()}
+
+
+# === EJECUCIÓN DESDE LA LÍNEA DE COMANDOS ===
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Servidor multijugador de Respondidos para la red local.")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--puerto", type=int, default=PUERTO, help="0: uno libre cualquiera")
+    parser.add_argument("--trabajadores", type=int, default=1, help="procesos que atienden salas (0: uno por núcleo)")
+    parser.add_argument("--reparto", choices=("reuseport", "compartido"), default="reuseport",
+                        help="con varios trabajadores: un socket por proceso (SO_REUSEPORT) o uno heredado por todos")
+    parser.add_argument("--pausa", type=float, default=PAUSA_RESULTADO, help="segundos entre preguntas")
+    argumentos = parser.parse_args()
+
+    if argumentos.trabajadores != 1:
+        from salas_multiproceso import servir_multiproceso  # Solo en Linux/macOS (fork y pasaje de sockets)
+        raise SystemExit(servir_multiproceso(argumentos.trabajadores or os.cpu_count(), argumentos.host,
+                                             argumentos.puerto, argumentos.reparto, argumentos.pausa))
+    else:
+        juego = ServidorJuego(cargar_bancos(), pausa=argumentos.pausa)
+        try:
+            asyncio.run(juego.servir(argumentos.host, argumentos.puerto,
+                                     lambda puerto: print(f"Escuchando en {argumentos.host}:{puerto}", flush=True)))
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,120 @@
+"""
+RESPONDIDOS - MOTOR DEL QUIZ SIN INTERFAZ
+Una SesionQuiz es una partida: sus preguntas, la pregunta actual, el puntaje, el tiempo y las ayudas.
+No usa variables globales ni tkinter, así que en un mismo proceso pueden correr miles de partidas
+independientes (la ventana de quiz-app.py, un servidor, pruebas) sobre el mismo banco cargado.
+- El banco se comparte y no se modifica: la sesión guarda referencias a 10 de sus registros, no copias
+- Elegir las preguntas es random.sample (O(10)), no copiar y mezclar el banco entero
+- El tiempo no corre solo: quien maneja la sesión llama a descontar_segundo() una vez por segundo
+- __slots__: sin __dict__ por sesión (unos 150 bytes menos por partida)
+"""
+
+# IMPORTACIONES
+import random  # Para elegir las preguntas y las opciones que elimina la ayuda
+
+# REGLAS DE LA PARTIDA
+NUMERO_PREGUNTAS = 10  # Preguntas por quiz
+TIEMPO_POR_PREGUNTA = 15  # Segundos para responder cada pregunta
+AYUDAS_POR_QUIZ = 2  # Ayudas por quiz (una por pregunta como máximo)
+OPCIONES_ELIMINADAS = 2  # Opciones incorrectas que quita cada ayuda
+
+
+# FUNCIÓN: regla de puntaje: ¿la opción elegida es la correcta?
+def es_correcta(pregunta, indice_opcion):
+    """
+    indice_opcion es la posición en "opciones". Una pregunta inválida (indiceCorrecto -1) nunca suma.
+    La usan la sesión y el servidor multijugador, así las dos cuentan igual.
+    """
+    indice_correcto = pregunta.get("indiceCorrecto", -1)
+    return indice_correcto >= 0 and indice_opcion == indice_correcto  # Compara dos enteros
+
+
+# CLASE: una partida de quiz
+class SesionQuiz:
+    """
+    SesionQuiz(categoria, banco) elige las preguntas al azar; lanza ValueError si el banco
+    tiene menos de numero_preguntas. banco es cualquier secuencia de registros compilados
+    (lista, Preguntas compactas, la muestra de SQLite o de mmap) y nunca se modifica.
+    """
+
+    __slots__ = ("categoria", "preguntas", "indice", "puntaje", "tiempo_restante",
+                 "ayudas_restantes", "ayuda_usada", "respondida")
+
+    def __init__(self, categoria, banco, numero_preguntas=NUMERO_PREGUNTAS, rng=random):
+        if len(banco) < numero_preguntas:
+            raise ValueError(f"La categoría {categoria!r} tiene {len(banco)} preguntas; hacen falta {numero_preguntas}.")
+        self.categoria = categoria
+        self.preguntas = tuple(rng.sample(banco, numero_preguntas))  # Referencias a registros del banco, en orden al azar
+        self.indice = 0  # Pregunta que se está mostrando
+        self.puntaje = 0  # Respuestas correctas
+        self.tiempo_restante = TIEMPO_POR_PREGUNTA
+        self.ayudas_restantes = AYUDAS_POR_QUIZ
+        self.ayuda_usada = False  # ¿Ya usó una ayuda en esta pregunta?
+        self.respondida = False  # ¿Ya respondió (o se le acabó el tiempo) en esta pregunta?
+
+    def pregunta_actual(self):
+        """Registro de la pregunta actual, o None si ya terminaron."""
+        if self.indice < len(self.preguntas):
+            return self.preguntas[self.indice]
+        return None
+
+    def responder(self, indice_opcion):
+        """
+        indice_opcion es la posición en "opciones" (no la del botón). Suma 1 si es la correcta.
+        Devuelve True si es correcta. Una pregunta ya respondida o sin tiempo no vuelve a sumar.
+        """
+        q = self.pregunta_actual()
+        if q is None or self.respondida:
+            return False
+        self.respondida = True
+        correcto = es_correcta(q, indice_opcion)
+        if correcto:
+            self.puntaje += 1
+        return correcto
+
+    def descontar_segundo(self):
+        """Resta un segundo. Devuelve True cuando se acaba el tiempo (la pregunta cuenta como respondida)."""
+        if self.respondida:
+            return False
+        self.tiempo_restante -= 1
+        if self.tiempo_restante <= 0:
+            self.tiempo_restante = 0
+            self.respondida = True
+            return True
+        return False
+
+    def usar_ayuda(self, disponibles=None, rng=random):
+        """
+        Elige hasta OPCIONES_ELIMINADAS opciones incorrectas para eliminar y devuelve sus índices en "opciones".
+        disponibles: índices que todavía se pueden eliminar (por defecto, todas las opciones).
+        Devuelve [] si no quedan ayudas, ya usó una en esta pregunta o ya respondió.
+        """
+        q = self.pregunta_actual()
+        if q is None or self.respondida or self.ayudas_restantes <= 0 or self.ayuda_usada:
+            return []
+        self.ayudas_restantes -= 1
+        self.ayuda_usada = True
+        indice_correcto = q.get("indiceCorrecto", -1)
+        if disponibles is None:
+            disponibles = range(len(q.get("opciones") or ()))
+        incorrectas = [i for i in disponibles if i != indice_correcto]
+        return rng.sample(incorrectas, min(OPCIONES_ELIMINADAS, len(incorrectas)))
+
+    def siguiente(self):
+        """Pasa a la próxima pregunta con el tiempo y la ayuda de nuevo disponibles. True si quedan preguntas."""
+        self.indice += 1
+        self.tiempo_restante = TIEMPO_POR_PREGUNTA
+        self.ayuda_usada = False
+        self.respondida = False
+        return self.indice < len(self.preguntas)
+
+    def terminada(self):
+        return self.indice >= len(self.preguntas)
+
+    def resultados(self):
+        """(puntaje, total de preguntas)."""
+        return self.puntaje, len(self.preguntas)
+
+    def __repr__(self):
+        return (f"SesionQuiz({self.categoria!r}, pregunta {self.indice + 1}/{len(self.preguntas)}, "
+                f"puntaje {self.puntaje})")
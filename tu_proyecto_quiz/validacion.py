@@ -0,0 +1,89 @@
+"""
+RESPONDIDOS - REGLAS PARA VALIDAR PREGUNTAS NUEVAS
+Las usan el formulario de quiz-app.py, el importador masivo (importar.py) y el lint
+de los bancos (lint_bancos.py), así una pregunta se acepta o se rechaza por los mismos motivos.
+"""
+
+# IMPORTACIONES
+import re  # Para expresiones regulares
+
+# CONJUNTO para categorías prohibidas - búsqueda rápida O(1)
+CATEGORIAS_PROHIBIDAS = {"", "Seleccionar", "Ninguna", "Test", "Prueba"}  # Conjunto para validación rápida
+
+CANTIDAD_OPCIONES = 4  # Cada pregunta tiene 4 opciones
+
+
+# EXPRESIONES REGULARES precompiladas (el lint las aplica a millones de preguntas)
+PATRON_FINAL_PREGUNTA = re.compile(r'\?$')
+PATRON_URL = re.compile(r'\b(?:https?|ftp)://\S+', re.IGNORECASE)
+PATRON_TRES_PALABRAS = re.compile(r'\w+\W+\w+\W+\w')  # Tres palabras separadas (sin contar todas)
+
+
+# FUNCIÓN: todos los problemas de formato de un texto, como (código, mensaje)
+def problemas_formato(texto_pregunta):
+    """
+    Mismas reglas y mensajes que validar_formato_pregunta, pero devuelve todos los
+    problemas encontrados (lista vacía si el texto está bien). Los códigos sirven
+    para informes que lee otro programa (lint_bancos.py).
+    """
+    texto = texto_pregunta.strip()
+    problemas = []
+
+    # Validar longitud mínima
+    if len(texto) < 10:
+        problemas.append(("pregunta_corta", "La pregunta debe tener al menos 10 caracteres"))
+
+    # Validar que termine con signo de interrogación usando regex
+    if not PATRON_FINAL_PREGUNTA.search(texto):
+        problemas.append(("sin_signo_pregunta", "La pregunta debe terminar con signo de interrogación (?)"))
+
+    # Validar que no contenga URLs usando regex
+    if PATRON_URL.search(texto):
+        problemas.append(("contiene_url", "No se permiten enlaces URL en la pregunta"))
+
+    # Validar que tenga al menos 3 palabras usando regex
+    if not PATRON_TRES_PALABRAS.search(texto):
+        problemas.append(("pocas_palabras", "La pregunta debe tener al menos 3 palabras"))
+
+    return problemas
+
+
+# FUNCIÓN CON EXPRESIONES REGULARES para validación de preguntas
+def validar_formato_pregunta(texto_pregunta):
+    """
+    Valida el formato de una pregunta usando expresiones regulares.
+    Retorna (es_valido, mensaje_error)
+    """
+    problemas = problemas_formato(texto_pregunta)
+    if problemas:
+        return False, problemas[0][1]  # El primero, en el mismo orden de siempre
+    return True, "Pregunta válida"
+
+
+# FUNCIÓN: todas las reglas de una pregunta nueva, en el orden del formulario
+def validar_nueva_pregunta(categoria, pregunta, opciones, indice, categorias_validas):
+    """
+    opciones: lista de textos (ya sin espacios a los costados); indice: 0 a 3.
+    categorias_validas: nombres de categoría aceptados (por ejemplo MAPA_ARCHIVOS).
+    Retorna (es_valida, mensaje_error). No revisa duplicados: eso depende del banco.
+    """
+    es_valida, mensaje_error = validar_formato_pregunta(pregunta)
+    if not es_valida:
+        return False, mensaje_error
+
+    if categoria in CATEGORIAS_PROHIBIDAS:
+        return False, f"'{categoria}' no es un nombre de categoría permitido."
+
+    if len(opciones) != CANTIDAD_OPCIONES or any(not o for o in opciones):  # Si falta completar una opción
+        return False, "Completá las 4 opciones."
+
+    if len(set(opciones)) != len(opciones):  # Conjunto para detectar opciones repetidas
+        return False, "Las opciones no pueden repetirse."
+
+    if categoria not in categorias_validas:
+        return False, "Seleccioná una categoría válida."
+
+    if not isinstance(indice, int) or indice < 0 or indice >= CANTIDAD_OPCIONES:
+        return False, "Seleccioná la respuesta correcta."
+
+    return True, ""